@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 import subprocess
 from typing import Any, Dict, List, Literal, Optional, Sequence, Type, Union
@@ -17,6 +18,7 @@ from crewai.security import Fingerprint
 from crewai.task import Task
 from crewai.tools import BaseTool
 from crewai.tools.agent_tools.agent_tools import AgentTools
+from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.utilities import Converter, Prompts
 from crewai.utilities.agent_utils import (
     get_tool_names,
@@ -60,6 +62,7 @@ class Agent(BaseAgent):
             config: Dict representation of agent configuration.
             llm: The language model that will run the agent.
             function_calling_llm: The language model that will handle the tool calling for this agent, it overrides the crew function_calling_llm.
+            native_tool_calling: Whether to call tools through the LLM's native tool calling instead of the text ReAct format, when the LLM supports it.
             max_iter: Maximum number of iterations for an agent to execute a task.
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
             verbose: Whether the agent execution should be in verbose mode.
@@ -91,6 +94,10 @@ class Agent(BaseAgent):
     function_calling_llm: Optional[Union[str, InstanceOf[BaseLLM], Any]] = Field(
         description="Language model that will run the agent.", default=None
     )
+    native_tool_calling: bool = Field(
+        default=False,
+        description="Call tools through the LLM's native tool calling instead of the text ReAct format, when the LLM supports it.",
+    )
     system_template: Optional[str] = Field(
         default=None, description="System format for the agent."
     )
@@ -180,6 +187,11 @@ class Agent(BaseAgent):
 
         return self
 
+    def _copy_for_run(self) -> "Agent":
+        copied_agent = super()._copy_for_run()
+        copied_agent._times_executed = 0
+        return copied_agent
+
     def _setup_agent_executor(self):
         if not self.cache_handler:
             self.cache_handler = CacheHandler()
@@ -242,6 +254,94 @@ class Agent(BaseAgent):
             ValueError: If the max execution time is not a positive integer.
             RuntimeError: If the agent execution fails for other reasons.
         """
+        task_prompt = self._prepare_task_execution(task, context, tools)
+
+        try:
+            self._emit_execution_started(task, task_prompt)
+
+            # Determine execution method based on timeout setting
+            if self.max_execution_time is not None:
+                self._validate_max_execution_time()
+                result = self._execute_with_timeout(
+                    task_prompt, task, self.max_execution_time
+                )
+            else:
+                result = self._execute_without_timeout(task_prompt, task)
+
+        except TimeoutError as e:
+            # Propagate TimeoutError without retry
+            self._emit_execution_error(task, e)
+            raise e
+        except Exception as e:
+            self._handle_execution_error(task, e)
+            result = self.execute_task(task, context, tools)
+
+        return self._finalize_task_execution(task, result)
+
+    async def aexecute_task(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task with the agent without blocking the event loop.
+
+        The prompt is prepared (reasoning, memory and knowledge retrieval) in a
+        worker thread, then the agent executor loop is awaited natively.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+
+        Raises:
+            TimeoutError: If execution exceeds the maximum execution time.
+            ValueError: If the max execution time is not a positive integer.
+            RuntimeError: If the agent execution fails for other reasons.
+        """
+        task_prompt = await asyncio.to_thread(
+            self._prepare_task_execution, task, context, tools
+        )
+
+        try:
+            self._emit_execution_started(task, task_prompt)
+
+            if self.max_execution_time is not None:
+                self._validate_max_execution_time()
+                result = await self._aexecute_with_timeout(
+                    task_prompt, task, self.max_execution_time
+                )
+            else:
+                result = await self._aexecute_without_timeout(task_prompt, task)
+
+        except TimeoutError as e:
+            self._emit_execution_error(task, e)
+            raise e
+        except Exception as e:
+            self._handle_execution_error(task, e)
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._finalize_task_execution(task, result)
+
+    def _prepare_task_execution(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Build the task prompt and create the agent executor for a task.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            The prompt to send to the agent executor.
+        """
         if self.reasoning:
             try:
                 from crewai.utilities.reasoning_handler import (
@@ -377,69 +477,48 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
-        try:
-            crewai_event_bus.emit(
-                self,
-                event=AgentExecutionStartedEvent(
-                    agent=self,
-                    tools=self.tools,
-                    task_prompt=task_prompt,
-                    task=task,
-                ),
+        return task_prompt
+
+    def _validate_max_execution_time(self) -> None:
+        if not isinstance(self.max_execution_time, int) or self.max_execution_time <= 0:
+            raise ValueError(
+                "Max Execution time must be a positive integer greater than zero"
             )
 
-            # Determine execution method based on timeout setting
-            if self.max_execution_time is not None:
-                if (
-                    not isinstance(self.max_execution_time, int)
-                    or self.max_execution_time <= 0
-                ):
-                    raise ValueError(
-                        "Max Execution time must be a positive integer greater than zero"
-                    )
-                result = self._execute_with_timeout(
-                    task_prompt, task, self.max_execution_time
-                )
-            else:
-                result = self._execute_without_timeout(task_prompt, task)
+    def _emit_execution_started(self, task: Task, task_prompt: str) -> None:
+        crewai_event_bus.emit(
+            self,
+            event=AgentExecutionStartedEvent(
+                agent=self,
+                tools=self.tools,
+                task_prompt=task_prompt,
+                task=task,
+            ),
+        )
 
-        except TimeoutError as e:
-            # Propagate TimeoutError without retry
-            crewai_event_bus.emit(
-                self,
-                event=AgentExecutionErrorEvent(
-                    agent=self,
-                    task=task,
-                    error=str(e),
-                ),
-            )
-            raise e
-        except Exception as e:
-            if e.__class__.__module__.startswith("litellm"):
-                # Do not retry on litellm errors
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            result = self.execute_task(task, context, tools)
+    def _emit_execution_error(self, task: Task, error: Exception) -> None:
+        crewai_event_bus.emit(
+            self,
+            event=AgentExecutionErrorEvent(
+                agent=self,
+                task=task,
+                error=str(error),
+            ),
+        )
 
-        if self.max_rpm and self._rpm_controller:
+    def _handle_execution_error(self, task: Task, error: Exception) -> None:
+        """Re-raise errors that must not be retried, otherwise count the retry."""
+        if error.__class__.__module__.startswith("litellm"):
+            # Do not retry on litellm errors
+            self._emit_execution_error(task, error)
+            raise error
+        self._times_executed += 1
+        if self._times_executed > self.max_retry_limit:
+            self._emit_execution_error(task, error)
+            raise error
+
+    def _finalize_task_execution(self, task: Task, result: Any) -> Any:
+        if (self.max_rpm or self.max_tpm) and self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
         # If there was any tool in self.tools_results that had result_as_answer
@@ -497,14 +576,44 @@ class Agent(BaseAgent):
         Returns:
             The output of the agent.
         """
-        return self.agent_executor.invoke(
-            {
-                "input": task_prompt,
-                "tool_names": self.agent_executor.tools_names,
-                "tools": self.agent_executor.tools_description,
-                "ask_for_human_input": task.human_input,
-            }
-        )["output"]
+        return self.agent_executor.invoke(self._executor_inputs(task_prompt, task))[
+            "output"
+        ]
+
+    async def _aexecute_with_timeout(
+        self, task_prompt: str, task: Task, timeout: int
+    ) -> str:
+        """Async counterpart of `_execute_with_timeout`.
+
+        Raises:
+            TimeoutError: If execution exceeds the timeout.
+            RuntimeError: If execution fails for other reasons.
+        """
+        try:
+            return await asyncio.wait_for(
+                self._aexecute_without_timeout(task_prompt, task), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
+            )
+        except Exception as e:
+            raise RuntimeError(f"Task execution failed: {str(e)}")
+
+    async def _aexecute_without_timeout(self, task_prompt: str, task: Task) -> str:
+        """Async counterpart of `_execute_without_timeout`."""
+        result = await self.agent_executor.ainvoke(
+            self._executor_inputs(task_prompt, task)
+        )
+        return result["output"]
+
+    def _executor_inputs(self, task_prompt: str, task: Task) -> Dict[str, Any]:
+        return {
+            "input": task_prompt,
+            "tool_names": self.agent_executor.tools_names,
+            "tools": self.agent_executor.tools_description,
+            "ask_for_human_input": task.human_input,
+        }
 
     def create_agent_executor(
         self, tools: Optional[List[BaseTool]] = None, task=None
@@ -516,10 +625,12 @@ class Agent(BaseAgent):
         """
         raw_tools: List[BaseTool] = tools or self.tools or []
         parsed_tools = parse_tools(raw_tools)
+        native_tool_calling = self._uses_native_tool_calling(parsed_tools)
 
         prompt = Prompts(
             agent=self,
             has_tools=len(raw_tools) > 0,
+            native_tool_calling=native_tool_calling,
             i18n=self.i18n,
             use_system_prompt=self.use_system_prompt,
             system_template=self.system_template,
@@ -550,10 +661,28 @@ class Agent(BaseAgent):
             step_callback=self.step_callback,
             function_calling_llm=self.function_calling_llm,
             respect_context_window=self.respect_context_window,
+            native_tool_calling=native_tool_calling,
             request_within_rpm_limit=(
                 self._rpm_controller.check_or_wait if self._rpm_controller else None
             ),
-            callbacks=[TokenCalcHandler(self._token_process)],
+            arequest_within_rpm_limit=(
+                self._rpm_controller.acheck_or_wait if self._rpm_controller else None
+            ),
+            callbacks=[TokenCalcHandler(self._token_process, self._rpm_controller)],
+        )
+
+    def _uses_native_tool_calling(self, tools: List[CrewStructuredTool]) -> bool:
+        """Whether tools can be called through the LLM's native tool calling.
+
+        Streaming responses are excluded, as their tool calls are executed by
+        the LLM itself.
+        """
+        return (
+            self.native_tool_calling
+            and bool(tools)
+            and isinstance(self.llm, BaseLLM)
+            and not getattr(self.llm, "stream", False)
+            and self.llm.supports_function_calling()
         )
 
     def get_delegation_tools(self, agents: List[BaseAgent]):
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy as shallow_copy
@@ -43,6 +44,8 @@ class BaseAgent(ABC, BaseModel):
         config (Optional[Dict[str, Any]]): Configuration for the agent.
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (Optional[int]): Maximum number of requests per minute for the agent execution.
+        max_tpm (Optional[int]): Maximum number of LLM tokens per minute for the agent execution.
+        rate_limit_key (Optional[str]): Key under which rate limits are shared with other agents and crews.
         allow_delegation (bool): Allow delegation of tasks to agents.
         tools (Optional[List[Any]]): Tools at the agent's disposal.
         max_iter (int): Maximum iterations for an agent to execute a task.
@@ -104,6 +107,14 @@ class BaseAgent(ABC, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the agent execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the agent execution to be respected.",
+    )
+    rate_limit_key: Optional[str] = Field(
+        default=None,
+        description="Agents and crews with the same key (e.g. one per provider API key) share their rate limits.",
+    )
     allow_delegation: bool = Field(
         default=False,
         description="Enable agent to delegate and ask questions among each other.",
@@ -206,10 +217,8 @@ class BaseAgent(ABC, BaseModel):
 
         # Set private attributes
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
-            self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
-            )
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
+            self._rpm_controller = self._create_rpm_controller()
         if not self._token_process:
             self._token_process = TokenProcess()
 
@@ -231,14 +240,20 @@ class BaseAgent(ABC, BaseModel):
     def set_private_attrs(self):
         """Set private attributes."""
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
-            self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
-            )
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
+            self._rpm_controller = self._create_rpm_controller()
         if not self._token_process:
             self._token_process = TokenProcess()
         return self
 
+    def _create_rpm_controller(self) -> RPMController:
+        return RPMController(
+            max_rpm=self.max_rpm,
+            max_tpm=self.max_tpm,
+            limit_key=self.rate_limit_key,
+            logger=self._logger,
+        )
+
     @property
     def key(self):
         source = [
@@ -257,6 +272,19 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task without blocking the event loop.
+
+        Agents without a native async implementation run `execute_task` in a
+        worker thread.
+        """
+        return await asyncio.to_thread(self.execute_task, task, context, tools)
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -320,6 +348,32 @@ class BaseAgent(ABC, BaseModel):
 
         return copied_agent
 
+    def _copy_for_run(self: T) -> T:
+        """Create a copy-on-write clone of the agent for a separate run.
+
+        Configuration, the LLM, tools and knowledge are shared with the
+        original, while per-run state (executor, token usage, rpm controller,
+        tool results and crew binding) starts fresh. Validators are not re-run.
+        """
+        copied_agent = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "crew": None,
+                "agent_executor": None,
+                "tools": list(self.tools) if self.tools is not None else None,
+                "tools_results": [],
+                "tools_handler": ToolsHandler(
+                    cache=self.cache_handler if self.cache else None
+                ),
+            }
+        )
+        copied_agent._token_process = TokenProcess()
+        copied_agent._request_within_rpm_limit = None
+        copied_agent._rpm_controller = (
+            self._create_rpm_controller() if self.max_rpm or self.max_tpm else None
+        )
+        return copied_agent
+
     def interpolate_inputs(self, inputs: Dict[str, Any]) -> None:
         """Interpolate inputs into the agent description and backstory."""
         if self._original_role is None:
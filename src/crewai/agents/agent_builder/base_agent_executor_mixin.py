@@ -1,8 +1,11 @@
+import asyncio
 import time
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
 from crewai.utilities import I18N
 from crewai.utilities.converter import ConverterError
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
@@ -11,6 +14,7 @@ from crewai.utilities.printer import Printer
 if TYPE_CHECKING:
     from crewai.agents.agent_builder.base_agent import BaseAgent
     from crewai.crew import Crew
+    from crewai.memory.memory_write_pipeline import MemoryWritePipeline
     from crewai.task import Task
 
 
@@ -25,27 +29,32 @@ class CrewAgentExecutorMixin:
 
     def _create_short_term_memory(self, output) -> None:
         """Create and save a short-term memory item if conditions are met."""
+        item = self._build_short_term_memory_item(output)
+        if item is not None and self.crew._short_term_memory:
+            try:
+                self.crew._short_term_memory.save(
+                    value=item.data, metadata=item.metadata, agent=item.agent
+                )
+            except Exception as e:
+                print(f"Failed to add to short term memory: {e}")
+                pass
+
+    def _build_short_term_memory_item(self, output) -> Optional[ShortTermMemoryItem]:
         if (
             self.crew
             and self.agent
             and self.task
             and "Action: Delegate work to coworker" not in output.text
+            and getattr(self.crew, "_short_term_memory", None)
         ):
-            try:
-                if (
-                    hasattr(self.crew, "_short_term_memory")
-                    and self.crew._short_term_memory
-                ):
-                    self.crew._short_term_memory.save(
-                        value=output.text,
-                        metadata={
-                            "observation": self.task.description,
-                        },
-                        agent=self.agent.role,
-                    )
-            except Exception as e:
-                print(f"Failed to add to short term memory: {e}")
-                pass
+            return ShortTermMemoryItem(
+                data=output.text,
+                metadata={
+                    "observation": self.task.description,
+                },
+                agent=self.agent.role,
+            )
+        return None
 
     def _create_external_memory(self, output) -> None:
         """Create and save a external-term memory item if conditions are met."""
@@ -70,6 +79,15 @@ class CrewAgentExecutorMixin:
 
     def _create_long_term_memory(self, output) -> None:
         """Create and save long-term and entity memory items based on evaluation."""
+        entity_items = self._save_long_term_memory(output)
+        if entity_items and self.crew._entity_memory:
+            try:
+                self.crew._entity_memory.save_many(entity_items)
+            except Exception as e:
+                print(f"Failed to add to long term memory: {e}")
+
+    def _save_long_term_memory(self, output) -> List[EntityMemoryItem]:
+        """Evaluate the task, save the long-term memory item and return the entities to save."""
         if (
             self.crew
             and self.crew._long_term_memory
@@ -82,7 +100,7 @@ class CrewAgentExecutorMixin:
                 evaluation = ltm_agent.evaluate(self.task, output.text)
 
                 if isinstance(evaluation, ConverterError):
-                    return
+                    return []
 
                 long_term_memory = LongTermMemoryItem(
                     task=self.task.description,
@@ -97,8 +115,8 @@ class CrewAgentExecutorMixin:
                 )
                 self.crew._long_term_memory.save(long_term_memory)
 
-                for entity in evaluation.entities:
-                    entity_memory = EntityMemoryItem(
+                return [
+                    EntityMemoryItem(
                         name=entity.name,
                         type=entity.type,
                         description=entity.description,
@@ -106,7 +124,8 @@ class CrewAgentExecutorMixin:
                             [f"- {r}" for r in entity.relationships]
                         ),
                     )
-                    self.crew._entity_memory.save(entity_memory)
+                    for entity in evaluation.entities
+                ]
             except AttributeError as e:
                 print(f"Missing attributes for long term memory: {e}")
                 pass
@@ -122,6 +141,50 @@ class CrewAgentExecutorMixin:
                 content="Long term memory is enabled, but entity memory is not enabled. Please configure entity memory or set memory=True to automatically enable it.",
                 color="bold_yellow",
             )
+        return []
+
+    def _create_memories(self, output) -> None:
+        """Save short-term, long-term and external memories for the task output.
+
+        When the crew has `memory_write_behind` enabled the writes are queued
+        on its memory pipeline and this returns right away.
+        """
+        pipeline = self._get_memory_pipeline()
+        if pipeline is None:
+            self._create_short_term_memory(output)
+            self._create_long_term_memory(output)
+            self._create_external_memory(output)
+            return
+
+        short_term_memory = self.crew._short_term_memory
+        entity_memory = self.crew._entity_memory
+        short_term_item = self._build_short_term_memory_item(output)
+        if short_term_item is not None:
+            pipeline.submit(lambda: [(short_term_memory, short_term_item)])
+        pipeline.submit(
+            lambda: [
+                (entity_memory, item) for item in self._save_long_term_memory(output)
+            ]
+        )
+        pipeline.submit(partial(self._create_external_memory, output))
+
+    def _get_memory_pipeline(self) -> Optional["MemoryWritePipeline"]:
+        if self.crew and getattr(self.crew, "memory_write_behind", False):
+            return self.crew._get_memory_pipeline()
+        return None
+
+    async def _acreate_memories(self, output) -> None:
+        """Save short-term, long-term and external memories off the event loop."""
+        if self._get_memory_pipeline() is not None:
+            # Queueing only blocks while the pipeline is full
+            await asyncio.to_thread(self._create_memories, output)
+            return
+
+        await asyncio.gather(
+            asyncio.to_thread(self._create_short_term_memory, output),
+            asyncio.to_thread(self._create_long_term_memory, output),
+            asyncio.to_thread(self._create_external_memory, output),
+        )
 
     def _ask_human_input(self, final_answer: str) -> str:
         """Prompt human input with mode-appropriate messaging."""
@@ -1,3 +1,4 @@
 from .cache_handler import CacheHandler
+from .cache_storage import BaseCacheStorage, SQLiteCacheStorage
 
-__all__ = ["CacheHandler"]
+__all__ = ["CacheHandler", "BaseCacheStorage", "SQLiteCacheStorage"]
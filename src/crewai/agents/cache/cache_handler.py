@@ -1,15 +1,154 @@
-from typing import Any, Dict, Optional
+import ast
+import json
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, InstanceOf, PrivateAttr
+
+from crewai.agents.cache.cache_storage import BaseCacheStorage
 
 
 class CacheHandler(BaseModel):
-    """Callback handler for tool usage."""
+    """Callback handler for tool usage.
+
+    Results are kept in an in-memory LRU map keyed on the tool name and its
+    canonicalized input, so JSON inputs with reordered keys still hit. The map
+    can be bounded by entry count, approximate size in bytes and age, and an
+    optional storage backend keeps results across runs and processes.
+    """
 
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    max_entries: Optional[int] = Field(
+        default=None, gt=0, description="Maximum number of cached tool results."
+    )
+    max_bytes: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Approximate maximum size of the cached tool results in bytes.",
+    )
+    ttl: Optional[float] = Field(
+        default=None, gt=0, description="Seconds a cached tool result stays valid."
+    )
+    storage: Optional[InstanceOf[BaseCacheStorage]] = Field(
+        default=None,
+        description="Persistent backend consulted on in-memory misses, e.g. SQLiteCacheStorage.",
+    )
+
+    _cache: "OrderedDict[str, Any]" = PrivateAttr(default_factory=OrderedDict)
+    _entries: Dict[str, Tuple[Optional[float], int]] = PrivateAttr(default_factory=dict)
+    _size: int = PrivateAttr(default=0)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+    _lock: Any = PrivateAttr(default_factory=threading.RLock)
 
     def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+        key = self._make_key(tool, input)
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._store(key, output, expires_at)
+        if self.storage:
+            self.storage.save(key, output, expires_at)
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        key = self._make_key(tool, input)
+        with self._lock:
+            if key in self._cache:
+                expires_at, _ = self._entries[key]
+                if expires_at is None or expires_at > time.time():
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return self._cache[key]
+                self._remove(key)
+
+        stored = self.storage.load(key) if self.storage else None
+        with self._lock:
+            if stored is None:
+                self._misses += 1
+                return None
+            output, expires_at = stored
+            self._store(key, output, expires_at)
+            self._hits += 1
+            return output
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current in-memory footprint."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._cache),
+                "bytes": self._size,
+            }
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _store(self, key: str, output: Any, expires_at: Optional[float]) -> None:
+        if key in self._cache:
+            self._remove(key)
+        size = len(key.encode()) + self._estimate_size(output)
+        self._cache[key] = output
+        self._entries[key] = (expires_at, size)
+        self._size += size
+        self._evict()
+
+    def _remove(self, key: str) -> None:
+        del self._cache[key]
+        _, size = self._entries.pop(key)
+        self._size -= size
+
+    def _evict(self) -> None:
+        while self._cache and (
+            (self.max_entries is not None and len(self._cache) > self.max_entries)
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            self._remove(next(iter(self._cache)))
+
+    @staticmethod
+    def _make_key(tool: Any, input: Any) -> str:
+        return f"{tool}-{_canonicalize(input)}"
+
+    @staticmethod
+    def _estimate_size(output: Any) -> int:
+        if isinstance(output, str):
+            return len(output.encode())
+        try:
+            return len(json.dumps(output, default=str).encode())
+        except (TypeError, ValueError):
+            return len(repr(output).encode())
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "CacheHandler":
+        # Locks cannot be copied; the copy gets its own and shares the storage.
+        copied = self.model_copy()
+        with self._lock:
+            copied._cache = deepcopy(self._cache, memo)
+            copied._entries = dict(self._entries)
+        copied._lock = threading.RLock()
+        return copied
+
+
+def _canonicalize(input: Any) -> str:
+    """Render tool input so that equivalent JSON values produce the same key."""
+    value = input
+    if isinstance(input, str):
+        stripped = input.strip()
+        if not stripped.startswith(("{", "[")):
+            return input
+        try:
+            value = json.loads(stripped)
+        except ValueError:
+            try:
+                value = ast.literal_eval(stripped)
+            except (ValueError, SyntaxError):
+                return input
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return str(value)
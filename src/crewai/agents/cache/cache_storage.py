@@ -0,0 +1,122 @@
+import json
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+from crewai.utilities.paths import db_storage_path
+
+logger = logging.getLogger(__name__)
+
+
+class BaseCacheStorage(ABC):
+    """Persistent backend for `CacheHandler` entries."""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """Return `(output, expires_at)` for a live entry, or None on a miss."""
+
+    @abstractmethod
+    def save(self, key: str, output: Any, expires_at: Optional[float]) -> None:
+        """Store an entry, replacing any previous value for the key."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Remove every entry."""
+
+
+class SQLiteCacheStorage(BaseCacheStorage):
+    """SQLite backend for tool results, shared by every process using the file.
+
+    Outputs are stored as JSON; results that cannot be serialized stay in the
+    in-memory cache only.
+    """
+
+    def __init__(
+        self, db_path: Optional[str] = None, max_entries: Optional[int] = None
+    ) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "tool_cache.db")
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tool_cache (
+                        key TEXT PRIMARY KEY,
+                        output JSON,
+                        expires_at REAL,
+                        accessed_at REAL
+                    )
+                    """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def load(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT output, expires_at FROM tool_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                output, expires_at = row
+                if expires_at is not None and expires_at <= now:
+                    conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                    return None
+                conn.execute(
+                    "UPDATE tool_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                return json.loads(output), expires_at
+        except sqlite3.Error as e:
+            logger.error(DatabaseError.format_error(DatabaseError.LOAD_ERROR, e))
+            return None
+
+    def save(self, key: str, output: Any, expires_at: Optional[float]) -> None:
+        try:
+            serialized = json.dumps(output)
+        except (TypeError, ValueError):
+            return
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO tool_cache (key, output, expires_at, accessed_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (key, serialized, expires_at, time.time()),
+                )
+                if self.max_entries:
+                    conn.execute(
+                        """
+                        DELETE FROM tool_cache WHERE key NOT IN (
+                            SELECT key FROM tool_cache ORDER BY accessed_at DESC LIMIT ?
+                        )
+                        """,
+                        (self.max_entries,),
+                    )
+        except sqlite3.Error as e:
+            logger.error(DatabaseError.format_error(DatabaseError.SAVE_ERROR, e))
+
+    def reset(self) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM tool_cache")
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
@@ -1,4 +1,6 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.agent_builder.base_agent_executor_mixin import CrewAgentExecutorMixin
@@ -14,9 +16,15 @@ from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_types import ToolResult
 from crewai.utilities import I18N, Printer
 from crewai.utilities.agent_utils import (
+    aenforce_rpm_limit,
+    aget_llm_response,
+    aget_llm_tool_calls,
+    ahandle_max_iterations_exceeded,
     enforce_rpm_limit,
+    format_answer,
     format_message_for_llm,
     get_llm_response,
+    get_llm_tool_calls,
     handle_agent_action_core,
     handle_context_length,
     handle_max_iterations_exceeded,
@@ -25,11 +33,15 @@ from crewai.utilities.agent_utils import (
     has_reached_max_iterations,
     is_context_length_exceeded,
     process_llm_response,
+    render_function_schemas,
     show_agent_logs,
 )
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
 from crewai.utilities.logger import Logger
-from crewai.utilities.tool_utils import execute_tool_and_check_finality
+from crewai.utilities.tool_utils import (
+    aexecute_tool_and_check_finality,
+    execute_tool_and_check_finality,
+)
 from crewai.utilities.training_handler import CrewTrainingHandler
 
 
@@ -53,7 +65,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         original_tools: List[Any] = [],
         function_calling_llm: Any = None,
         respect_context_window: bool = False,
+        native_tool_calling: bool = False,
         request_within_rpm_limit: Optional[Callable[[], bool]] = None,
+        arequest_within_rpm_limit: Optional[Callable[[], Awaitable[bool]]] = None,
         callbacks: List[Any] = [],
     ):
         self._i18n: I18N = I18N()
@@ -75,7 +89,14 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.tools_description = tools_description
         self.function_calling_llm = function_calling_llm
         self.respect_context_window = respect_context_window
+        self.native_tool_calling = native_tool_calling
+        # Function schemas sent to the LLM in native tool calling mode, and the
+        # tool name behind each function name
+        self.tool_schemas, self.function_tool_names = (
+            render_function_schemas(self.tools) if native_tool_calling else ([], {})
+        )
         self.request_within_rpm_limit = request_within_rpm_limit
+        self.arequest_within_rpm_limit = arequest_within_rpm_limit
         self.ask_for_human_input = False
         self.messages: List[Dict[str, str]] = []
         self.iterations = 0
@@ -93,14 +114,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         )
 
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
-        if "system" in self.prompt:
-            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
-            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
-            self.messages.append(format_message_for_llm(system_prompt, role="system"))
-            self.messages.append(format_message_for_llm(user_prompt))
-        else:
-            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
-            self.messages.append(format_message_for_llm(user_prompt))
+        self._setup_messages(inputs)
 
         self._show_start_logs()
 
@@ -125,16 +139,61 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         if self.ask_for_human_input:
             formatted_answer = self._handle_human_feedback(formatted_answer)
 
-        self._create_short_term_memory(formatted_answer)
-        self._create_long_term_memory(formatted_answer)
-        self._create_external_memory(formatted_answer)
+        self._create_memories(formatted_answer)
+        return {"output": formatted_answer.output}
+
+    async def ainvoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
+        """Async counterpart of `invoke`.
+
+        The LLM and the tools are awaited and the memory writes run off the
+        event loop, so many executors can share a single loop.
+        """
+        self._setup_messages(inputs)
+
+        self._show_start_logs()
+
+        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+
+        try:
+            formatted_answer = await self._ainvoke_loop()
+        except AssertionError:
+            self._printer.print(
+                content="Agent failed to reach a final answer. This is likely a bug - please report it.",
+                color="red",
+            )
+            raise
+        except Exception as e:
+            handle_unknown_error(self._printer, e)
+            raise e
+
+        if self.ask_for_human_input:
+            # Human feedback blocks on input(), keep it off the event loop
+            formatted_answer = await asyncio.to_thread(
+                self._handle_human_feedback, formatted_answer
+            )
+
+        await self._acreate_memories(formatted_answer)
         return {"output": formatted_answer.output}
 
+    def _setup_messages(self, inputs: Dict[str, str]) -> None:
+        """Build the initial system and user messages from the prompt."""
+        if "system" in self.prompt:
+            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
+            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
+            self.messages.append(format_message_for_llm(system_prompt, role="system"))
+            self.messages.append(format_message_for_llm(user_prompt))
+        else:
+            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
+            self.messages.append(format_message_for_llm(user_prompt))
+
     def _invoke_loop(self) -> AgentFinish:
         """
         Main loop to invoke the agent's thought process until it reaches a conclusion
         or the maximum number of iterations is reached.
         """
+        if self.native_tool_calling:
+            return self._invoke_native_loop()
+
         formatted_answer = None
         while not isinstance(formatted_answer, AgentFinish):
             try:
@@ -159,30 +218,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                 formatted_answer = process_llm_response(answer, self.use_stop_words)
 
                 if isinstance(formatted_answer, AgentAction):
-                    # Extract agent fingerprint if available
-                    fingerprint_context = {}
-                    if (
-                        self.agent
-                        and hasattr(self.agent, "security_config")
-                        and hasattr(self.agent.security_config, "fingerprint")
-                    ):
-                        fingerprint_context = {
-                            "agent_fingerprint": str(
-                                self.agent.security_config.fingerprint
-                            )
-                        }
-
                     tool_result = execute_tool_and_check_finality(
                         agent_action=formatted_answer,
-                        fingerprint_context=fingerprint_context,
-                        tools=self.tools,
-                        i18n=self._i18n,
-                        agent_key=self.agent.key if self.agent else None,
-                        agent_role=self.agent.role if self.agent else None,
-                        tools_handler=self.tools_handler,
-                        task=self.task,
-                        agent=self.agent,
-                        function_calling_llm=self.function_calling_llm,
+                        **self._tool_execution_kwargs(),
                     )
                     formatted_answer = self._handle_agent_action(
                         formatted_answer, tool_result
@@ -228,17 +266,359 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
-    def _handle_agent_action(
-        self, formatted_answer: AgentAction, tool_result: ToolResult
+    async def _ainvoke_loop(self) -> AgentFinish:
+        """
+        Async counterpart of `_invoke_loop` that awaits the LLM and the tools
+        instead of blocking the calling thread.
+        """
+        if self.native_tool_calling:
+            return await self._ainvoke_native_loop()
+
+        formatted_answer = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                if has_reached_max_iterations(self.iterations, self.max_iter):
+                    formatted_answer = await ahandle_max_iterations_exceeded(
+                        formatted_answer,
+                        printer=self._printer,
+                        i18n=self._i18n,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                    )
+
+                await aenforce_rpm_limit(
+                    self.request_within_rpm_limit, self.arequest_within_rpm_limit
+                )
+
+                answer = await aget_llm_response(
+                    llm=self.llm,
+                    messages=self.messages,
+                    callbacks=self.callbacks,
+                    printer=self._printer,
+                )
+                formatted_answer = process_llm_response(answer, self.use_stop_words)
+
+                if isinstance(formatted_answer, AgentAction):
+                    tool_result = await aexecute_tool_and_check_finality(
+                        agent_action=formatted_answer,
+                        **self._tool_execution_kwargs(),
+                    )
+                    if not self._is_add_image_action(formatted_answer):
+                        await self._ainvoke_step_callback(tool_result)
+                    formatted_answer = self._handle_agent_action(
+                        formatted_answer, tool_result, notify_step=False
+                    )
+
+                await self._ainvoke_step_callback(formatted_answer)
+                self._append_message(formatted_answer.text, role="assistant")
+
+            except OutputParserException as e:
+                formatted_answer = handle_output_parser_exception(
+                    e=e,
+                    messages=self.messages,
+                    iterations=self.iterations,
+                    log_error_after=self.log_error_after,
+                    printer=self._printer,
+                )
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if is_context_length_exceeded(e):
+                    # Summarization makes several blocking LLM calls
+                    await asyncio.to_thread(
+                        handle_context_length,
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                    )
+                    continue
+                else:
+                    handle_unknown_error(self._printer, e)
+                    raise e
+            finally:
+                self.iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
+    def _invoke_native_loop(self) -> AgentFinish:
+        """
+        Variant of `_invoke_loop` for LLMs with native tool calling.
+
+        Tool schemas are sent with every call and the tool calls the LLM returns
+        are executed directly, so responses never have to be parsed for actions.
+        Any response without tool calls is the final answer.
+        """
+        formatted_answer: Union[AgentAction, AgentFinish, None] = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                if has_reached_max_iterations(self.iterations, self.max_iter):
+                    formatted_answer = self._forced_final_answer(
+                        handle_max_iterations_exceeded(
+                            formatted_answer,
+                            printer=self._printer,
+                            i18n=self._i18n,
+                            messages=self.messages,
+                            llm=self.llm,
+                            callbacks=self.callbacks,
+                        )
+                    )
+                    break
+
+                enforce_rpm_limit(self.request_within_rpm_limit)
+
+                answer = get_llm_tool_calls(
+                    llm=self.llm,
+                    messages=self.messages,
+                    tools=self.tool_schemas,
+                    callbacks=self.callbacks,
+                    printer=self._printer,
+                )
+
+                if isinstance(answer, str):
+                    formatted_answer = self._native_final_answer(answer)
+                else:
+                    self._append_tool_calls_message(answer)
+                    for tool_call in answer:
+                        agent_action = self._native_agent_action(tool_call)
+                        tool_result = execute_tool_and_check_finality(
+                            agent_action=agent_action,
+                            **self._tool_execution_kwargs(),
+                        )
+                        formatted_answer = self._handle_native_tool_result(
+                            tool_call, agent_action, tool_result
+                        )
+                        if isinstance(formatted_answer, AgentFinish):
+                            break
+
+                self._invoke_step_callback(formatted_answer)
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if is_context_length_exceeded(e):
+                    handle_context_length(
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                    )
+                    continue
+                else:
+                    handle_unknown_error(self._printer, e)
+                    raise e
+            finally:
+                self.iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
+    async def _ainvoke_native_loop(self) -> AgentFinish:
+        """
+        Async counterpart of `_invoke_native_loop`.
+        """
+        formatted_answer: Union[AgentAction, AgentFinish, None] = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                if has_reached_max_iterations(self.iterations, self.max_iter):
+                    formatted_answer = self._forced_final_answer(
+                        await ahandle_max_iterations_exceeded(
+                            formatted_answer,
+                            printer=self._printer,
+                            i18n=self._i18n,
+                            messages=self.messages,
+                            llm=self.llm,
+                            callbacks=self.callbacks,
+                        )
+                    )
+                    break
+
+                await aenforce_rpm_limit(
+                    self.request_within_rpm_limit, self.arequest_within_rpm_limit
+                )
+
+                answer = await aget_llm_tool_calls(
+                    llm=self.llm,
+                    messages=self.messages,
+                    tools=self.tool_schemas,
+                    callbacks=self.callbacks,
+                    printer=self._printer,
+                )
+
+                if isinstance(answer, str):
+                    formatted_answer = self._native_final_answer(answer)
+                else:
+                    self._append_tool_calls_message(answer)
+                    for tool_call in answer:
+                        agent_action = self._native_agent_action(tool_call)
+                        tool_result = await aexecute_tool_and_check_finality(
+                            agent_action=agent_action,
+                            **self._tool_execution_kwargs(),
+                        )
+                        await self._ainvoke_step_callback(tool_result)
+                        formatted_answer = self._handle_native_tool_result(
+                            tool_call, agent_action, tool_result, notify_step=False
+                        )
+                        if isinstance(formatted_answer, AgentFinish):
+                            break
+
+                await self._ainvoke_step_callback(formatted_answer)
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if is_context_length_exceeded(e):
+                    # Summarization makes several blocking LLM calls
+                    await asyncio.to_thread(
+                        handle_context_length,
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                    )
+                    continue
+                else:
+                    handle_unknown_error(self._printer, e)
+                    raise e
+            finally:
+                self.iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
+    def _native_final_answer(self, answer: str) -> AgentFinish:
+        """Turn a response without tool calls into the final answer."""
+        self._append_message(answer, role="assistant")
+        if "Final Answer:" in answer:
+            return self._forced_final_answer(format_answer(answer))
+        return AgentFinish(thought="", output=answer.strip(), text=answer)
+
+    @staticmethod
+    def _forced_final_answer(
+        formatted_answer: Union[AgentAction, AgentFinish],
+    ) -> AgentFinish:
+        """Treat a text answer as final, even if it reads like a ReAct action."""
+        if isinstance(formatted_answer, AgentFinish):
+            return formatted_answer
+        return AgentFinish(
+            thought=formatted_answer.thought,
+            output=formatted_answer.text,
+            text=formatted_answer.text,
+        )
+
+    def _append_tool_calls_message(self, tool_calls: List[Any]) -> None:
+        """Record the tool calls requested by the LLM in the conversation."""
+        self.messages.append(
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [  # type: ignore[dict-item]
+                    {
+                        "id": tool_call.id,
+                        "type": "function",
+                        "function": {
+                            "name": tool_call.function.name,
+                            "arguments": tool_call.function.arguments,
+                        },
+                    }
+                    for tool_call in tool_calls
+                ],
+            }
+        )
+
+    def _native_agent_action(self, tool_call: Any) -> AgentAction:
+        """Express a native tool call as the action the tool helpers execute."""
+        function_name = tool_call.function.name
+        tool_name = self.function_tool_names.get(function_name, function_name)
+        tool_input = tool_call.function.arguments or "{}"
+        return AgentAction(
+            thought="",
+            tool=tool_name,
+            tool_input=tool_input,
+            text=f"Action: {tool_name}\nAction Input: {tool_input}",
+        )
+
+    def _handle_native_tool_result(
+        self,
+        tool_call: Any,
+        agent_action: AgentAction,
+        tool_result: ToolResult,
+        notify_step: bool = True,
     ) -> Union[AgentAction, AgentFinish]:
-        """Handle the AgentAction, execute tools, and process the results."""
-        # Special case for add_image_tool
-        add_image_tool = self._i18n.tools("add_image")
+        """Answer a tool call with the tool's result.
+
+        The async loop awaits the step callback itself and passes
+        `notify_step=False`.
+        """
+        formatted_answer = handle_agent_action_core(
+            formatted_answer=agent_action,
+            tool_result=tool_result,
+            step_callback=self.step_callback if notify_step else None,
+            show_logs=self._show_logs,
+        )
+        self.messages.append(
+            {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "name": tool_call.function.name,
+                "content": str(tool_result.result),
+            }
+        )
+        return formatted_answer
+
+    def _tool_execution_kwargs(self) -> Dict[str, Any]:
+        """Arguments shared by the sync and async tool execution helpers."""
+        # Extract agent fingerprint if available
+        fingerprint_context = {}
         if (
-            isinstance(add_image_tool, dict)
-            and formatted_answer.tool.casefold().strip()
-            == add_image_tool.get("name", "").casefold().strip()
+            self.agent
+            and hasattr(self.agent, "security_config")
+            and hasattr(self.agent.security_config, "fingerprint")
         ):
+            fingerprint_context = {
+                "agent_fingerprint": str(self.agent.security_config.fingerprint)
+            }
+
+        return {
+            "fingerprint_context": fingerprint_context,
+            "tools": self.tools,
+            "i18n": self._i18n,
+            "agent_key": self.agent.key if self.agent else None,
+            "agent_role": self.agent.role if self.agent else None,
+            "tools_handler": self.tools_handler,
+            "task": self.task,
+            "agent": self.agent,
+            "function_calling_llm": self.function_calling_llm,
+        }
+
+    def _handle_agent_action(
+        self,
+        formatted_answer: AgentAction,
+        tool_result: ToolResult,
+        notify_step: bool = True,
+    ) -> Union[AgentAction, AgentFinish]:
+        """Handle the AgentAction, execute tools, and process the results.
+
+        The async loop awaits the step callback itself and passes
+        `notify_step=False`.
+        """
+        # Special case for add_image_tool
+        if self._is_add_image_action(formatted_answer):
             self.messages.append({"role": "assistant", "content": tool_result.result})
             return formatted_answer
 
@@ -246,15 +626,30 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             formatted_answer=formatted_answer,
             tool_result=tool_result,
             messages=self.messages,
-            step_callback=self.step_callback,
+            step_callback=self.step_callback if notify_step else None,
             show_logs=self._show_logs,
         )
 
+    def _is_add_image_action(self, formatted_answer: AgentAction) -> bool:
+        add_image_tool = self._i18n.tools("add_image")
+        return (
+            isinstance(add_image_tool, dict)
+            and formatted_answer.tool.casefold().strip()
+            == add_image_tool.get("name", "").casefold().strip()
+        )
+
     def _invoke_step_callback(self, formatted_answer) -> None:
         """Invoke the step callback if it exists."""
         if self.step_callback:
             self.step_callback(formatted_answer)
 
+    async def _ainvoke_step_callback(self, formatted_answer) -> None:
+        """Invoke the step callback if it exists, awaiting it when it is async."""
+        if self.step_callback:
+            result = self.step_callback(formatted_answer)
+            if inspect.isawaitable(result):
+                await result
+
     def _append_message(self, text: str, role: str = "assistant") -> None:
         """Append a message to the message list with the given role."""
         self.messages.append(format_message_for_llm(text, role=role))
@@ -3,13 +3,15 @@ import json
 import re
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import copy as shallow_copy
 from hashlib import md5
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -41,6 +43,7 @@ from crewai.llm import LLM, BaseLLM
 from crewai.memory.entity.entity_memory import EntityMemory
 from crewai.memory.external.external_memory import ExternalMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.memory_write_pipeline import MemoryWritePipeline
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.memory.user.user_memory import UserMemory
 from crewai.process import Process
@@ -91,12 +94,16 @@ class Crew(FlowTrackable, BaseModel):
         manager_agent: Custom agent that will be used as manager.
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
+        memory_write_behind: Whether task memories are persisted on a background worker while the next task runs.
         cache: Whether the crew should use a cache to store the results of the tools execution.
+        cache_handler: Tool result cache to use instead of a fresh in-memory one, e.g. a bounded or persistent CacheHandler.
         function_calling_llm: The language model that will run the tool calling for all the agents.
         process: The process flow that the crew will follow (e.g., sequential, hierarchical).
         verbose: Indicates the verbosity level for logging during execution.
         config: Configuration settings for the crew.
         max_rpm: Maximum number of requests per minute for the crew execution to be respected.
+        max_tpm: Maximum number of LLM tokens per minute for the crew execution to be respected.
+        rate_limit_key: Key under which rate limits are shared with other crews and agents.
         prompt_file: Path to the prompt json file to be used for the crew.
         id: A unique identifier for the crew instance.
         task_callback: Callback to be executed after each task for every agents execution.
@@ -112,7 +119,7 @@ class Crew(FlowTrackable, BaseModel):
     _rpm_controller: RPMController = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
@@ -121,6 +128,10 @@ class Crew(FlowTrackable, BaseModel):
     _train: Optional[bool] = PrivateAttr(default=False)
     _train_iteration: Optional[int] = PrivateAttr()
     _inputs: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _task_executor: Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
+    _task_slots: Optional[asyncio.Semaphore] = PrivateAttr(default=None)
+    _shares_task_workers: bool = PrivateAttr(default=False)
+    _memory_pipeline: Optional[MemoryWritePipeline] = PrivateAttr(default=None)
     _logging_color: str = PrivateAttr(
         default="bold_purple",
     )
@@ -130,6 +141,10 @@ class Crew(FlowTrackable, BaseModel):
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
+    cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Tool result cache shared by the crew's agents. Defaults to a fresh in-memory cache.",
+    )
     tasks: List[Task] = Field(default_factory=list)
     agents: List[BaseAgent] = Field(default_factory=list)
     process: Process = Field(default=Process.sequential)
@@ -142,6 +157,10 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Configuration for the memory to be used for the crew.",
     )
+    memory_write_behind: bool = Field(
+        default=False,
+        description="Persist task memories on a background worker instead of blocking the next task. Pending writes are flushed before kickoff returns.",
+    )
     short_term_memory: Optional[InstanceOf[ShortTermMemory]] = Field(
         default=None,
         description="An Instance of the ShortTermMemory to be used by the Crew",
@@ -204,6 +223,19 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the crew execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the crew execution to be respected.",
+    )
+    rate_limit_key: Optional[str] = Field(
+        default=None,
+        description="Crews and agents with the same key (e.g. one per provider API key) share their rate limits.",
+    )
+    max_async_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of async tasks running at once, shared by every run of a kickoff_for_each batch. Defaults to the ThreadPoolExecutor default.",
+    )
     prompt_file: Optional[str] = Field(
         default=None,
         description="Path to the prompt json file to be used for the crew.",
@@ -273,19 +305,27 @@ class Crew(FlowTrackable, BaseModel):
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
 
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.cache_handler or CacheHandler()
         event_listener = EventListener()
         event_listener.verbose = self.verbose
         event_listener.formatter.verbose = self.verbose
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = self._create_rpm_controller()
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
         return self
 
+    def _create_rpm_controller(self) -> RPMController:
+        return RPMController(
+            max_rpm=self.max_rpm,
+            max_tpm=self.max_tpm,
+            limit_key=self.rate_limit_key,
+            logger=self._logger,
+        )
+
     def _initialize_user_memory(self):
         if (
             self.memory_config
@@ -391,18 +431,19 @@ class Crew(FlowTrackable, BaseModel):
             for agent in self.agents:
                 if self.cache:
                     agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
+                if self.max_rpm or self.max_tpm:
                     agent.set_rpm_controller(self._rpm_controller)
         return self
 
     @model_validator(mode="after")
     def validate_tasks(self):
-        if self.process == Process.sequential:
+        if self.process in (Process.sequential, Process.dag):
+            process_name = self.process.value.capitalize()
             for task in self.tasks:
                 if task.agent is None:
                     raise PydanticCustomError(
                         "missing_agent_in_task",
-                        f"Sequential process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
+                        f"{process_name} process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
                         {},
                     )
 
@@ -411,6 +452,9 @@ class Crew(FlowTrackable, BaseModel):
     @model_validator(mode="after")
     def validate_end_with_at_most_one_async_task(self):
         """Validates that the crew ends with at most one asynchronous task."""
+        if self.process == Process.dag:
+            return self  # The DAG scheduler ignores `async_execution`
+
         final_async_task_count = 0
 
         # Traverse tasks backward
@@ -475,6 +519,9 @@ class Crew(FlowTrackable, BaseModel):
         it cannot include other asynchronous tasks in its context unless
         separated by a synchronous task.
         """
+        if self.process == Process.dag:
+            return self  # The DAG scheduler ignores `async_execution`
+
         for i, task in enumerate(self.tasks):
             if task.async_execution and isinstance(task.context, list):
                 for context_task in task.context:
@@ -617,64 +664,20 @@ class Crew(FlowTrackable, BaseModel):
         inputs: Optional[Dict[str, Any]] = None,
     ) -> CrewOutput:
         try:
-            for before_callback in self.before_kickoff_callbacks:
-                if inputs is None:
-                    inputs = {}
-                inputs = before_callback(inputs)
-
-            crewai_event_bus.emit(
-                self,
-                CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
-            )
-
-            # Starts the crew to work on its assigned tasks.
-            self._task_output_handler.reset()
-            self._logging_color = "bold_purple"
-
-            if inputs is not None:
-                self._inputs = inputs
-                self._interpolate_inputs(inputs)
-            self._set_tasks_callbacks()
-
-            i18n = I18N(prompt_file=self.prompt_file)
-
-            for agent in self.agents:
-                agent.i18n = i18n
-                # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
-                agent.crew = self  # type: ignore[attr-defined]
-                agent.set_knowledge(crew_embedder=self.embedder)
-                # TODO: Create an AgentFunctionCalling protocol for future refactoring
-                if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-                    agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-
-                if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
-                    agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
-
-                agent.create_agent_executor()
-
-            if self.planning:
-                self._handle_crew_planning()
-
-            metrics: List[UsageMetrics] = []
+            self._start_kickoff(inputs)
 
             if self.process == Process.sequential:
                 result = self._run_sequential_process()
             elif self.process == Process.hierarchical:
                 result = self._run_hierarchical_process()
+            elif self.process == Process.dag:
+                result = self._run_dag_process()
             else:
                 raise NotImplementedError(
                     f"The process '{self.process}' is not implemented yet."
                 )
 
-            for after_callback in self.after_kickoff_callbacks:
-                result = after_callback(result)
-
-            metrics += [agent._token_process.get_summary() for agent in self.agents]
-
-            self.usage_metrics = UsageMetrics()
-            for metric in metrics:
-                self.usage_metrics.add_usage_metrics(metric)
-            return result
+            return self._finish_kickoff(result)
         except Exception as e:
             crewai_event_bus.emit(
                 self,
@@ -682,52 +685,206 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
 
+    def _start_kickoff(self, inputs: Optional[Dict[str, Any]]) -> None:
+        """Apply the inputs and set up the agents and plan before tasks run."""
+        for before_callback in self.before_kickoff_callbacks:
+            if inputs is None:
+                inputs = {}
+            inputs = before_callback(inputs)
+
+        crewai_event_bus.emit(
+            self,
+            CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
+        )
+
+        # Starts the crew to work on its assigned tasks.
+        self._task_output_handler.reset()
+        self._logging_color = "bold_purple"
+
+        if inputs is not None:
+            self._inputs = inputs
+            self._interpolate_inputs(inputs)
+        self._set_tasks_callbacks()
+
+        i18n = I18N(prompt_file=self.prompt_file)
+
+        for agent in self.agents:
+            agent.i18n = i18n
+            # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
+            agent.crew = self  # type: ignore[attr-defined]
+            agent.set_knowledge(crew_embedder=self.embedder)
+            # TODO: Create an AgentFunctionCalling protocol for future refactoring
+            if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+                agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+
+            if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
+                agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
+
+            agent.create_agent_executor()
+
+        if self.planning:
+            self._handle_crew_planning()
+
+    def _finish_kickoff(self, result: CrewOutput) -> CrewOutput:
+        """Run the after kickoff callbacks and total the agents' usage."""
+        metrics: List[UsageMetrics] = []
+
+        for after_callback in self.after_kickoff_callbacks:
+            result = after_callback(result)
+
+        metrics += [agent._token_process.get_summary() for agent in self.agents]
+
+        self.usage_metrics = UsageMetrics()
+        for metric in metrics:
+            self.usage_metrics.add_usage_metrics(metric)
+        return result
+
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
         """Executes the Crew's workflow for each input in the list and aggregates results."""
         results: List[CrewOutput] = []
 
         # Initialize the parent crew's usage metrics
         total_usage_metrics = UsageMetrics()
+        executor = self._get_task_executor()
 
-        for input_data in inputs:
-            crew = self.copy()
+        try:
+            for input_data in inputs:
+                crew = self.copy(lightweight=True)
+                crew._share_task_workers(executor, None)
 
-            output = crew.kickoff(inputs=input_data)
+                output = crew.kickoff(inputs=input_data)
 
-            if crew.usage_metrics:
-                total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+                if crew.usage_metrics:
+                    total_usage_metrics.add_usage_metrics(crew.usage_metrics)
 
-            results.append(output)
+                results.append(output)
+        finally:
+            self._shutdown_task_executor()
 
         self.usage_metrics = total_usage_metrics
         self._task_output_handler.reset()
         return results
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> CrewOutput:
-        """Asynchronous kickoff method to start the crew execution."""
-        return await asyncio.to_thread(self.kickoff, inputs)
+        """Asynchronous kickoff method to start the crew execution.
 
-    async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
-        crew_copies = [self.copy() for _ in inputs]
+        Tasks run as coroutines through `Task.aexecute`, so agent turns await
+        the LLM and tools instead of holding a thread. Setup and the kickoff
+        callbacks may block, so they run in a worker thread.
+        """
+        try:
+            await asyncio.to_thread(self._start_kickoff, inputs)
+
+            if self.process == Process.hierarchical:
+                self._create_manager_agent()
+            elif self.process not in (Process.sequential, Process.dag):
+                raise NotImplementedError(
+                    f"The process '{self.process}' is not implemented yet."
+                )
+            result = await self._aexecute_tasks(self.tasks)
+
+            return await asyncio.to_thread(self._finish_kickoff, result)
+        except Exception as e:
+            crewai_event_bus.emit(
+                self,
+                CrewKickoffFailedEvent(error=str(e), crew_name=self.name or "crew"),
+            )
+            raise
 
-        async def run_crew(crew, input_data):
-            return await crew.kickoff_async(inputs=input_data)
+    async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
+        """Run the crew for each input concurrently and return outputs in input order.
 
-        tasks = [
-            asyncio.create_task(run_crew(crew_copies[i], inputs[i]))
-            for i in range(len(inputs))
+        If a run fails, its error is raised, the runs still in flight are
+        cancelled and the outputs of finished runs are discarded. Use
+        `kickoff_for_each_stream` to keep each output as soon as it completes.
+        """
+        return [
+            result
+            async for result in self.kickoff_for_each_stream(inputs, ordered=True)
         ]
 
-        results = await asyncio.gather(*tasks)
+    async def kickoff_for_each_stream(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = False,
+    ) -> AsyncIterator[CrewOutput]:
+        """Run the crew for each input, yielding outputs as they complete.
+
+        Inputs are consumed lazily and a crew copy is only created when its run
+        starts, so memory stays flat for large or generated batches. No new run
+        starts while the consumer is not pulling results.
+
+        When the iterator is closed early (e.g. with `contextlib.aclosing`) or
+        a run fails, the runs still in flight are cancelled and awaited. They
+        stop at their next await; a blocking step already running in a worker
+        thread, such as a synchronous tool call, finishes in the background and
+        its result is discarded.
 
+        Args:
+            inputs: Inputs for each run. May be a generator.
+            max_concurrency: Maximum number of runs in flight, including
+                finished runs waiting to be yielded when `ordered` is set.
+                Defaults to no limit.
+            ordered: Yield outputs in input order instead of completion order.
+
+        Yields:
+            CrewOutput: The output of each run.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        pending_inputs = iter(inputs)
+        inputs_exhausted = False
+        running: Dict[asyncio.Task, Tuple[int, "Crew"]] = {}
+        finished: Dict[int, CrewOutput] = {}
+        next_index = 0
+        next_to_yield = 0
         total_usage_metrics = UsageMetrics()
-        for crew in crew_copies:
-            if crew.usage_metrics:
-                total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+        slots = self._get_task_slots()
 
-        self.usage_metrics = total_usage_metrics
-        self._task_output_handler.reset()
-        return results
+        try:
+            while True:
+                while not inputs_exhausted and (
+                    max_concurrency is None
+                    or len(running) + len(finished) < max_concurrency
+                ):
+                    try:
+                        input_data = next(pending_inputs)
+                    except StopIteration:
+                        inputs_exhausted = True
+                        break
+                    crew = self.copy(lightweight=True)
+                    crew._share_task_workers(None, slots)
+                    run = asyncio.create_task(crew.kickoff_async(inputs=input_data))
+                    running[run] = (next_index, crew)
+                    next_index += 1
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for run in sorted(done, key=lambda r: running[r][0]):
+                    index, crew = running.pop(run)
+                    finished[index] = run.result()
+                    if crew.usage_metrics:
+                        total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+
+                if ordered:
+                    while next_to_yield in finished:
+                        yield finished.pop(next_to_yield)
+                        next_to_yield += 1
+                else:
+                    for index in sorted(finished):
+                        yield finished.pop(index)
+        finally:
+            for run in running:
+                run.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            self.usage_metrics = total_usage_metrics
+            self._task_output_handler.reset()
 
     def _handle_crew_planning(self):
         """Handles the Crew planning."""
@@ -777,6 +934,10 @@ class Crew(FlowTrackable, BaseModel):
         self._create_manager_agent()
         return self._execute_tasks(self.tasks)
 
+    def _run_dag_process(self) -> CrewOutput:
+        """Executes tasks as a dependency graph built from their `context`."""
+        return self._execute_tasks(self.tasks)
+
     def _create_manager_agent(self):
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
@@ -818,6 +979,38 @@ class Crew(FlowTrackable, BaseModel):
             CrewOutput: Final output of the crew
         """
 
+        self._open_memory_pipeline()
+
+        try:
+            if self.process == Process.dag:
+                return self._run_task_graph(tasks, start_index, was_replayed)
+            return self._run_tasks(tasks, start_index, was_replayed)
+        finally:
+            self._shutdown_task_executor()
+            self._close_memory_pipeline()
+
+    async def _aexecute_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Async counterpart of `_execute_tasks`."""
+        self._open_memory_pipeline()
+
+        try:
+            if self.process == Process.dag:
+                return await self._arun_task_graph(tasks, start_index, was_replayed)
+            return await self._arun_tasks(tasks, start_index, was_replayed)
+        finally:
+            await asyncio.to_thread(self._close_memory_pipeline)
+
+    def _run_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int],
+        was_replayed: bool,
+    ) -> CrewOutput:
         task_outputs: List[TaskOutput] = []
         futures: List[Tuple[Task, Future[TaskOutput], int]] = []
         last_sync_output: Optional[TaskOutput] = None
@@ -832,22 +1025,7 @@ class Crew(FlowTrackable, BaseModel):
                         last_sync_output = task.output
                 continue
 
-            agent_to_use = self._get_agent_to_use(task)
-            if agent_to_use is None:
-                raise ValueError(
-                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
-                )
-
-            # Determine which tools to use - task tools take precedence over agent tools
-            tools_for_task = task.tools or agent_to_use.tools or []
-            # Prepare tools and ensure they're compatible with task execution
-            tools_for_task = self._prepare_tools(
-                agent_to_use,
-                task,
-                cast(Union[List[Tool], List[BaseTool]], tools_for_task),
-            )
-
-            self._log_task_start(task, agent_to_use.role)
+            agent_to_use, tools_for_task = self._prepare_task_run(task)
 
             if isinstance(task, ConditionalTask):
                 skipped_task_output = self._handle_conditional_task(
@@ -864,7 +1042,8 @@ class Crew(FlowTrackable, BaseModel):
                 future = task.execute_async(
                     agent=agent_to_use,
                     context=context,
-                    tools=cast(List[BaseTool], tools_for_task),
+                    tools=tools_for_task,
+                    executor=self._get_task_executor(),
                 )
                 futures.append((task, future, task_index))
             else:
@@ -876,7 +1055,7 @@ class Crew(FlowTrackable, BaseModel):
                 task_output = task.execute_sync(
                     agent=agent_to_use,
                     context=context,
-                    tools=cast(List[BaseTool], tools_for_task),
+                    tools=tools_for_task,
                 )
                 task_outputs.append(task_output)
                 self._process_task_result(task, task_output)
@@ -887,6 +1066,442 @@ class Crew(FlowTrackable, BaseModel):
 
         return self._create_crew_output(task_outputs)
 
+    async def _arun_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int],
+        was_replayed: bool,
+    ) -> CrewOutput:
+        """Async counterpart of `_run_tasks`.
+
+        Async tasks are scheduled on the event loop, bounded by
+        `max_async_workers`, instead of on the crew's worker pool.
+        """
+        task_outputs: List[TaskOutput] = []
+        runs: List[Tuple[Task, "asyncio.Task[TaskOutput]", int]] = []
+        last_sync_output: Optional[TaskOutput] = None
+        slots = self._get_task_slots()
+
+        try:
+            for task_index, task in enumerate(tasks):
+                if start_index is not None and task_index < start_index:
+                    if task.output:
+                        if task.async_execution:
+                            task_outputs.append(task.output)
+                        else:
+                            task_outputs = [task.output]
+                            last_sync_output = task.output
+                    continue
+
+                agent_to_use, tools_for_task = self._prepare_task_run(task)
+
+                if isinstance(task, ConditionalTask):
+                    if runs:
+                        task_outputs = await self._aprocess_async_tasks(
+                            runs, was_replayed
+                        )
+                        runs.clear()
+                    skipped_task_output = self._handle_conditional_task(
+                        task, task_outputs, [], task_index, was_replayed
+                    )
+                    if skipped_task_output:
+                        task_outputs.append(skipped_task_output)
+                        continue
+
+                if task.async_execution:
+                    context = self._get_context(
+                        task, [last_sync_output] if last_sync_output else []
+                    )
+                    run = asyncio.create_task(
+                        self._arun_task(
+                            task, agent_to_use, context, tools_for_task, slots
+                        )
+                    )
+                    runs.append((task, run, task_index))
+                else:
+                    if runs:
+                        task_outputs = await self._aprocess_async_tasks(
+                            runs, was_replayed
+                        )
+                        runs.clear()
+
+                    context = self._get_context(task, task_outputs)
+                    task_output = await task.aexecute(
+                        agent=agent_to_use,
+                        context=context,
+                        tools=tools_for_task,
+                    )
+                    task_outputs.append(task_output)
+                    self._process_task_result(task, task_output)
+                    self._store_execution_log(
+                        task, task_output, task_index, was_replayed
+                    )
+
+            if runs:
+                task_outputs = await self._aprocess_async_tasks(runs, was_replayed)
+                runs.clear()
+        finally:
+            for _, run, _ in runs:
+                run.cancel()
+
+        return self._create_crew_output(task_outputs)
+
+    async def _arun_task(
+        self,
+        task: Task,
+        agent: BaseAgent,
+        context: str,
+        tools: List[BaseTool],
+        slots: Optional[asyncio.Semaphore],
+    ) -> TaskOutput:
+        """Run an async task once one of the `max_async_workers` slots is free."""
+        if slots is None:
+            return await task.aexecute(agent=agent, context=context, tools=tools)
+        async with slots:
+            return await task.aexecute(agent=agent, context=context, tools=tools)
+
+    async def _aprocess_async_tasks(
+        self,
+        runs: List[Tuple[Task, "asyncio.Task[TaskOutput]", int]],
+        was_replayed: bool = False,
+    ) -> List[TaskOutput]:
+        """Async counterpart of `_process_async_tasks`."""
+        task_outputs: List[TaskOutput] = []
+        for run_task, run, task_index in runs:
+            task_output = await run
+            task_outputs.append(task_output)
+            self._process_task_result(run_task, task_output)
+            self._store_execution_log(run_task, task_output, task_index, was_replayed)
+        return task_outputs
+
+    def _get_task_slots(self) -> Optional[asyncio.Semaphore]:
+        """Return a semaphore bounding concurrent async tasks to `max_async_workers`."""
+        if self._task_slots is not None:
+            return self._task_slots
+        if self.max_async_workers is None:
+            return None
+        return asyncio.Semaphore(self.max_async_workers)
+
+    def _run_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int],
+        was_replayed: bool,
+    ) -> CrewOutput:
+        """Runs every task as soon as the tasks in its `context` have finished.
+
+        Independent tasks run concurrently on the crew's worker pool, so
+        `max_async_workers` caps how many execute at once, each on its own
+        clone of its agent (see `_graph_task_agent`). Tasks without an
+        explicit `context` have no dependencies. Outputs are returned in
+        task list order, which is a valid topological order because
+        `context` may only reference earlier tasks.
+        """
+        dependencies = self._build_task_dependencies(tasks)
+        dependents: Dict[int, List[int]] = {index: [] for index in range(len(tasks))}
+        for index, upstream in dependencies.items():
+            for upstream_index in upstream:
+                dependents[upstream_index].append(index)
+
+        outputs: Dict[int, TaskOutput] = {}
+        completed: Set[int] = set()
+        for task_index, task in enumerate(tasks[: start_index or 0]):
+            completed.add(task_index)
+            if task.output:
+                outputs[task_index] = task.output
+
+        executor = self._get_task_executor()
+        running: Dict[Future[TaskOutput], int] = {}
+        assigned_agents = {index: task.agent for index, task in enumerate(tasks)}
+        scheduled = set(completed)
+        ready = [
+            index
+            for index in range(len(tasks))
+            if index not in completed and dependencies[index] <= completed
+        ]
+
+        try:
+            while ready or running:
+                finished: List[int] = []
+                for task_index in ready:
+                    scheduled.add(task_index)
+                    skipped_task_output = self._start_graph_task(
+                        tasks[task_index],
+                        task_index,
+                        [
+                            outputs[index]
+                            for index in sorted(dependencies[task_index])
+                            if index in outputs
+                        ],
+                        executor,
+                        running,
+                        was_replayed,
+                    )
+                    if skipped_task_output is not None:
+                        outputs[task_index] = skipped_task_output
+                        finished.append(task_index)
+
+                if running and not finished:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda f: running[f]):
+                        task_index = running.pop(future)
+                        # The task ran with a clone of its agent, see _start_graph_task
+                        tasks[task_index].agent = assigned_agents[task_index]
+                        task_output = future.result()
+                        outputs[task_index] = task_output
+                        finished.append(task_index)
+                        self._process_task_result(tasks[task_index], task_output)
+                        self._store_execution_log(
+                            tasks[task_index], task_output, task_index, was_replayed
+                        )
+
+                completed.update(finished)
+                ready = sorted(
+                    {
+                        dependent
+                        for task_index in finished
+                        for dependent in dependents[task_index]
+                        if dependent not in scheduled
+                        and dependencies[dependent] <= completed
+                    }
+                )
+        finally:
+            # After a failure, let the tasks still running finish before
+            # handing every task its assigned agent back from its clone
+            for future in running:
+                future.cancel()
+            wait(running)
+            for task_index in scheduled:
+                tasks[task_index].agent = assigned_agents[task_index]
+
+        return self._create_crew_output([outputs[index] for index in sorted(outputs)])
+
+    def _build_task_dependencies(self, tasks: List[Task]) -> Dict[int, Set[int]]:
+        """Maps each task index to the indices of the crew tasks in its context."""
+        task_indices = {id(task): index for index, task in enumerate(tasks)}
+        dependencies: Dict[int, Set[int]] = {}
+        for index, task in enumerate(tasks):
+            context = task.context if isinstance(task.context, list) else []
+            dependencies[index] = {
+                task_indices[id(context_task)]
+                for context_task in context
+                if id(context_task) in task_indices
+            }
+        return dependencies
+
+    def _start_graph_task(
+        self,
+        task: Task,
+        task_index: int,
+        previous_outputs: List[TaskOutput],
+        executor: ThreadPoolExecutor,
+        running: Dict[Future[TaskOutput], int],
+        was_replayed: bool,
+    ) -> Optional[TaskOutput]:
+        """Submits a ready task, returning its output instead if it was skipped."""
+        agent_to_use, tools_for_task = self._prepare_task_run(task)
+
+        if isinstance(task, ConditionalTask):
+            skipped_task_output = self._handle_conditional_task(
+                task, previous_outputs, [], task_index, was_replayed
+            )
+            if skipped_task_output:
+                return skipped_task_output
+
+        future = task.execute_async(
+            agent=self._graph_task_agent(agent_to_use),
+            context=self._get_context(task, []),
+            tools=tools_for_task,
+            executor=executor,
+        )
+        running[future] = task_index
+        return None
+
+    async def _arun_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int],
+        was_replayed: bool,
+    ) -> CrewOutput:
+        """Async counterpart of `_run_task_graph`.
+
+        Ready tasks are scheduled on the event loop, bounded by
+        `max_async_workers`, instead of on the crew's worker pool.
+        """
+        dependencies = self._build_task_dependencies(tasks)
+        dependents: Dict[int, List[int]] = {index: [] for index in range(len(tasks))}
+        for index, upstream in dependencies.items():
+            for upstream_index in upstream:
+                dependents[upstream_index].append(index)
+
+        outputs: Dict[int, TaskOutput] = {}
+        completed: Set[int] = set()
+        for task_index, task in enumerate(tasks[: start_index or 0]):
+            completed.add(task_index)
+            if task.output:
+                outputs[task_index] = task.output
+
+        slots = self._get_task_slots()
+        running: Dict["asyncio.Task[TaskOutput]", int] = {}
+        assigned_agents = {index: task.agent for index, task in enumerate(tasks)}
+        scheduled = set(completed)
+        ready = [
+            index
+            for index in range(len(tasks))
+            if index not in completed and dependencies[index] <= completed
+        ]
+
+        try:
+            while ready or running:
+                finished: List[int] = []
+                for task_index in ready:
+                    scheduled.add(task_index)
+                    task = tasks[task_index]
+                    agent_to_use, tools_for_task = self._prepare_task_run(task)
+
+                    if isinstance(task, ConditionalTask):
+                        skipped_task_output = self._handle_conditional_task(
+                            task,
+                            [
+                                outputs[index]
+                                for index in sorted(dependencies[task_index])
+                                if index in outputs
+                            ],
+                            [],
+                            task_index,
+                            was_replayed,
+                        )
+                        if skipped_task_output:
+                            outputs[task_index] = skipped_task_output
+                            finished.append(task_index)
+                            continue
+
+                    run = asyncio.create_task(
+                        self._arun_task(
+                            task,
+                            self._graph_task_agent(agent_to_use),
+                            self._get_context(task, []),
+                            tools_for_task,
+                            slots,
+                        )
+                    )
+                    running[run] = task_index
+
+                if running and not finished:
+                    done, _ = await asyncio.wait(
+                        running, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for run in sorted(done, key=lambda r: running[r]):
+                        task_index = running.pop(run)
+                        tasks[task_index].agent = assigned_agents[task_index]
+                        task_output = run.result()
+                        outputs[task_index] = task_output
+                        finished.append(task_index)
+                        self._process_task_result(tasks[task_index], task_output)
+                        self._store_execution_log(
+                            tasks[task_index], task_output, task_index, was_replayed
+                        )
+
+                completed.update(finished)
+                ready = sorted(
+                    {
+                        dependent
+                        for task_index in finished
+                        for dependent in dependents[task_index]
+                        if dependent not in scheduled
+                        and dependencies[dependent] <= completed
+                    }
+                )
+        finally:
+            for run in running:
+                run.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            for task_index in scheduled:
+                tasks[task_index].agent = assigned_agents[task_index]
+
+        return self._create_crew_output([outputs[index] for index in sorted(outputs)])
+
+    def _graph_task_agent(self, agent: BaseAgent) -> BaseAgent:
+        """Clone an agent to run one graph task.
+
+        Independent tasks of the same agent run at the same time, and an agent
+        keeps the executor, and so the message history, of the task it runs.
+        Each task gets its own clone, which still counts its usage and rate
+        limits against the original agent.
+        """
+        task_agent = agent._copy_for_run()
+        task_agent.crew = self
+        task_agent._token_process = agent._token_process
+        task_agent._rpm_controller = agent._rpm_controller
+        return task_agent
+
+    def _prepare_task_run(self, task: Task) -> Tuple[BaseAgent, List[BaseTool]]:
+        """Resolve the agent and tools that run a task and log its start."""
+        agent_to_use = self._get_agent_to_use(task)
+        if agent_to_use is None:
+            raise ValueError(
+                f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+            )
+
+        # Determine which tools to use - task tools take precedence over agent tools
+        tools_for_task = task.tools or agent_to_use.tools or []
+        # Prepare tools and ensure they're compatible with task execution
+        tools_for_task = self._prepare_tools(
+            agent_to_use,
+            task,
+            cast(Union[List[Tool], List[BaseTool]], tools_for_task),
+        )
+
+        self._log_task_start(task, agent_to_use.role)
+        return agent_to_use, cast(List[BaseTool], tools_for_task)
+
+    def _get_task_executor(self) -> ThreadPoolExecutor:
+        """Return the crew's worker pool for async tasks, creating it on first use."""
+        if self._task_executor is None:
+            self._task_executor = ThreadPoolExecutor(
+                max_workers=self.max_async_workers,
+                thread_name_prefix=f"crewai-crew-{str(self.id)[:8]}",
+            )
+        return self._task_executor
+
+    def _shutdown_task_executor(self) -> None:
+        """Release the async task pool, cancelling anything still queued."""
+        if self._task_executor is not None and not self._shares_task_workers:
+            self._task_executor.shutdown(wait=False, cancel_futures=True)
+            self._task_executor = None
+
+    def _share_task_workers(
+        self,
+        executor: Optional[ThreadPoolExecutor],
+        slots: Optional[asyncio.Semaphore],
+    ) -> None:
+        """Run async tasks on the workers of the crew that started this copy.
+
+        Copies made for a batch share one pool and one set of event loop slots,
+        so `max_async_workers` bounds the whole batch rather than each run. The
+        workers stay owned, and are released, by the original crew.
+        """
+        self._task_executor = executor
+        self._task_slots = slots
+        self._shares_task_workers = executor is not None
+
+    def _get_memory_pipeline(self) -> Optional[MemoryWritePipeline]:
+        """Return the write-behind memory pipeline of the running kickoff, if any."""
+        return self._memory_pipeline
+
+    def _open_memory_pipeline(self) -> None:
+        """Start the write-behind memory pipeline for a kickoff, if enabled."""
+        if self.memory_write_behind:
+            self._memory_pipeline = MemoryWritePipeline(
+                name=f"crewai-memory-{str(self.id)[:8]}"
+            )
+
+    def _close_memory_pipeline(self) -> None:
+        """Wait for pending memory writes and stop the pipeline worker."""
+        if self._memory_pipeline is not None:
+            self._memory_pipeline.close()
+            self._memory_pipeline = None
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -1150,11 +1765,20 @@ class Crew(FlowTrackable, BaseModel):
         return result
 
     def query_knowledge(
-        self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
+        self,
+        query: List[str],
+        results_limit: int = 3,
+        score_threshold: float = 0.35,
+        search_mode: str = "vector",
+        rrf_k: int = 60,
     ) -> Union[List[Dict[str, Any]], None]:
         if self.knowledge:
             return self.knowledge.query(
-                query, results_limit=results_limit, score_threshold=score_threshold
+                query,
+                results_limit=results_limit,
+                score_threshold=score_threshold,
+                search_mode=search_mode,
+                rrf_k=rrf_k,
             )
         return None
 
@@ -1183,13 +1807,18 @@ class Crew(FlowTrackable, BaseModel):
 
         return required_inputs
 
-    def copy(self):
+    def copy(self, lightweight: bool = False):  # type: ignore # Signature of "copy" incompatible with supertype "BaseModel"
         """
         Creates a deep copy of the Crew instance.
 
+        Args:
+            lightweight: Create a copy-on-write clone instead, see `_copy_for_run`.
+
         Returns:
             Crew: A new instance with copied components
         """
+        if lightweight:
+            return self._copy_for_run()
 
         exclude = {
             "id",
@@ -1198,6 +1827,7 @@ class Crew(FlowTrackable, BaseModel):
             "_execution_span",
             "_file_handler",
             "_cache_handler",
+            "cache_handler",
             "_short_term_memory",
             "_long_term_memory",
             "_entity_memory",
@@ -1214,7 +1844,7 @@ class Crew(FlowTrackable, BaseModel):
         manager_agent = self.manager_agent.copy() if self.manager_agent else None
         manager_llm = shallow_copy(self.manager_llm) if self.manager_llm else None
 
-        task_mapping = {}
+        task_mapping: Dict[str, Task] = {}
 
         cloned_tasks = []
         existing_knowledge_sources = shallow_copy(self.knowledge_sources)
@@ -1261,6 +1891,7 @@ class Crew(FlowTrackable, BaseModel):
             knowledge=existing_knowledge,
             manager_agent=manager_agent,
             manager_llm=manager_llm,
+            cache_handler=self.cache_handler,
         )
 
         return copied_crew
@@ -1506,3 +2137,65 @@ class Crew(FlowTrackable, BaseModel):
         """Reset crew and agent knowledge storage."""
         for ks in knowledges:
             ks.reset()
+
+    def _copy_for_run(self) -> "Crew":
+        """Create a copy-on-write clone of the crew for a separate run.
+
+        Unlike `copy`, this does not dump and re-validate the crew. Config,
+        LLM clients, tool instances, knowledge and memory storage are shared
+        with the original. Agents and tasks are shallow-cloned so that
+        interpolated inputs, outputs, executors and usage metrics stay per run.
+        """
+        cloned_agents = [agent._copy_for_run() for agent in self.agents]
+        agents_by_id = {
+            id(agent): cloned for agent, cloned in zip(self.agents, cloned_agents)
+        }
+        agents_by_role = {agent.role: agent for agent in cloned_agents}
+
+        cloned_tasks: List[Task] = []
+        tasks_by_id: Dict[int, Task] = {}
+        for task in self.tasks:
+            agent = (
+                agents_by_id.get(id(task.agent), agents_by_role.get(task.agent.role))
+                if task.agent
+                else None
+            )
+            cloned_task = task._copy_for_run(agent)
+            cloned_tasks.append(cloned_task)
+            tasks_by_id[id(task)] = cloned_task
+
+        for cloned_task in cloned_tasks:
+            if isinstance(cloned_task.context, list):
+                cloned_task.context = [
+                    tasks_by_id.get(id(context_task), context_task)
+                    for context_task in cloned_task.context
+                ]
+
+        copied_crew = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agents": cloned_agents,
+                "tasks": cloned_tasks,
+                "manager_agent": (
+                    self.manager_agent._copy_for_run() if self.manager_agent else None
+                ),
+                "usage_metrics": None,
+                "execution_logs": [],
+            }
+        )
+        copied_crew._inputs = None
+        copied_crew._train = False
+        copied_crew._task_executor = None
+        copied_crew._task_slots = None
+        copied_crew._shares_task_workers = False
+        copied_crew._memory_pipeline = None
+        copied_crew._cache_handler = self.cache_handler or CacheHandler()
+        copied_crew._rpm_controller = self._create_rpm_controller()
+
+        for agent in copied_crew.agents:
+            if copied_crew.cache:
+                agent.set_cache_handler(copied_crew._cache_handler)
+            if copied_crew.max_rpm or copied_crew.max_tpm:
+                agent.set_rpm_controller(copied_crew._rpm_controller)
+
+        return copied_crew
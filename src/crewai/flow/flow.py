@@ -1,7 +1,11 @@
 import asyncio
+import contextlib
+import contextvars
 import copy
+import functools
 import inspect
 import logging
+from concurrent.futures import Executor
 from typing import (
     Any,
     Callable,
@@ -10,6 +14,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -25,6 +30,7 @@ from crewai.flow.utils import get_possible_return_constants
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.flow_events import (
     FlowCreatedEvent,
+    FlowEvent,
     FlowFinishedEvent,
     FlowPlotEvent,
     FlowStartedEvent,
@@ -95,6 +101,60 @@ def ensure_state_type(state: Any, expected_type: Type[StateT]) -> StateT:
     raise TypeError(f"Invalid expected_type: {expected_type}")
 
 
+# Values that can be shared between a state and its snapshots without copying
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def snapshot_state(state: StateT) -> StateT:
+    """Copy a flow state for events, sharing its immutable values.
+
+    Containers and models are copied recursively, but strings, numbers and
+    other immutable values are shared with the state instead of being passed
+    through `copy.deepcopy`, which keeps snapshots of states holding large
+    document lists cheap. Shared references and cycles are preserved.
+
+    Args:
+        state: State instance to snapshot
+
+    Returns:
+        A copy of the state unaffected by later changes to it
+    """
+    return cast(StateT, _snapshot(state, {}))
+
+
+def _snapshot(value: Any, memo: Dict[int, Any]) -> Any:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    key = id(value)
+    if key in memo:
+        return memo[key]
+
+    cls = type(value)
+    if cls is list:
+        copied_list: List[Any] = []
+        memo[key] = copied_list
+        copied_list.extend([_snapshot(item, memo) for item in value])
+        return copied_list
+    if cls is dict:
+        copied_dict: Dict[Any, Any] = {}
+        memo[key] = copied_dict
+        for item_key, item in value.items():
+            copied_dict[item_key] = _snapshot(item, memo)
+        return copied_dict
+    if isinstance(value, BaseModel):
+        copied_model = value.model_copy()
+        memo[key] = copied_model
+        for name, field_value in value.__dict__.items():
+            copied_model.__dict__[name] = _snapshot(field_value, memo)
+        if value.__pydantic_private__:
+            copied_model.__pydantic_private__ = _snapshot(
+                value.__pydantic_private__, memo
+            )
+        return copied_model
+    # copy.deepcopy shares the memo, so aliasing holds across both copies
+    return copy.deepcopy(value, memo)
+
+
 def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
     """
     Marks a method as a flow's starting point.
@@ -380,6 +440,60 @@ def and_(*conditions: Union[str, dict, Callable]) -> dict:
     return {"type": "AND", "methods": methods}
 
 
+class TriggerIndex:
+    """Listeners and routers of a flow class, indexed by the method that triggers them.
+
+    Built once per class by `FlowMeta`, so that resolving what a completed
+    method triggers only visits the listeners waiting on it. Each method an
+    AND listener waits on is assigned a bit; the listener fires once all of
+    its bits have been cleared.
+    """
+
+    def __init__(
+        self, listeners: Dict[str, Tuple[str, List[str]]], routers: Set[str]
+    ) -> None:
+        # trigger -> [(listener name, AND bit or 0 for OR listeners)], in
+        # listener definition order
+        self.routers: Dict[str, List[Tuple[str, int]]] = {}
+        self.listeners: Dict[str, List[Tuple[str, int]]] = {}
+        self.and_masks: Dict[str, int] = {}
+
+        for listener_name, (condition_type, methods) in listeners.items():
+            index = self.routers if listener_name in routers else self.listeners
+            unique_methods = list(dict.fromkeys(methods))
+            if condition_type == "OR":
+                for method in unique_methods:
+                    index.setdefault(method, []).append((listener_name, 0))
+            elif condition_type == "AND":
+                self.and_masks[listener_name] = (1 << len(unique_methods)) - 1
+                for bit, method in enumerate(unique_methods):
+                    index.setdefault(method, []).append((listener_name, 1 << bit))
+
+    def triggered(
+        self, trigger_method: str, router_only: bool, pending_and: Dict[str, int]
+    ) -> List[str]:
+        """Return the listeners or routers fired by `trigger_method`.
+
+        `pending_and` maps AND listeners to the bits still to be cleared, and
+        is updated in place; listeners missing from it wait on all methods.
+        """
+        triggered = []
+        index = self.routers if router_only else self.listeners
+        for listener_name, bit in index.get(trigger_method, ()):
+            if not bit:
+                triggered.append(listener_name)
+                continue
+            remaining = pending_and.get(listener_name, self.and_masks[listener_name])
+            remaining &= ~bit
+            if remaining:
+                pending_and[listener_name] = remaining
+            else:
+                # All required methods have been executed; reset for next time
+                pending_and.pop(listener_name, None)
+                triggered.append(listener_name)
+        return triggered
+
+
 class FlowMeta(type):
     def __new__(mcs, name, bases, dct):
         cls = super().__new__(mcs, name, bases, dct)
@@ -420,6 +534,7 @@ class FlowMeta(type):
         setattr(cls, "_listeners", listeners)
         setattr(cls, "_routers", routers)
         setattr(cls, "_router_paths", router_paths)
+        setattr(cls, "_trigger_index", TriggerIndex(listeners, routers))
 
         return cls
 
@@ -427,7 +542,12 @@ class FlowMeta(type):
 class Flow(Generic[T], metaclass=FlowMeta):
     """Base class for all flows.
 
-    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel."""
+    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel.
+
+    Synchronous flow methods run in `method_executor` (the event loop's
+    default thread pool if unset), so listeners triggered together run in
+    parallel even when they block, e.g. on a crew kickoff. Set
+    `max_concurrency` to cap how many flow methods run at once."""
 
     _printer = Printer()
 
@@ -435,7 +555,10 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: Dict[str, tuple[str, List[str]]] = {}
     _routers: Set[str] = set()
     _router_paths: Dict[str, List[str]] = {}
+    _trigger_index: TriggerIndex
     initial_state: Union[Type[T], T, None] = None
+    max_concurrency: Optional[int] = None
+    method_executor: Optional[Executor] = None
 
     def __class_getitem__(cls: Type["Flow"], item: Type[T]) -> Type["Flow"]:
         class _FlowGeneric(cls):  # type: ignore
@@ -458,9 +581,10 @@ class Flow(Generic[T], metaclass=FlowMeta):
         # Initialize basic instance attributes
         self._methods: Dict[str, Callable] = {}
         self._method_execution_counts: Dict[str, int] = {}
-        self._pending_and_listeners: Dict[str, Set[str]] = {}
+        self._pending_and_listeners: Dict[str, int] = {}
         self._method_outputs: List[Any] = []  # List to store all method outputs
         self._persistence: Optional[FlowPersistence] = persistence
+        self._method_semaphore: Optional[asyncio.Semaphore] = None
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -576,7 +700,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
         )
 
     def _copy_state(self) -> T:
-        return copy.deepcopy(self._state)
+        return snapshot_state(self._state)
+
+    def _event_state(self, event_type: Type[FlowEvent]) -> T:
+        """Snapshot the state for an event, unless no handler reads it."""
+        if crewai_event_bus.has_listeners(event_type, needs_payload=True):
+            return self._copy_state()
+        return self._state
 
     @property
     def state(self) -> T:
@@ -780,6 +910,9 @@ class Flow(Generic[T], metaclass=FlowMeta):
         if inputs is not None and "id" not in inputs:
             self._initialize_state(inputs)
 
+        self._method_semaphore = (
+            asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        )
         tasks = [
             self._execute_start_method(start_method)
             for start_method in self._start_methods
@@ -826,41 +959,41 @@ class Flow(Generic[T], metaclass=FlowMeta):
         self, method_name: str, method: Callable, *args: Any, **kwargs: Any
     ) -> Any:
         try:
-            dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
-                kwargs or {}
-            )
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionStartedEvent(
-                    type="method_execution_started",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    params=dumped_params,
-                    state=self._copy_state(),
-                ),
-            )
+            # Events are only built when someone listens, and state snapshots
+            # only when a handler reads them
+            if crewai_event_bus.has_listeners(MethodExecutionStartedEvent):
+                dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
+                    kwargs or {}
+                )
+                crewai_event_bus.emit(
+                    self,
+                    MethodExecutionStartedEvent(
+                        type="method_execution_started",
+                        method_name=method_name,
+                        flow_name=self.__class__.__name__,
+                        params=dumped_params,
+                        state=self._event_state(MethodExecutionStartedEvent),
+                    ),
+                )
 
-            result = (
-                await method(*args, **kwargs)
-                if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
-            )
+            result = await self._run_method(method, *args, **kwargs)
 
             self._method_outputs.append(result)
             self._method_execution_counts[method_name] = (
                 self._method_execution_counts.get(method_name, 0) + 1
             )
 
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionFinishedEvent(
-                    type="method_execution_finished",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    state=self._copy_state(),
-                    result=result,
-                ),
-            )
+            if crewai_event_bus.has_listeners(MethodExecutionFinishedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    MethodExecutionFinishedEvent(
+                        type="method_execution_finished",
+                        method_name=method_name,
+                        flow_name=self.__class__.__name__,
+                        state=self._event_state(MethodExecutionFinishedEvent),
+                        result=result,
+                    ),
+                )
 
             return result
         except Exception as e:
@@ -875,6 +1008,23 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
             raise e
 
+    async def _run_method(self, method: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a flow method without blocking the event loop.
+
+        Coroutine methods are awaited, while synchronous methods run in
+        `method_executor` with a copy of the current context. Only the method
+        call counts towards `max_concurrency`, not the listeners it triggers.
+        """
+        async with self._method_semaphore or contextlib.nullcontext():
+            if asyncio.iscoroutinefunction(method):
+                return await method(*args, **kwargs)
+            context = contextvars.copy_context()
+            return await asyncio.get_running_loop().run_in_executor(
+                self.method_executor,
+                functools.partial(context.run, method, *args, **kwargs),
+            )
+
     async def _execute_listeners(self, trigger_method: str, result: Any) -> None:
         """
         Executes all listeners and routers triggered by a method completion.
@@ -963,33 +1113,12 @@ class Flow(Generic[T], metaclass=FlowMeta):
           * AND: Triggers only when all conditions are met
         - Maintains state for AND conditions using _pending_and_listeners
         - Separates router and normal listener evaluation
+        - Only visits listeners waiting on trigger_method, via the class's
+          precompiled TriggerIndex
         """
-        triggered = []
-        for listener_name, (condition_type, methods) in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
-                continue
-
-            if condition_type == "OR":
-                # If the trigger_method matches any in methods, run this
-                if trigger_method in methods:
-                    triggered.append(listener_name)
-            elif condition_type == "AND":
-                # Initialize pending methods for this listener if not already done
-                if listener_name not in self._pending_and_listeners:
-                    self._pending_and_listeners[listener_name] = set(methods)
-                # Remove the trigger method from pending methods
-                if trigger_method in self._pending_and_listeners[listener_name]:
-                    self._pending_and_listeners[listener_name].discard(trigger_method)
-
-                if not self._pending_and_listeners[listener_name]:
-                    # All required methods have been executed
-                    triggered.append(listener_name)
-                    # Reset pending methods for this listener
-                    self._pending_and_listeners.pop(listener_name, None)
-
-        return triggered
+        return self._trigger_index.triggered(
+            trigger_method, router_only, self._pending_and_listeners
+        )
 
     async def _execute_single_listener(self, listener_name: str, result: Any) -> None:
         """
@@ -0,0 +1,380 @@
+"""
+Batched, non-blocking SQLite implementation of flow state persistence.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+
+logger = logging.getLogger(__name__)
+
+# Number of flows whose latest snapshot is kept in memory to compute diffs
+DIFF_BASE_CACHE_SIZE = 128
+
+
+class BatchedSQLiteFlowPersistence(SQLiteFlowPersistence):
+    """SQLite flow persistence that writes on a background thread.
+
+    `save_state` only serializes the state and queues it, so checkpointing
+    does not hold up flow steps. A writer thread owns a single connection in
+    WAL mode and commits queued states in batches, keeping only the latest
+    state of each flow when it is saved repeatedly before a batch is
+    written. `load_state` sees queued states before they are written.
+
+    States can be stored as diffs against the previous checkpoint of the
+    same flow, and a retention policy bounds how many checkpoints are kept.
+    Checkpoints are written to the `flow_checkpoints` table, so the same
+    database file can be shared with `SQLiteFlowPersistence`.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        flush_interval: float = 0.05,
+        coalesce: bool = True,
+        store_diffs: bool = False,
+        full_snapshot_interval: int = 10,
+        max_checkpoints_per_flow: Optional[int] = None,
+    ):
+        """Initialize batched SQLite persistence.
+
+        Args:
+            db_path: Path to the SQLite database file. If not provided, uses
+                    db_storage_path() from utilities.paths.
+            flush_interval: Seconds the writer waits after a save to batch
+                    further saves into the same transaction.
+            coalesce: Whether to write only the latest of several saves of the
+                    same flow queued within one batch.
+            store_diffs: Whether to store states as diffs against the previous
+                    checkpoint of the same flow.
+            full_snapshot_interval: When storing diffs, write a full snapshot
+                    every this many checkpoints of a flow.
+            max_checkpoints_per_flow: Number of most recent checkpoints kept
+                    per flow. Keeps every checkpoint if None.
+
+        Raises:
+            ValueError: If db_path is invalid or an option is out of range
+        """
+        if flush_interval < 0:
+            raise ValueError("flush_interval must not be negative")
+        if full_snapshot_interval < 1:
+            raise ValueError("full_snapshot_interval must be at least 1")
+        if max_checkpoints_per_flow is not None and max_checkpoints_per_flow < 1:
+            raise ValueError("max_checkpoints_per_flow must be at least 1")
+
+        self.flush_interval = flush_interval
+        self.coalesce = coalesce
+        self.store_diffs = store_diffs
+        self.full_snapshot_interval = full_snapshot_interval
+        self.max_checkpoints_per_flow = max_checkpoints_per_flow
+        super().__init__(db_path)
+
+    def init_db(self) -> None:
+        """Open the pooled connection, create the tables and start the writer."""
+        self._writer = _CheckpointWriter(
+            self.db_path,
+            flush_interval=self.flush_interval,
+            coalesce=self.coalesce,
+            store_diffs=self.store_diffs,
+            full_snapshot_interval=self.full_snapshot_interval,
+            max_checkpoints_per_flow=self.max_checkpoints_per_flow,
+        )
+        # Flush queued states when the persistence is collected or at exit
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
+    def save_state(
+        self,
+        flow_uuid: str,
+        method_name: str,
+        state_data: Union[Dict[str, Any], BaseModel],
+    ) -> None:
+        """Queue the current flow state to be written to SQLite.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            method_name: Name of the method that just completed
+            state_data: Current state data (either dict or Pydantic model)
+        """
+        if isinstance(state_data, BaseModel):
+            state_dict = dict(state_data)  # Use dict() for better type compatibility
+        elif isinstance(state_data, dict):
+            state_dict = state_data
+        else:
+            raise ValueError(
+                f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
+            )
+
+        # Serialize now: the state keeps changing after this call returns
+        self._writer.enqueue(
+            flow_uuid,
+            method_name,
+            datetime.now(timezone.utc).isoformat(),
+            json.dumps(state_dict),
+        )
+
+    def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
+        """Load the most recent state for a given flow UUID.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+
+        Returns:
+            The most recent state as a dictionary, or None if no state exists
+        """
+        return self._writer.load(flow_uuid)
+
+    def flush(self) -> None:
+        """Block until every queued state has been written."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write queued states and stop the writer thread."""
+        self._finalizer()
+
+
+class _CheckpointWriter:
+    """Owns the connection and the background thread of a batched persistence.
+
+    Kept apart from `BatchedSQLiteFlowPersistence` so that the thread does
+    not keep the persistence alive.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        flush_interval: float,
+        coalesce: bool,
+        store_diffs: bool,
+        full_snapshot_interval: int,
+        max_checkpoints_per_flow: Optional[int],
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.coalesce = coalesce
+        self.store_diffs = store_diffs
+        self.full_snapshot_interval = full_snapshot_interval
+        self.max_checkpoints_per_flow = max_checkpoints_per_flow
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn_lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                """
+            CREATE TABLE IF NOT EXISTS flow_checkpoints (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flow_uuid TEXT NOT NULL,
+                method_name TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                state_json TEXT NOT NULL,
+                is_diff INTEGER NOT NULL DEFAULT 0
+            )
+            """
+            )
+            self._conn.execute(
+                """
+            CREATE INDEX IF NOT EXISTS idx_flow_checkpoints_uuid
+            ON flow_checkpoints(flow_uuid, id)
+            """
+            )
+
+        # Queued (flow_uuid, method_name, timestamp, state_json) checkpoints
+        self._pending: List[Tuple[str, str, str, str]] = []
+        self._latest_pending: Dict[str, str] = {}
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+
+        # Per flow: latest stored state and checkpoints written since the last
+        # full snapshot, used to decide between a diff and a full snapshot
+        self._diff_bases: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+
+        self._thread = threading.Thread(
+            target=self._run, name="crewai-flow-persistence", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(
+        self, flow_uuid: str, method_name: str, timestamp: str, state_json: str
+    ) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Flow persistence is closed")
+            if self.coalesce:
+                self._pending = [p for p in self._pending if p[0] != flow_uuid]
+            self._pending.append((flow_uuid, method_name, timestamp, state_json))
+            self._latest_pending[flow_uuid] = state_json
+            self._condition.notify_all()
+
+    def load(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
+        with self._condition:
+            pending = self._latest_pending.get(flow_uuid)
+        if pending is not None:
+            return json.loads(pending)
+
+        with self._conn_lock:
+            rows = self._conn.execute(
+                """
+            SELECT state_json, is_diff
+            FROM flow_checkpoints
+            WHERE flow_uuid = ? AND id >= COALESCE(
+                (SELECT MAX(id) FROM flow_checkpoints
+                 WHERE flow_uuid = ? AND is_diff = 0),
+                0
+            )
+            ORDER BY id
+            """,
+                (flow_uuid, flow_uuid),
+            ).fetchall()
+
+        if not rows:
+            return None
+        state: Dict[str, Any] = {}
+        for state_json, is_diff in rows:
+            data = json.loads(state_json)
+            state = _apply_diff(state, data) if is_diff else data
+        return state
+
+    def flush(self) -> None:
+        with self._condition:
+            self._flush_requested = bool(self._pending)
+            self._condition.notify_all()
+            while self._pending or self._writing:
+                self._condition.wait()
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        with self._conn_lock:
+            self._conn.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                # Give rapid consecutive saves a chance to join the batch
+                deadline = time.monotonic() + self.flush_interval
+                while not self._closed and not self._flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                self._flush_requested = False
+                batch, self._pending = self._pending, []
+                self._writing = True
+
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error(f"Failed to write flow checkpoints: {e}")
+                # Diffs must not build on states that were never written
+                for flow_uuid, _, _, _ in batch:
+                    self._diff_bases.pop(flow_uuid, None)
+            finally:
+                with self._condition:
+                    for flow_uuid, _, _, state_json in batch:
+                        if self._latest_pending.get(flow_uuid) == state_json:
+                            del self._latest_pending[flow_uuid]
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self, batch: List[Tuple[str, str, str, str]]) -> None:
+        rows = [self._checkpoint_row(*checkpoint) for checkpoint in batch]
+        with self._conn_lock, self._conn:
+            self._conn.executemany(
+                """
+            INSERT INTO flow_checkpoints (
+                flow_uuid,
+                method_name,
+                timestamp,
+                state_json,
+                is_diff
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+            if self.max_checkpoints_per_flow is not None:
+                for flow_uuid in dict.fromkeys(row[0] for row in rows):
+                    self._apply_retention(flow_uuid, self.max_checkpoints_per_flow)
+
+    def _checkpoint_row(
+        self, flow_uuid: str, method_name: str, timestamp: str, state_json: str
+    ) -> Tuple[str, str, str, str, int]:
+        if not self.store_diffs:
+            return (flow_uuid, method_name, timestamp, state_json, 0)
+
+        state = json.loads(state_json)
+        base = self._diff_bases.pop(flow_uuid, None)
+        if base is not None and base[1] < self.full_snapshot_interval:
+            previous, since_full = base
+            self._remember(flow_uuid, state, since_full + 1)
+            diff = _compute_diff(previous, state)
+            return (flow_uuid, method_name, timestamp, json.dumps(diff), 1)
+        self._remember(flow_uuid, state, 1)
+        return (flow_uuid, method_name, timestamp, state_json, 0)
+
+    def _remember(self, flow_uuid: str, state: Dict[str, Any], since_full: int) -> None:
+        self._diff_bases[flow_uuid] = (state, since_full)
+        if len(self._diff_bases) > DIFF_BASE_CACHE_SIZE:
+            # The evicted flow starts over with a full snapshot
+            self._diff_bases.popitem(last=False)
+
+    def _apply_retention(self, flow_uuid: str, keep: int) -> None:
+        """Delete all but the `keep` newest checkpoints of a flow.
+
+        Older checkpoints are kept back to the full snapshot the retained
+        diffs are based on.
+        """
+        row = self._conn.execute(
+            """
+        SELECT MAX(id) FROM flow_checkpoints
+        WHERE flow_uuid = ? AND is_diff = 0 AND id <= (
+            SELECT id FROM flow_checkpoints
+            WHERE flow_uuid = ?
+            ORDER BY id DESC
+            LIMIT 1 OFFSET ?
+        )
+        """,
+            (flow_uuid, flow_uuid, keep - 1),
+        ).fetchone()
+        if row and row[0] is not None:
+            self._conn.execute(
+                "DELETE FROM flow_checkpoints WHERE flow_uuid = ? AND id < ?",
+                (flow_uuid, row[0]),
+            )
+
+
+def _compute_diff(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the top-level keys set or removed between two states."""
+    return {
+        "set": {
+            key: value
+            for key, value in current.items()
+            if key not in previous or previous[key] != value
+        },
+        "unset": [key for key in previous if key not in current],
+    }
+
+
+def _apply_diff(state: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    state = {k: v for k, v in state.items() if k not in diff["unset"]}
+    state.update(diff["set"])
+    return state
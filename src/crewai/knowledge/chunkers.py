@@ -0,0 +1,214 @@
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List
+
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+# Number of characters buffered per unit of chunk_size before a streamed text is
+# split, generous enough for token-sized chunks.
+STREAM_BUFFER_FACTOR = 8
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str) -> Any:
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError(
+            "tiktoken is not installed. Please install it with: pip install 'crewai[embeddings]'"
+        )
+    return tiktoken.get_encoding(encoding_name)
+
+
+class _TokenLength:
+    """Counts tiktoken tokens; keeps its encoding name to identify it."""
+
+    def __init__(self, encoding_name: str) -> None:
+        self.encoding_name = encoding_name
+        self._encoding = _get_encoding(encoding_name)
+
+    def __call__(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def token_length(encoding_name: str = "cl100k_base") -> Callable[[str], int]:
+    """Return a length function that counts tiktoken tokens instead of characters."""
+    return _TokenLength(encoding_name)
+
+
+class BaseChunker(BaseModel, ABC):
+    """Splits text into chunks of at most `chunk_size`, as measured by `length_function`.
+
+    Set a chunker on a knowledge source to replace its fixed-width character
+    slicing.
+    """
+
+    chunk_size: int = Field(default=4000, gt=0, description="Maximum chunk length.")
+    chunk_overlap: int = Field(
+        default=200, ge=0, description="Length shared by consecutive chunks."
+    )
+    length_function: Callable[[str], int] = Field(
+        default=len,
+        exclude=True,
+        description="Measures text length, e.g. token_length() to size chunks in tokens.",
+    )
+
+    @model_validator(mode="after")
+    def validate_overlap(self) -> "BaseChunker":
+        if self.chunk_overlap >= self.chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        return self
+
+    def length_function_id(self) -> str:
+        """Identify `length_function`, which `model_dump()` leaves out."""
+        function = self.length_function
+        name = getattr(function, "__qualname__", type(function).__qualname__)
+        function_id = f"{getattr(function, '__module__', None)}.{name}"
+        encoding_name = getattr(function, "encoding_name", None)
+        return f"{function_id}:{encoding_name}" if encoding_name else function_id
+
+    def chunk(self, text: str) -> List[str]:
+        """Split text into chunks, dropping surrounding whitespace."""
+        return [chunk.strip() for chunk in self._split_text(text) if chunk.strip()]
+
+    def chunk_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Chunk text arriving in pieces while buffering a bounded amount of it.
+
+        Once enough text is buffered, every chunk but the last is emitted; the
+        last one is kept so it can grow with the text that follows.
+        """
+        buffer = ""
+        threshold = self.chunk_size * STREAM_BUFFER_FACTOR
+        for piece in pieces:
+            buffer += piece
+            if len(buffer) < threshold:
+                continue
+            chunks = self._split_text(buffer)
+            for chunk in chunks[:-1]:
+                if chunk.strip():
+                    yield chunk.strip()
+            buffer = chunks[-1] if chunks else ""
+        yield from self.chunk(buffer)
+
+    @abstractmethod
+    def _split_text(self, text: str) -> List[str]:
+        """Split text into chunks that concatenate back to it, save for overlaps."""
+
+    def _merge(self, pieces: List[str]) -> List[str]:
+        """Pack consecutive pieces into chunks, repeating trailing pieces as overlap."""
+        chunks: List[str] = []
+        current: List[str] = []
+        total = 0
+        for piece in pieces:
+            length = self.length_function(piece)
+            if current and total + length > self.chunk_size:
+                chunks.append("".join(current))
+                while current and (
+                    total > self.chunk_overlap or total + length > self.chunk_size
+                ):
+                    total -= self.length_function(current.pop(0))
+            current.append(piece)
+            total += length
+        if current:
+            chunks.append("".join(current))
+        return chunks
+
+
+class RecursiveChunker(BaseChunker):
+    """Splits on the coarsest separator that keeps chunks within `chunk_size`.
+
+    Text is split on paragraphs first, then lines, sentences and words, and
+    only falls back to cutting characters for pieces without any separator.
+    """
+
+    separators: List[str] = Field(
+        default_factory=lambda: ["\n\n", "\n", ". ", " ", ""],
+        description="Separators to split on, from coarsest to finest.",
+    )
+
+    def _split_text(self, text: str) -> List[str]:
+        return self._split(text, self.separators)
+
+    def _split(self, text: str, separators: List[str]) -> List[str]:
+        separator, remaining = "", []
+        for index, candidate in enumerate(separators):
+            if candidate == "" or candidate in text:
+                separator, remaining = candidate, separators[index + 1 :]
+                break
+
+        if separator:
+            parts = text.split(separator)
+            pieces = [part + separator for part in parts[:-1]] + [parts[-1]]
+        else:
+            pieces = list(text)
+
+        chunks: List[str] = []
+        fitting: List[str] = []
+        for piece in pieces:
+            if self.length_function(piece) <= self.chunk_size:
+                fitting.append(piece)
+                continue
+            chunks.extend(self._merge(fitting))
+            fitting = []
+            if remaining:
+                chunks.extend(self._split(piece, remaining))
+            else:
+                chunks.append(piece)
+        chunks.extend(self._merge(fitting))
+        return chunks
+
+
+class SentenceChunker(BaseChunker):
+    """Packs whole sentences into chunks; overly long sentences are split on words."""
+
+    def _split_text(self, text: str) -> List[str]:
+        sentences = []
+        start = 0
+        for match in SENTENCE_END_PATTERN.finditer(text):
+            sentences.append(text[start : match.end()])
+            start = match.end()
+        sentences.append(text[start:])
+
+        words = RecursiveChunker(
+            chunk_size=self.chunk_size,
+            chunk_overlap=0,
+            length_function=self.length_function,
+            separators=[" ", ""],
+        )
+        pieces: List[str] = []
+        for sentence in sentences:
+            if self.length_function(sentence) <= self.chunk_size:
+                pieces.append(sentence)
+            else:
+                pieces.extend(words._split_text(sentence))
+        return self._merge(pieces)
+
+
+class TokenChunker(BaseChunker):
+    """Cuts text into windows of exactly `chunk_size` tokens of a tiktoken encoding.
+
+    Requires the `tiktoken` package.
+    """
+
+    chunk_size: int = Field(default=512, gt=0, description="Tokens per chunk.")
+    chunk_overlap: int = Field(
+        default=50, ge=0, description="Tokens shared by consecutive chunks."
+    )
+    encoding_name: str = Field(
+        default="cl100k_base", description="Name of the tiktoken encoding."
+    )
+
+    _encoding: Any = PrivateAttr(default=None)
+
+    def _split_text(self, text: str) -> List[str]:
+        if self._encoding is None:
+            self._encoding = _get_encoding(self.encoding_name)
+        tokens = self._encoding.encode(text, disallowed_special=())
+        step = self.chunk_size - self.chunk_overlap
+        return [
+            self._encoding.decode(tokens[i : i + self.chunk_size])
+            for i in range(0, len(tokens), step)
+        ]
@@ -1,5 +1,7 @@
+import hashlib
+import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -9,6 +11,10 @@ from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 os.environ["TOKENIZERS_PARALLELISM"] = "false"  # removes logging from fastembed
 
 
+def _hash(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value).encode()).hexdigest()
+
+
 class Knowledge(BaseModel):
     """
     Knowledge is a collection of sources and setup for the vector store to save and query relevant context.
@@ -43,11 +49,17 @@ class Knowledge(BaseModel):
         self.storage.initialize_knowledge_storage()
 
     def query(
-        self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
+        self,
+        query: List[str],
+        results_limit: int = 3,
+        score_threshold: float = 0.35,
+        search_mode: str = "vector",
+        rrf_k: int = 60,
     ) -> List[Dict[str, Any]]:
         """
         Query across all knowledge sources to find the most relevant information.
-        Returns the top_k most relevant chunks.
+        Returns the top_k most relevant chunks. See `KnowledgeConfig` for the
+        search modes.
 
         Raises:
             ValueError: If storage is not initialized.
@@ -55,21 +67,92 @@ class Knowledge(BaseModel):
         if self.storage is None:
             raise ValueError("Storage is not initialized.")
 
+        # Only pass the hybrid search options when they are used, so that
+        # storages written against the older `search` signature keep working
+        search_options: Dict[str, Any] = {}
+        if search_mode != "vector":
+            search_options = {"search_mode": search_mode, "rrf_k": rrf_k}
         results = self.storage.search(
             query,
             limit=results_limit,
             score_threshold=score_threshold,
+            **search_options,
         )
         return results
 
     def add_sources(self):
+        """Ingest the sources, skipping those already ingested unchanged.
+
+        When the storage keeps a manifest, each source's chunk IDs are recorded
+        under its fingerprint. Unchanged sources are not chunked or embedded
+        again. When a file source changes, the chunks it no longer produces
+        are deleted from the collection. Chunks recorded by other `Knowledge`
+        instances sharing the collection are left alone.
+        """
         try:
+            manifest = getattr(self.storage, "manifest", None)
+            if manifest is None:
+                for source in self.sources:
+                    source.storage = self.storage
+                    source.add()
+                return
+
+            collection = self.storage.collection.name
+            recorded = manifest.load(collection)
+            entries: Dict[str, Tuple[str, List[str]]] = {}
             for source in self.sources:
                 source.storage = self.storage
+                settings = self._settings(source)
+                content = source.fingerprint()
+                fingerprint = None if content is None else _hash([settings, content])
+                paths = getattr(source, "safe_file_paths", None)
+                source_key = (
+                    _hash([settings, sorted(str(path) for path in paths)])
+                    if paths
+                    else fingerprint
+                )
+                if source_key in recorded and recorded[source_key][0] == fingerprint:
+                    continue
                 source.add()
+                chunk_ids = list(
+                    dict.fromkeys(
+                        source.saved_chunk_ids
+                        or [self.storage.document_id(c) for c in source.chunks]
+                    )
+                )
+                if fingerprint is None:
+                    fingerprint = _hash(sorted(chunk_ids))
+                entries[source_key or fingerprint] = (fingerprint, chunk_ids)
+
+            superseded = {
+                chunk_id
+                for source_key in entries.keys() & recorded.keys()
+                for chunk_id in recorded[source_key][1]
+            }
+            # Chunks shared with any other source, ours or another owner's,
+            # stay in the collection
+            referenced = {
+                chunk_id
+                for _, chunk_ids in {**recorded, **entries}.values()
+                for chunk_id in chunk_ids
+            }
+            self.storage.delete(sorted(superseded - referenced))
+            manifest.update(collection, entries)
         except Exception as e:
             raise e
 
+    def _settings(self, source: BaseKnowledgeSource) -> List[Any]:
+        """Everything besides its content that determines a source's chunks."""
+        return [
+            type(source).__name__,
+            source.chunk_size,
+            source.chunk_overlap,
+            type(source.chunker).__name__ if source.chunker else None,
+            source.chunker.model_dump(mode="json") if source.chunker else None,
+            source.chunker.length_function_id() if source.chunker else None,
+            getattr(self.storage, "embedder_key", None),
+        ]
+
     def reset(self) -> None:
         if self.storage:
             self.storage.reset()
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -7,6 +9,9 @@ class KnowledgeConfig(BaseModel):
     Args:
         results_limit (int): The number of relevant documents to return.
         score_threshold (float): The minimum score for a document to be considered relevant.
+        search_mode (str): "vector" for embedding similarity search, or "hybrid" to fuse it
+            with BM25 keyword search.
+        rrf_k (int): Rank constant of the reciprocal rank fusion used by hybrid search.
     """
 
     results_limit: int = Field(default=3, description="The number of results to return")
@@ -14,3 +19,12 @@ class KnowledgeConfig(BaseModel):
         default=0.35,
         description="The minimum score for a result to be considered relevant",
     )
+    search_mode: Literal["vector", "hybrid"] = Field(
+        default="vector",
+        description="Rank by embedding similarity only, or fuse it with BM25 keyword ranking",
+    )
+    rrf_k: int = Field(
+        default=60,
+        gt=0,
+        description="Rank constant of the reciprocal rank fusion; higher values flatten rank differences",
+    )
@@ -1,15 +1,31 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pydantic import Field, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.utils.knowledge_utils import batched, hash_files
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.knowledge_events import (
+    KnowledgeFileIngestionCompletedEvent,
+    KnowledgeFileIngestionFailedEvent,
+)
 from crewai.utilities.logger import Logger
 
 
+def _parse_file(source: "BaseFileKnowledgeSource", path: Path) -> str:
+    """Read a whole file with the source's parser; runs in a worker process."""
+    return "".join(source.iter_file(path))
+
+
+def _future_pieces(future: "Future[str]") -> Iterator[str]:
+    yield future.result()
+
+
 class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     """Base class for knowledge sources that load content from files."""
 
@@ -24,6 +40,18 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     content: Dict[Path, str] = Field(init=False, default_factory=dict)
     storage: Optional[KnowledgeStorage] = Field(default=None)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    stream: bool = Field(
+        default=False,
+        description="Read files piece by piece while adding them instead of loading their content up front.",
+    )
+    batch_size: int = Field(
+        default=64, gt=0, description="Number of chunks embedded and saved at once."
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Number of worker processes that parse files while adding them. Files are parsed in this process when None.",
+    )
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -43,13 +71,106 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         """Post-initialization method to load content."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        defer_parsing = self.stream or self.max_workers is not None
+        if not defer_parsing:
+            self.content = self.load_content()
+        elif not self._reads_files_incrementally():
+            raise ValueError(
+                f"{type(self).__name__} does not support stream=True or max_workers"
+            )
 
     @abstractmethod
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess file content. Should be overridden by subclasses. Assume that the file path is relative to the project root in the knowledge directory."""
         pass
 
+    def iter_file(self, path: Path) -> Iterator[str]:
+        """Yield the text of a file piece by piece, e.g. per page or row.
+
+        Sources that can read their files incrementally override this to
+        support `stream=True`. Sources that do not are added from the content
+        `load_content` returns.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming its files."
+        )
+
+    def add(self) -> None:
+        """
+        Chunk each file as its text is read and save the chunks in batches of
+        `batch_size`. Streamed sources do not keep their chunks in memory.
+
+        With `max_workers`, files are parsed in a process pool while the chunks
+        of the files parsed so far are embedded and saved. An event is emitted
+        as each file completes or fails.
+        """
+        if not self._reads_files_incrementally() and not self.content:
+            self.content = self.load_content()
+        files_total = (
+            len(self.safe_file_paths)
+            if self._reads_files_incrementally()
+            else len(self.content)
+        )
+        for files_completed, (path, pieces) in enumerate(self._parsed_files(), start=1):
+            try:
+                chunk_count = 0
+                chunks = self._chunk_stream(pieces)
+                for batch in batched(chunks, self.batch_size):
+                    if not self.stream:
+                        self.chunks.extend(batch)
+                    self._save_chunks(batch)
+                    chunk_count += len(batch)
+            except Exception as e:
+                crewai_event_bus.emit(
+                    self,
+                    event=KnowledgeFileIngestionFailedEvent(
+                        file_path=str(path), error=str(e)
+                    ),
+                )
+                raise
+            crewai_event_bus.emit(
+                self,
+                event=KnowledgeFileIngestionCompletedEvent(
+                    file_path=str(path),
+                    chunk_count=chunk_count,
+                    files_completed=files_completed,
+                    files_total=files_total,
+                ),
+            )
+
+    def _parsed_files(self) -> Iterator[Tuple[Path, Iterable[str]]]:
+        """Yield each file with its text, in completion order when parsed in a pool."""
+        if not self._reads_files_incrementally():
+            # Without `iter_file`, files are added from the loaded content,
+            # however the source keys it
+            for path, text in self.content.items():
+                yield path, [text]
+            return
+
+        pending = [path for path in self.safe_file_paths if path not in self.content]
+        if self.max_workers is None or len(pending) < 2:
+            for path in self.safe_file_paths:
+                if path in self.content:
+                    yield path, [self.content[path]]
+                else:
+                    yield path, self.iter_file(path)
+            return
+
+        parser = self.model_copy(update={"storage": None, "content": {}, "chunks": []})
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(_parse_file, parser, path): path for path in pending}
+            try:
+                for path in self.safe_file_paths:
+                    if path in self.content:
+                        yield path, [self.content[path]]
+                for future in as_completed(futures):
+                    yield futures[future], _future_pieces(future)
+            finally:
+                pool.shutdown(cancel_futures=True)
+
+    def _reads_files_incrementally(self) -> bool:
+        return type(self).iter_file is not BaseFileKnowledgeSource.iter_file
+
     def validate_content(self):
         """Validate the paths."""
         for path in self.safe_file_paths:
@@ -67,12 +188,9 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
                     color="red",
                 )
 
-    def _save_documents(self):
-        """Save the documents to the storage."""
-        if self.storage:
-            self.storage.save(self.chunks)
-        else:
-            raise ValueError("No storage found to save documents.")
+    def fingerprint(self) -> Optional[str]:
+        """Hash the source files."""
+        return hash_files(self.safe_file_paths)
 
     def convert_to_path(self, path: Union[Path, str]) -> Path:
         """Convert a path to a Path object."""
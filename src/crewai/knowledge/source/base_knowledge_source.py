@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
+from crewai.knowledge.chunkers import BaseChunker
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.utils.knowledge_utils import chunk_stream
 
 
 class BaseKnowledgeSource(BaseModel, ABC):
@@ -19,6 +21,12 @@ class BaseKnowledgeSource(BaseModel, ABC):
     storage: Optional[KnowledgeStorage] = Field(default=None)
     metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
     collection_name: Optional[str] = Field(default=None)
+    chunker: Optional[BaseChunker] = Field(
+        default=None,
+        description="Strategy used to split content into chunks, e.g. RecursiveChunker. Content is cut every chunk_size characters when None.",
+    )
+
+    _saved_chunk_ids: List[str] = PrivateAttr(default_factory=list)
 
     @abstractmethod
     def validate_content(self) -> Any:
@@ -30,23 +38,49 @@ class BaseKnowledgeSource(BaseModel, ABC):
         """Process content, chunk it, compute embeddings, and save them."""
         pass
 
+    def fingerprint(self) -> Optional[str]:
+        """Return a hash of the source content, or None if it cannot be computed cheaply.
+
+        Sources with a fingerprint are skipped by `Knowledge.add_sources` when
+        they were already ingested unchanged. Sources without one are chunked
+        again, but their unchanged chunks are not embedded again.
+        """
+        return None
+
     def get_embeddings(self) -> List[np.ndarray]:
         """Return the list of embeddings for the chunks."""
         return self.chunk_embeddings
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
+        if self.chunker:
+            return self.chunker.chunk(text)
         return [
             text[i : i + self.chunk_size]
             for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
         ]
 
+    def _chunk_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Chunk text arriving in pieces, like `_chunk_text` on the whole text."""
+        if self.chunker:
+            return self.chunker.chunk_stream(pieces)
+        return chunk_stream(pieces, self.chunk_size, self.chunk_overlap)
+
+    @property
+    def saved_chunk_ids(self) -> List[str]:
+        """IDs of the chunks this source has saved to its storage."""
+        return self._saved_chunk_ids
+
     def _save_documents(self):
         """
         Save the documents to the storage.
         This method should be called after the chunks and embeddings are generated.
         """
-        if self.storage:
-            self.storage.save(self.chunks)
-        else:
+        self._save_chunks(self.chunks)
+
+    def _save_chunks(self, chunks: List[str]) -> None:
+        """Save a batch of chunks to the storage and record their IDs."""
+        if not self.storage:
             raise ValueError("No storage found to save documents.")
+        self.storage.save(chunks)
+        self._saved_chunk_ids.extend(KnowledgeStorage.document_id(c) for c in chunks)
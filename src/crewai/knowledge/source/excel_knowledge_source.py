@@ -5,6 +5,7 @@ from urllib.parse import urlparse
 from pydantic import Field, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.utils.knowledge_utils import hash_files
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 
@@ -100,6 +101,10 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
         self.validate_content()
         self.content = self._load_content()
 
+    def fingerprint(self) -> Optional[str]:
+        """Hash the source files."""
+        return hash_files(self.safe_file_paths)
+
     def _load_content(self) -> Dict[Path, Dict[str, str]]:
         """Load and preprocess Excel file content from multiple sheets.
 
@@ -160,10 +165,3 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
         new_chunks = self._chunk_text(content_str)
         self.chunks.extend(new_chunks)
         self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
@@ -9,21 +9,22 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess PDF file content."""
-        pdfplumber = self._import_pdfplumber()
-
         content = {}
-
         for path in self.safe_file_paths:
-            text = ""
             path = self.convert_to_path(path)
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            content[path] = text
+            content[path] = "".join(self.iter_file(path))
         return content
 
+    def iter_file(self, path: Path) -> Iterator[str]:
+        """Yield the text of each page, releasing pages once they are read."""
+        pdfplumber = self._import_pdfplumber()
+        with pdfplumber.open(path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                page.close()
+                if page_text:
+                    yield page_text + "\n"
+
     def _import_pdfplumber(self):
         """Dynamically import pdfplumber."""
         try:
@@ -34,20 +35,3 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
             raise ImportError(
                 "pdfplumber is not installed. Please install it with: pip install pdfplumber"
             )
-
-    def add(self) -> None:
-        """
-        Add PDF file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import hashlib
+from typing import Optional
 
 from pydantic import Field
 
@@ -20,15 +21,12 @@ class StringKnowledgeSource(BaseKnowledgeSource):
         if not isinstance(self.content, str):
             raise ValueError("StringKnowledgeSource only accepts string content")
 
+    def fingerprint(self) -> Optional[str]:
+        """Hash the string content."""
+        return hashlib.sha256(self.content.encode("utf-8")).hexdigest()
+
     def add(self) -> None:
         """Add string content to the knowledge source, chunk it, compute embeddings, and save them."""
         new_chunks = self._chunk_text(self.content)
         self.chunks.extend(new_chunks)
         self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
@@ -16,19 +16,7 @@ class TextFileKnowledgeSource(BaseFileKnowledgeSource):
                 content[path] = f.read()
         return content
 
-    def add(self) -> None:
-        """
-        Add text file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+    def iter_file(self, path: Path) -> Iterator[str]:
+        """Read a text file in blocks of about a megabyte."""
+        with open(path, "r", encoding="utf-8") as f:
+            yield from iter(lambda: f.read(1 << 20), "")
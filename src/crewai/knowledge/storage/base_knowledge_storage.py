@@ -12,6 +12,8 @@ class BaseKnowledgeStorage(ABC):
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        search_mode: str = "vector",
+        rrf_k: int = 60,
     ) -> List[Dict[str, Any]]:
         """Search for documents in the knowledge base."""
         pass
@@ -0,0 +1,140 @@
+import logging
+import re
+import sqlite3
+from pathlib import Path
+from typing import List, Tuple
+
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+
+logger = logging.getLogger(__name__)
+
+# Matches the terms SQLite's default unicode61 tokenizer indexes, so query
+# terms line up with indexed ones (e.g. "ERR-4012" -> "err", "4012").
+TERM_PATTERN = re.compile(r"[^\W_]+")
+
+
+class KnowledgeLexicalIndex:
+    """Full-text index of knowledge chunks, ranked with BM25.
+
+    Kept next to the vector collections in an SQLite FTS5 table, one row per
+    stored chunk. It answers keyword-heavy queries (IDs, error codes, SKUs)
+    that embeddings tend to miss, and is fused with vector results by
+    `KnowledgeStorage.search` in hybrid mode.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_lexical_index
+                    USING fts5(collection UNINDEXED, doc_id UNINDEXED, document)
+                    """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def upsert(self, collection: str, ids: List[str], documents: List[str]) -> None:
+        """Index documents under their IDs, replacing any previous version."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._delete(conn, collection, ids)
+                conn.executemany(
+                    """
+                    INSERT INTO knowledge_lexical_index (collection, doc_id, document)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(collection, i, d) for i, d in zip(ids, documents)],
+                )
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def replace(self, collection: str, ids: List[str], documents: List[str]) -> None:
+        """Replace every document indexed for a collection."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "DELETE FROM knowledge_lexical_index WHERE collection = ?",
+                    (collection,),
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO knowledge_lexical_index (collection, doc_id, document)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(collection, i, d) for i, d in zip(ids, documents)],
+                )
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def delete(self, collection: str, ids: List[str]) -> None:
+        """Remove documents from the index by ID."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._delete(conn, collection, ids)
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def count(self, collection: str) -> int:
+        """Return the number of documents indexed for a collection."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM knowledge_lexical_index WHERE collection = ?",
+                    (collection,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(DatabaseError.format_error(DatabaseError.LOAD_ERROR, e))
+            return 0
+        return row[0]
+
+    def search(
+        self, collection: str, query: str, limit: int
+    ) -> List[Tuple[str, float]]:
+        """Return up to `limit` (doc_id, score) pairs, best match first.
+
+        Documents matching any term of the query are ranked by BM25; higher
+        scores are better.
+        """
+        terms = dict.fromkeys(TERM_PATTERN.findall(query.lower()))
+        if not terms:
+            return []
+        match = " OR ".join(f'"{term}"' for term in terms)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT doc_id, bm25(knowledge_lexical_index) AS rank
+                    FROM knowledge_lexical_index
+                    WHERE knowledge_lexical_index MATCH ? AND collection = ?
+                    ORDER BY rank
+                    LIMIT ?
+                    """,
+                    (match, collection, limit),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(DatabaseError.format_error(DatabaseError.LOAD_ERROR, e))
+            return []
+        # SQLite reports BM25 negated so that ascending order ranks best first
+        return [(doc_id, -rank) for doc_id, rank in rows]
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, collection: str, ids: List[str]) -> None:
+        conn.executemany(
+            "DELETE FROM knowledge_lexical_index WHERE collection = ? AND doc_id = ?",
+            [(collection, doc_id) for doc_id in ids],
+        )
@@ -0,0 +1,88 @@
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+
+logger = logging.getLogger(__name__)
+
+
+class KnowledgeManifest:
+    """Records which chunks each ingested knowledge source produced.
+
+    Entries are kept per collection and per source key, and map the source's
+    fingerprint (its content hash, chunking parameters and embedder) to the
+    IDs of the chunks it was split into. `Knowledge.add_sources` uses it to
+    skip unchanged sources and to evict the chunks a changed source no longer
+    produces. Several `Knowledge` instances can share a collection, so each
+    one only updates the entries of its own sources.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS knowledge_source_manifest (
+                        collection TEXT,
+                        source_key TEXT,
+                        fingerprint TEXT,
+                        chunk_ids JSON,
+                        PRIMARY KEY (collection, source_key)
+                    )
+                    """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def load(self, collection: str) -> Dict[str, Tuple[str, List[str]]]:
+        """Return the fingerprint and chunk IDs recorded for each source key."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT source_key, fingerprint, chunk_ids
+                    FROM knowledge_source_manifest
+                    WHERE collection = ?
+                    """,
+                    (collection,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(DatabaseError.format_error(DatabaseError.LOAD_ERROR, e))
+            return {}
+        return {
+            source_key: (fingerprint, json.loads(chunk_ids))
+            for source_key, fingerprint, chunk_ids in rows
+        }
+
+    def update(
+        self, collection: str, entries: Dict[str, Tuple[str, List[str]]]
+    ) -> None:
+        """Insert or replace the entries of the given source keys."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO knowledge_source_manifest
+                        (collection, source_key, fingerprint, chunk_ids)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (collection, source_key, fingerprint, json.dumps(chunk_ids))
+                        for source_key, (fingerprint, chunk_ids) in entries.items()
+                    ],
+                )
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
@@ -1,20 +1,23 @@
 import contextlib
 import hashlib
 import io
+import json
 import logging
 import os
 import shutil
+import weakref
 from typing import Any, Dict, List, Optional, Union
 
 import chromadb
 import chromadb.errors
 from chromadb.api import ClientAPI
 from chromadb.api.types import OneOrMany
-from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.knowledge_lexical_index import KnowledgeLexicalIndex
+from crewai.knowledge.storage.knowledge_manifest import KnowledgeManifest
 from crewai.utilities import EmbeddingConfigurator
-from crewai.utilities.chromadb import sanitize_collection_name
+from crewai.utilities.chromadb import chroma_registry, sanitize_collection_name
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
@@ -37,6 +40,11 @@ def suppress_logging(
     logger.setLevel(original_level)
 
 
+# Each ranking contributes this many candidates per requested result to hybrid
+# search, so that documents ranked low by one ranking can still be fused in.
+HYBRID_CANDIDATE_FACTOR = 4
+
+
 class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
@@ -45,7 +53,10 @@ class KnowledgeStorage(BaseKnowledgeStorage):
 
     collection: Optional[chromadb.Collection] = None
     collection_name: Optional[str] = "knowledge"
+    _client_finalizer: Optional[weakref.finalize] = None
     app: Optional[ClientAPI] = None
+    manifest: Optional[KnowledgeManifest] = None
+    lexical_index: Optional[KnowledgeLexicalIndex] = None
 
     def __init__(
         self,
@@ -53,6 +64,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         collection_name: Optional[str] = None,
     ):
         self.collection_name = collection_name
+        self._lexical_index_synced = False
         self._set_embedder_config(embedder)
 
     def search(
@@ -61,6 +73,28 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        search_mode: str = "vector",
+        rrf_k: int = 60,
+    ) -> List[Dict[str, Any]]:
+        """Search the collection.
+
+        In "vector" mode, documents are ranked by embedding similarity. In
+        "hybrid" mode, the vector ranking is fused with a BM25 keyword ranking
+        using reciprocal rank fusion, and each result's score is its fused
+        score.
+        """
+        if search_mode == "hybrid":
+            return self._hybrid_search(query, limit, filter, score_threshold, rrf_k)
+        if search_mode != "vector":
+            raise ValueError(f"Unsupported search mode: {search_mode}")
+        return self._vector_search(query, limit, filter, score_threshold)
+
+    def _vector_search(
+        self,
+        query: List[str],
+        limit: int,
+        filter: Optional[dict],
+        score_threshold: float,
     ) -> List[Dict[str, Any]]:
         with suppress_logging():
             if self.collection:
@@ -83,15 +117,78 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             else:
                 raise Exception("Collection not initialized")
 
+    def _hybrid_search(
+        self,
+        query: List[str],
+        limit: int,
+        filter: Optional[dict],
+        score_threshold: float,
+        rrf_k: int,
+    ) -> List[Dict[str, Any]]:
+        if not self.collection or not self.lexical_index:
+            raise Exception("Collection not initialized")
+        self._sync_lexical_index()
+
+        candidates = limit * HYBRID_CANDIDATE_FACTOR
+        vector_results = self._vector_search(query, candidates, filter, score_threshold)
+        keyword_ids = [
+            doc_id
+            for doc_id, _ in self.lexical_index.search(
+                self.collection.name, " ".join(query), candidates
+            )
+        ]
+
+        scores: Dict[str, float] = {}
+        for ranking in ([r["id"] for r in vector_results], keyword_ids):
+            for rank, doc_id in enumerate(ranking):
+                scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (rrf_k + rank + 1)
+        ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+
+        found = {r["id"]: r for r in vector_results}
+        keyword_only = [doc_id for doc_id in ranked[:limit] if doc_id not in found]
+        if keyword_only:
+            fetched = self.collection.get(
+                ids=keyword_only,
+                where=filter,
+                include=["documents", "metadatas"],
+            )
+            for doc_id, document, metadata in zip(
+                fetched["ids"], fetched["documents"] or [], fetched["metadatas"] or []
+            ):
+                found[doc_id] = {
+                    "id": doc_id,
+                    "metadata": metadata,
+                    "context": document,
+                }
+
+        return [
+            {**found[doc_id], "score": scores[doc_id]}
+            for doc_id in ranked
+            if doc_id in found
+        ][:limit]
+
+    def _sync_lexical_index(self) -> None:
+        """Rebuild the lexical index once if it is out of step with the collection.
+
+        Collections ingested before the index existed are indexed on their
+        first hybrid search.
+        """
+        if self._lexical_index_synced or not self.collection or not self.lexical_index:
+            return
+        name = self.collection.name
+        if self.lexical_index.count(name) != self.collection.count():
+            stored = self.collection.get(include=["documents"])
+            self.lexical_index.replace(name, stored["ids"], stored["documents"] or [])
+        self._lexical_index_synced = True
+
     def initialize_knowledge_storage(self):
         base_path = os.path.join(db_storage_path(), "knowledge")
-        chroma_client = chromadb.PersistentClient(
-            path=base_path,
-            settings=Settings(allow_reset=True),
+        self._acquire_client(base_path)
+        self.manifest = KnowledgeManifest(os.path.join(base_path, "manifest.db"))
+        self.lexical_index = KnowledgeLexicalIndex(
+            os.path.join(base_path, "lexical_index.db")
         )
 
-        self.app = chroma_client
-
         try:
             collection_name = (
                 f"knowledge_{self.collection_name}"
@@ -99,9 +196,11 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 else "knowledge"
             )
             if self.app:
-                self.collection = self.app.get_or_create_collection(
-                    name=sanitize_collection_name(collection_name),
-                    embedding_function=self.embedder,
+                self.collection = chroma_registry.get_collection(
+                    base_path,
+                    sanitize_collection_name(collection_name),
+                    self.embedder,
+                    self.embedder_key,
                 )
             else:
                 raise Exception("Vector Database Client not initialized")
@@ -111,15 +210,29 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     def reset(self):
         base_path = os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
         if not self.app:
-            self.app = chromadb.PersistentClient(
-                path=base_path,
-                settings=Settings(allow_reset=True),
-            )
+            self._acquire_client(base_path)
 
         self.app.reset()
+        chroma_registry.invalidate(base_path)
         shutil.rmtree(base_path)
+        self._release_client()
         self.app = None
         self.collection = None
+        self.manifest = None
+        self.lexical_index = None
+        self._lexical_index_synced = False
+
+    def _acquire_client(self, path: str) -> None:
+        """Acquire the pooled client for `path`, released when this storage is."""
+        self._release_client()
+        self.app = chroma_registry.acquire(path, allow_reset=True)
+        self._client_finalizer = weakref.finalize(self, chroma_registry.release, path)
+
+    def _release_client(self) -> None:
+        """Release the pooled client, if one was acquired."""
+        if self._client_finalizer:
+            self._client_finalizer()
+            self._client_finalizer = None
 
     def save(
         self,
@@ -135,7 +248,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
 
             # Generate IDs and create a mapping of id -> (document, metadata)
             for idx, doc in enumerate(documents):
-                doc_id = hashlib.sha256(doc.encode("utf-8")).hexdigest()
+                doc_id = self.document_id(doc)
                 doc_metadata = None
                 if metadata is not None:
                     if isinstance(metadata, list):
@@ -155,6 +268,28 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 filtered_metadata.append(meta)
                 filtered_ids.append(doc_id)
 
+            # Skip documents already stored with the same metadata, so that
+            # unchanged chunks are not embedded again
+            stored = self.collection.get(ids=filtered_ids, include=["metadatas"])
+            stored_metadata = dict(zip(stored["ids"], stored["metadatas"] or []))
+            unchanged = {
+                doc_id
+                for doc_id, meta in zip(filtered_ids, filtered_metadata)
+                if doc_id in stored_metadata
+                and (stored_metadata[doc_id] or None) == meta
+            }
+            if unchanged:
+                kept = [
+                    i
+                    for i, doc_id in enumerate(filtered_ids)
+                    if doc_id not in unchanged
+                ]
+                filtered_docs = [filtered_docs[i] for i in kept]
+                filtered_metadata = [filtered_metadata[i] for i in kept]
+                filtered_ids = [filtered_ids[i] for i in kept]
+            if not filtered_ids:
+                return
+
             # If we have no metadata at all, set it to None
             final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
                 None if all(m is None for m in filtered_metadata) else filtered_metadata
@@ -165,6 +300,10 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 metadatas=final_metadata,
                 ids=filtered_ids,
             )
+            if self.lexical_index:
+                self.lexical_index.upsert(
+                    self.collection.name, filtered_ids, filtered_docs
+                )
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
                 "error",
@@ -180,14 +319,22 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
             raise
 
-    def _create_default_embedding_function(self):
-        from chromadb.utils.embedding_functions.openai_embedding_function import (
-            OpenAIEmbeddingFunction,
-        )
+    def delete(self, ids: List[str]) -> None:
+        """Remove documents from the collection by ID."""
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        if ids:
+            self.collection.delete(ids=ids)
+            if self.lexical_index:
+                self.lexical_index.delete(self.collection.name, ids)
 
-        return OpenAIEmbeddingFunction(
-            api_key=os.getenv("OPENAI_API_KEY"), model_name="text-embedding-3-small"
-        )
+    @staticmethod
+    def document_id(document: str) -> str:
+        """Return the content-derived ID a document is stored under."""
+        return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+    def _create_default_embedding_function(self):
+        return EmbeddingConfigurator().configure_embedder()
 
     def _set_embedder_config(self, embedder: Optional[Dict[str, Any]] = None) -> None:
         """Set the embedding configuration for the knowledge storage.
@@ -196,6 +343,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             embedder_config (Optional[Dict[str, Any]]): Configuration dictionary for the embedder.
                 If None or empty, defaults to the default embedding function.
         """
+        self.embedder_key = json.dumps(embedder, sort_keys=True, default=str)
         self.embedder = (
             EmbeddingConfigurator().configure_embedder(embedder)
             if embedder
@@ -1,4 +1,9 @@
-from typing import Any, Dict, List
+import hashlib
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
 
 
 def extract_knowledge_context(knowledge_snippets: List[Dict[str, Any]]) -> str:
@@ -10,3 +15,47 @@ def extract_knowledge_context(knowledge_snippets: List[Dict[str, Any]]) -> str:
     ]
     snippet = "\n".join(valid_snippets)
     return f"Additional Information: {snippet}" if valid_snippets else ""
+
+
+def hash_files(paths: List[Path]) -> str:
+    """Hash the names and contents of files, in order."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path).encode())
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_stream(
+    pieces: Iterable[str], chunk_size: int, chunk_overlap: int
+) -> Iterator[str]:
+    """Split a stream of text into overlapping chunks.
+
+    Yields the same chunks as slicing the concatenated pieces every
+    `chunk_size - chunk_overlap` characters, while only buffering about one
+    chunk plus the current piece.
+    """
+    step = chunk_size - chunk_overlap
+    if step <= 0:
+        raise ValueError("chunk_overlap must be smaller than chunk_size")
+
+    buffer = ""
+    start = 0
+    for piece in pieces:
+        buffer = buffer[start:] + piece
+        start = 0
+        while start + chunk_size <= len(buffer):
+            yield buffer[start : start + chunk_size]
+            start += step
+    while start < len(buffer):
+        yield buffer[start : start + chunk_size]
+        start += step
+
+
+def batched(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    """Group items into lists of at most `batch_size`."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
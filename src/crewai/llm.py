@@ -1,3 +1,6 @@
+import asyncio
+import hashlib
+import inspect
 import json
 import logging
 import os
@@ -10,9 +13,11 @@ from typing import (
     Any,
     DefaultDict,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
+    Tuple,
     Type,
     TypedDict,
     Union,
@@ -20,9 +25,13 @@ from typing import (
 )
 from datetime import datetime
 from dotenv import load_dotenv
-from litellm.types.utils import ChatCompletionDeltaToolCall
+from litellm.types.utils import (
+    ChatCompletionDeltaToolCall,
+    ChatCompletionMessageToolCall,
+)
 from pydantic import BaseModel, Field
 
+from crewai.agents.cache.cache_handler import CacheHandler
 from crewai.utilities.events.llm_events import (
     LLMCallCompletedEvent,
     LLMCallFailedEvent,
@@ -52,7 +61,7 @@ import io
 from typing import TextIO
 
 from crewai.llms.base_llm import BaseLLM
-from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
@@ -254,6 +263,17 @@ LLM_CONTEXT_WINDOW_SIZES = {
 DEFAULT_CONTEXT_WINDOW_SIZE = 8192
 CONTEXT_WINDOW_USAGE_RATIO = 0.85
 
+# Request parameters that do not affect the response and are left out of
+# response cache keys.
+RESPONSE_CACHE_IGNORED_PARAMS = {
+    "api_base",
+    "api_key",
+    "api_version",
+    "base_url",
+    "stream",
+    "timeout",
+}
+
 
 @contextmanager
 def suppress_warnings():
@@ -311,6 +331,7 @@ class LLM(BaseLLM):
         callbacks: List[Any] = [],
         reasoning_effort: Optional[Literal["none", "low", "medium", "high"]] = None,
         stream: bool = False,
+        response_cache: Optional[CacheHandler] = None,
         **kwargs,
     ):
         self.model = model
@@ -337,6 +358,7 @@ class LLM(BaseLLM):
         self.additional_params = kwargs
         self.is_anthropic = self._is_anthropic_model(model)
         self.stream = stream
+        self.response_cache = response_cache
 
         litellm.drop_params = True
 
@@ -414,11 +436,221 @@ class LLM(BaseLLM):
         # Remove None values from params
         return {k: v for k, v in params.items() if v is not None}
 
+    def _extract_stream_chunk(
+        self, chunk: Any
+    ) -> Tuple[Optional[str], Optional[Any], Optional[List[Any]]]:
+        """Extract content, usage and tool call deltas from a streaming chunk.
+
+        Providers return chunks either as dicts or as litellm objects, so every
+        field is looked up defensively.
+
+        Args:
+            chunk: A single chunk from a streaming completion
+
+        Returns:
+            Tuple of (content, usage info, tool call deltas). Each entry is None
+            when the chunk does not carry it.
+        """
+        chunk_content = None
+        usage_info = None
+        tool_calls = None
+
+        # Try to access choices safely
+        choices = None
+        if isinstance(chunk, dict) and "choices" in chunk:
+            choices = chunk["choices"]
+        elif hasattr(chunk, "choices"):
+            # Check if choices is not a type but an actual attribute with value
+            if not isinstance(getattr(chunk, "choices"), type):
+                choices = getattr(chunk, "choices")
+
+        # Try to extract usage information if available
+        if isinstance(chunk, dict) and "usage" in chunk:
+            usage_info = chunk["usage"]
+        elif hasattr(chunk, "usage"):
+            # Check if usage is not a type but an actual attribute with value
+            if not isinstance(getattr(chunk, "usage"), type):
+                usage_info = getattr(chunk, "usage")
+
+        if choices and len(choices) > 0:
+            choice = choices[0]
+
+            # Handle different delta formats
+            delta = None
+            if isinstance(choice, dict) and "delta" in choice:
+                delta = choice["delta"]
+            elif hasattr(choice, "delta"):
+                delta = getattr(choice, "delta")
+
+            # Extract content from delta
+            if delta:
+                # Handle dict format
+                if isinstance(delta, dict):
+                    if "content" in delta and delta["content"] is not None:
+                        chunk_content = delta["content"]
+                # Handle object format
+                elif hasattr(delta, "content"):
+                    chunk_content = getattr(delta, "content")
+
+                # Handle case where content might be None or empty
+                if chunk_content is None and isinstance(delta, dict):
+                    # Some models might send empty content chunks
+                    chunk_content = ""
+
+                # Enable tool calls using streaming
+                if "tool_calls" in delta:
+                    tool_calls = delta["tool_calls"]
+
+        return chunk_content, usage_info, tool_calls
+
+    def _get_last_chunk_message(self, last_chunk: Optional[Any]) -> Optional[Any]:
+        """Return the message attached to the first choice of the last chunk, if any."""
+        if not last_chunk:
+            return None
+
+        choices = None
+        if isinstance(last_chunk, dict) and "choices" in last_chunk:
+            choices = last_chunk["choices"]
+        elif hasattr(last_chunk, "choices"):
+            if not isinstance(getattr(last_chunk, "choices"), type):
+                choices = getattr(last_chunk, "choices")
+
+        if not choices or len(choices) == 0:
+            return None
+
+        choice = choices[0]
+        if isinstance(choice, dict) and "message" in choice:
+            return choice["message"]
+        elif hasattr(choice, "message"):
+            return getattr(choice, "message")
+        return None
+
+    def _resolve_streaming_response(
+        self,
+        full_response: str,
+        chunk_count: int,
+        last_chunk: Optional[Any],
+        accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs],
+    ) -> Tuple[str, Optional[List[Any]]]:
+        """Settle the final text and tool calls once a stream has been consumed.
+
+        Args:
+            full_response: Content accumulated from the stream chunks
+            chunk_count: Number of chunks received
+            last_chunk: The last chunk received from the stream
+            accumulated_tool_args: Tool call arguments accumulated while streaming
+
+        Returns:
+            Tuple of (response text, tool calls found on the final message)
+
+        Raises:
+            Exception: If no content is received from the streaming response
+        """
+        # --- 1) Handle empty response with chunks
+        if not full_response.strip() and chunk_count > 0:
+            logging.warning(
+                f"Received {chunk_count} chunks but no content was extracted"
+            )
+            try:
+                # Try to extract content from the last chunk's message
+                message = self._get_last_chunk_message(last_chunk)
+                if message:
+                    content = None
+                    if isinstance(message, dict) and "content" in message:
+                        content = message["content"]
+                    elif hasattr(message, "content"):
+                        content = getattr(message, "content")
+
+                    if content:
+                        full_response = content
+                        logging.info(
+                            f"Extracted content from last chunk message: {full_response}"
+                        )
+            except Exception as e:
+                logging.debug(f"Error extracting content from last chunk: {e}")
+                logging.debug(
+                    f"Last chunk format: {type(last_chunk)}, content: {last_chunk}"
+                )
+
+        # --- 2) If still empty, raise an error instead of using a default response
+        if not full_response.strip() and len(accumulated_tool_args) == 0:
+            raise Exception(
+                "No content received from streaming response. Received empty chunks or failed to extract content."
+            )
+
+        # --- 3) Check for tool calls in the final response
+        tool_calls = None
+        try:
+            message = self._get_last_chunk_message(last_chunk)
+            if message:
+                if isinstance(message, dict) and "tool_calls" in message:
+                    tool_calls = message["tool_calls"]
+                elif hasattr(message, "tool_calls"):
+                    tool_calls = getattr(message, "tool_calls")
+        except Exception as e:
+            logging.debug(f"Error checking for tool calls: {e}")
+
+        return full_response, tool_calls
+
+    def _handle_streaming_error(self, error: Exception, full_response: str) -> str:
+        """Return the partial response of a failed stream, or re-raise the error.
+
+        Args:
+            error: The exception raised while streaming
+            full_response: Content accumulated before the failure
+
+        Returns:
+            str: The partial response, if any content was received
+
+        Raises:
+            Exception: If the stream failed before producing any content
+        """
+        logging.error(f"Error in streaming response: {str(error)}")
+        if full_response.strip():
+            logging.warning(f"Returning partial response despite error: {str(error)}")
+            self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL)
+            return full_response
+
+        # Emit failed event and re-raise the exception
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=str(error)),
+        )
+        raise Exception(f"Failed to get streaming response: {str(error)}")
+
+    def _prepare_streaming_params(self, params: Dict[str, Any]) -> None:
+        """Make sure stream is set to True and include usage metrics."""
+        params["stream"] = True
+        params["stream_options"] = {"include_usage": True}
+
+    def _get_non_streaming_fallback_params(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the parameters used when a stream yields no chunks at all."""
+        logging.warning(
+            "No chunks received in streaming response, falling back to non-streaming"
+        )
+        non_streaming_params = params.copy()
+        non_streaming_params["stream"] = False
+        # Remove stream_options for non-streaming call
+        non_streaming_params.pop("stream_options", None)
+        return non_streaming_params
+
+    def _emit_stream_chunk(self, chunk_content: str) -> None:
+        if not crewai_event_bus.has_listeners(LLMStreamChunkEvent):
+            return
+        crewai_event_bus.emit(
+            self,
+            event=LLMStreamChunkEvent(chunk=chunk_content),
+        )
+
     def _handle_streaming_response(
         self,
         params: Dict[str, Any],
         callbacks: Optional[List[Any]] = None,
         available_functions: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[str] = None,
     ) -> str:
         """Handle a streaming response from the LLM.
 
@@ -426,6 +658,7 @@ class LLM(BaseLLM):
             params: Parameters for the completion call
             callbacks: Optional list of callback functions
             available_functions: Dict of available functions
+            cache_key: Response cache key the text response is stored under, if any
 
         Returns:
             str: The complete response text
@@ -438,206 +671,73 @@ class LLM(BaseLLM):
         last_chunk = None
         chunk_count = 0
         usage_info = None
-        tool_calls = None
 
         accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs] = defaultdict(
             AccumulatedToolArgs
         )
 
         # --- 2) Make sure stream is set to True and include usage metrics
-        params["stream"] = True
-        params["stream_options"] = {"include_usage": True}
+        self._prepare_streaming_params(params)
 
         try:
             # --- 3) Process each chunk in the stream
             for chunk in litellm.completion(**params):
                 chunk_count += 1
                 last_chunk = chunk
-
-                # Extract content from the chunk
                 chunk_content = None
 
-                # Safely extract content from various chunk formats
                 try:
-                    # Try to access choices safely
-                    choices = None
-                    if isinstance(chunk, dict) and "choices" in chunk:
-                        choices = chunk["choices"]
-                    elif hasattr(chunk, "choices"):
-                        # Check if choices is not a type but an actual attribute with value
-                        if not isinstance(getattr(chunk, "choices"), type):
-                            choices = getattr(chunk, "choices")
-
-                    # Try to extract usage information if available
-                    if isinstance(chunk, dict) and "usage" in chunk:
-                        usage_info = chunk["usage"]
-                    elif hasattr(chunk, "usage"):
-                        # Check if usage is not a type but an actual attribute with value
-                        if not isinstance(getattr(chunk, "usage"), type):
-                            usage_info = getattr(chunk, "usage")
-
-                    if choices and len(choices) > 0:
-                        choice = choices[0]
-
-                        # Handle different delta formats
-                        delta = None
-                        if isinstance(choice, dict) and "delta" in choice:
-                            delta = choice["delta"]
-                        elif hasattr(choice, "delta"):
-                            delta = getattr(choice, "delta")
-
-                        # Extract content from delta
-                        if delta:
-                            # Handle dict format
-                            if isinstance(delta, dict):
-                                if "content" in delta and delta["content"] is not None:
-                                    chunk_content = delta["content"]
-                            # Handle object format
-                            elif hasattr(delta, "content"):
-                                chunk_content = getattr(delta, "content")
-
-                            # Handle case where content might be None or empty
-                            if chunk_content is None and isinstance(delta, dict):
-                                # Some models might send empty content chunks
-                                chunk_content = ""
-
-                            # Enable tool calls using streaming
-                            if "tool_calls" in delta:
-                                tool_calls = delta["tool_calls"]
-
-                                if tool_calls:
-                                    result = self._handle_streaming_tool_calls(
-                                        tool_calls=tool_calls,
-                                        accumulated_tool_args=accumulated_tool_args,
-                                        available_functions=available_functions,
-                                    )
-                                    if result is not None:
-                                        chunk_content = result
-
+                    chunk_content, chunk_usage, tool_calls = self._extract_stream_chunk(
+                        chunk
+                    )
+                    if chunk_usage is not None:
+                        usage_info = chunk_usage
+
+                    if tool_calls:
+                        result = self._handle_streaming_tool_calls(
+                            tool_calls=tool_calls,
+                            accumulated_tool_args=accumulated_tool_args,
+                            available_functions=available_functions,
+                        )
+                        if result is not None:
+                            chunk_content = result
                 except Exception as e:
                     logging.debug(f"Error extracting content from chunk: {e}")
                     logging.debug(f"Chunk format: {type(chunk)}, content: {chunk}")
 
                 # Only add non-None content to the response
                 if chunk_content is not None:
-                    # Add the chunk content to the full response
                     full_response += chunk_content
+                    self._emit_stream_chunk(chunk_content)
 
-                    # Emit the chunk event
-                    assert hasattr(crewai_event_bus, "emit")
-                    crewai_event_bus.emit(
-                        self,
-                        event=LLMStreamChunkEvent(chunk=chunk_content),
-                    )
             # --- 4) Fallback to non-streaming if no content received
             if not full_response.strip() and chunk_count == 0:
-                logging.warning(
-                    "No chunks received in streaming response, falling back to non-streaming"
-                )
-                non_streaming_params = params.copy()
-                non_streaming_params["stream"] = False
-                non_streaming_params.pop(
-                    "stream_options", None
-                )  # Remove stream_options for non-streaming call
-                return self._handle_non_streaming_response(
-                    non_streaming_params, callbacks, available_functions
-                )
-
-            # --- 5) Handle empty response with chunks
-            if not full_response.strip() and chunk_count > 0:
-                logging.warning(
-                    f"Received {chunk_count} chunks but no content was extracted"
-                )
-                if last_chunk is not None:
-                    try:
-                        # Try to extract content from the last chunk's message
-                        choices = None
-                        if isinstance(last_chunk, dict) and "choices" in last_chunk:
-                            choices = last_chunk["choices"]
-                        elif hasattr(last_chunk, "choices"):
-                            if not isinstance(getattr(last_chunk, "choices"), type):
-                                choices = getattr(last_chunk, "choices")
-
-                        if choices and len(choices) > 0:
-                            choice = choices[0]
-
-                            # Try to get content from message
-                            message = None
-                            if isinstance(choice, dict) and "message" in choice:
-                                message = choice["message"]
-                            elif hasattr(choice, "message"):
-                                message = getattr(choice, "message")
-
-                            if message:
-                                content = None
-                                if isinstance(message, dict) and "content" in message:
-                                    content = message["content"]
-                                elif hasattr(message, "content"):
-                                    content = getattr(message, "content")
-
-                                if content:
-                                    full_response = content
-                                    logging.info(
-                                        f"Extracted content from last chunk message: {full_response}"
-                                    )
-                    except Exception as e:
-                        logging.debug(f"Error extracting content from last chunk: {e}")
-                        logging.debug(
-                            f"Last chunk format: {type(last_chunk)}, content: {last_chunk}"
-                        )
-
-            # --- 6) If still empty, raise an error instead of using a default response
-            if not full_response.strip() and len(accumulated_tool_args) == 0:
-                raise Exception(
-                    "No content received from streaming response. Received empty chunks or failed to extract content."
+                # Without return_tool_calls the response is always text
+                return cast(
+                    str,
+                    self._handle_non_streaming_response(
+                        self._get_non_streaming_fallback_params(params),
+                        callbacks,
+                        available_functions,
+                        cache_key,
+                    ),
                 )
 
-            # --- 7) Check for tool calls in the final response
-            tool_calls = None
-            try:
-                if last_chunk:
-                    choices = None
-                    if isinstance(last_chunk, dict) and "choices" in last_chunk:
-                        choices = last_chunk["choices"]
-                    elif hasattr(last_chunk, "choices"):
-                        if not isinstance(getattr(last_chunk, "choices"), type):
-                            choices = getattr(last_chunk, "choices")
-
-                    if choices and len(choices) > 0:
-                        choice = choices[0]
-
-                        message = None
-                        if isinstance(choice, dict) and "message" in choice:
-                            message = choice["message"]
-                        elif hasattr(choice, "message"):
-                            message = getattr(choice, "message")
-
-                        if message:
-                            if isinstance(message, dict) and "tool_calls" in message:
-                                tool_calls = message["tool_calls"]
-                            elif hasattr(message, "tool_calls"):
-                                tool_calls = getattr(message, "tool_calls")
-            except Exception as e:
-                logging.debug(f"Error checking for tool calls: {e}")
-            # --- 8) If no tool calls or no available functions, return the text response directly
+            # --- 5) Settle the final text and look for tool calls
+            full_response, tool_calls = self._resolve_streaming_response(
+                full_response, chunk_count, last_chunk, accumulated_tool_args
+            )
 
-            if not tool_calls or not available_functions:
-                # Log token usage if available in streaming mode
-                self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
-                # Emit completion event and return response
-                self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL)
-                return full_response
+            # --- 6) Handle tool calls if present
+            if tool_calls and available_functions:
+                tool_result = self._handle_tool_call(tool_calls, available_functions)
+                if tool_result is not None:
+                    return tool_result
 
-            # --- 9) Handle tool calls if present
-            tool_result = self._handle_tool_call(tool_calls, available_functions)
-            if tool_result is not None:
-                return tool_result
-
-            # --- 10) Log token usage if available in streaming mode
+            # --- 7) Log token usage and emit completion event
             self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
-
-            # --- 11) Emit completion event and return response
             self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL)
+            self._cache_response(cache_key, full_response)
             return full_response
 
         except ContextWindowExceededError as e:
@@ -646,26 +746,112 @@ class LLM(BaseLLM):
             # decide whether to summarize the content or abort based on the respect_context_window flag.
             raise LLMContextLengthExceededException(str(e))
         except Exception as e:
-            logging.error(f"Error in streaming response: {str(e)}")
-            if full_response.strip():
-                logging.warning(f"Returning partial response despite error: {str(e)}")
-                self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL)
-                return full_response
-
-            # Emit failed event and re-raise the exception
-            assert hasattr(crewai_event_bus, "emit")
-            crewai_event_bus.emit(
-                self,
-                event=LLMCallFailedEvent(error=str(e)),
+            return self._handle_streaming_error(e, full_response)
+
+    async def _ahandle_streaming_response(
+        self,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[str] = None,
+    ) -> str:
+        """Async counterpart of `_handle_streaming_response` using `litellm.acompletion`.
+
+        Args:
+            params: Parameters for the completion call
+            callbacks: Optional list of callback functions
+            available_functions: Dict of available functions
+            cache_key: Response cache key the text response is stored under, if any
+
+        Returns:
+            str: The complete response text
+
+        Raises:
+            Exception: If no content is received from the streaming response
+        """
+        full_response = ""
+        last_chunk = None
+        chunk_count = 0
+        usage_info = None
+
+        accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs] = defaultdict(
+            AccumulatedToolArgs
+        )
+
+        self._prepare_streaming_params(params)
+
+        try:
+            async for chunk in await litellm.acompletion(**params):
+                chunk_count += 1
+                last_chunk = chunk
+                chunk_content = None
+
+                try:
+                    chunk_content, chunk_usage, tool_calls = self._extract_stream_chunk(
+                        chunk
+                    )
+                    if chunk_usage is not None:
+                        usage_info = chunk_usage
+
+                    if tool_calls:
+                        result = await self._ahandle_streaming_tool_calls(
+                            tool_calls=tool_calls,
+                            accumulated_tool_args=accumulated_tool_args,
+                            available_functions=available_functions,
+                        )
+                        if result is not None:
+                            chunk_content = result
+                except Exception as e:
+                    logging.debug(f"Error extracting content from chunk: {e}")
+                    logging.debug(f"Chunk format: {type(chunk)}, content: {chunk}")
+
+                if chunk_content is not None:
+                    full_response += chunk_content
+                    self._emit_stream_chunk(chunk_content)
+
+            if not full_response.strip() and chunk_count == 0:
+                return cast(
+                    str,
+                    await self._ahandle_non_streaming_response(
+                        self._get_non_streaming_fallback_params(params),
+                        callbacks,
+                        available_functions,
+                        cache_key,
+                    ),
+                )
+
+            full_response, tool_calls = self._resolve_streaming_response(
+                full_response, chunk_count, last_chunk, accumulated_tool_args
             )
-            raise Exception(f"Failed to get streaming response: {str(e)}")
 
-    def _handle_streaming_tool_calls(
+            if tool_calls and available_functions:
+                tool_result = await self._ahandle_tool_call(
+                    tool_calls, available_functions
+                )
+                if tool_result is not None:
+                    return tool_result
+
+            self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
+            self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL)
+            self._cache_response(cache_key, full_response)
+            return full_response
+
+        except ContextWindowExceededError as e:
+            raise LLMContextLengthExceededException(str(e))
+        except Exception as e:
+            return self._handle_streaming_error(e, full_response)
+
+    def _accumulate_streaming_tool_calls(
         self,
         tool_calls: List[ChatCompletionDeltaToolCall],
         accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs],
         available_functions: Optional[Dict[str, Any]] = None,
-    ) -> None | str:
+    ) -> Iterator[AccumulatedToolArgs]:
+        """Accumulate streamed tool call deltas, emitting a chunk event for each.
+
+        Yields each accumulated tool call as soon as its name is known and its
+        arguments form valid JSON, so the caller can execute it.
+        """
         for tool_call in tool_calls:
             current_tool_accumulator = accumulated_tool_args[tool_call.index]
 
@@ -676,14 +862,14 @@ class LLM(BaseLLM):
                 current_tool_accumulator.function.arguments += (
                     tool_call.function.arguments
                 )
-            assert hasattr(crewai_event_bus, "emit")
-            crewai_event_bus.emit(
-                self,
-                event=LLMStreamChunkEvent(
-                    tool_call=tool_call.to_dict(),
-                    chunk=tool_call.function.arguments,
-                ),
-            )
+            if crewai_event_bus.has_listeners(LLMStreamChunkEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=LLMStreamChunkEvent(
+                        tool_call=tool_call.to_dict(),
+                        chunk=tool_call.function.arguments,
+                    ),
+                )
 
             if (
                 current_tool_accumulator.function.name
@@ -692,13 +878,32 @@ class LLM(BaseLLM):
             ):
                 try:
                     json.loads(current_tool_accumulator.function.arguments)
-
-                    return self._handle_tool_call(
-                        [current_tool_accumulator],
-                        available_functions,
-                    )
                 except json.JSONDecodeError:
                     continue
+                yield current_tool_accumulator
+
+    def _handle_streaming_tool_calls(
+        self,
+        tool_calls: List[ChatCompletionDeltaToolCall],
+        accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs],
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> None | str:
+        for ready_tool_call in self._accumulate_streaming_tool_calls(
+            tool_calls, accumulated_tool_args, available_functions
+        ):
+            return self._handle_tool_call([ready_tool_call], available_functions)
+        return None
+
+    async def _ahandle_streaming_tool_calls(
+        self,
+        tool_calls: List[ChatCompletionDeltaToolCall],
+        accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs],
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> None | str:
+        for ready_tool_call in self._accumulate_streaming_tool_calls(
+            tool_calls, accumulated_tool_args, available_functions
+        ):
+            return await self._ahandle_tool_call([ready_tool_call], available_functions)
         return None
 
     def _handle_streaming_callbacks(
@@ -743,21 +948,65 @@ class LLM(BaseLLM):
                             end_time=0,
                         )
 
+    def _process_non_streaming_response(
+        self,
+        response: Any,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+    ) -> Tuple[str, List[Any]]:
+        """Extract the text and tool calls of a completion and report its usage.
+
+        Args:
+            response: The completion response returned by litellm
+            params: Parameters used for the completion call
+            callbacks: Optional list of callback functions
+
+        Returns:
+            Tuple of (response text, tool calls requested by the model)
+        """
+        # --- 1) Extract response message and content
+        response_message = cast(Choices, cast(ModelResponse, response).choices)[
+            0
+        ].message
+        text_response = response_message.content or ""
+
+        # --- 2) Handle callbacks with usage info
+        if callbacks and len(callbacks) > 0:
+            for callback in callbacks:
+                if hasattr(callback, "log_success_event"):
+                    usage_info = getattr(response, "usage", None)
+                    if usage_info:
+                        callback.log_success_event(
+                            kwargs=params,
+                            response_obj={"usage": usage_info},
+                            start_time=0,
+                            end_time=0,
+                        )
+
+        # --- 3) Check for tool calls
+        tool_calls = getattr(response_message, "tool_calls", [])
+        return text_response, tool_calls
+
     def _handle_non_streaming_response(
         self,
         params: Dict[str, Any],
         callbacks: Optional[List[Any]] = None,
         available_functions: Optional[Dict[str, Any]] = None,
-    ) -> str:
+        cache_key: Optional[str] = None,
+        return_tool_calls: bool = False,
+    ) -> Union[str, List[ChatCompletionMessageToolCall]]:
         """Handle a non-streaming response from the LLM.
 
         Args:
             params: Parameters for the completion call
             callbacks: Optional list of callback functions
             available_functions: Dict of available functions
+            cache_key: Response cache key the text response is stored under, if any
+            return_tool_calls: Return the requested tool calls when there are
+                no functions to run them with
 
         Returns:
-            str: The response text
+            The response text, or the requested tool calls
         """
         # --- 1) Make the completion call
         try:
@@ -771,42 +1020,135 @@ class LLM(BaseLLM):
             # for consistent handling in the rest of the codebase
             raise LLMContextLengthExceededException(str(e))
 
-        # --- 2) Extract response message and content
-        response_message = cast(Choices, cast(ModelResponse, response).choices)[
-            0
-        ].message
-        text_response = response_message.content or ""
+        # --- 2) Extract the response text and tool calls
+        text_response, tool_calls = self._process_non_streaming_response(
+            response, params, callbacks
+        )
 
-        # --- 3) Handle callbacks with usage info
-        if callbacks and len(callbacks) > 0:
-            for callback in callbacks:
-                if hasattr(callback, "log_success_event"):
-                    usage_info = getattr(response, "usage", None)
-                    if usage_info:
-                        callback.log_success_event(
-                            kwargs=params,
-                            response_obj={"usage": usage_info},
-                            start_time=0,
-                            end_time=0,
-                        )
+        # --- 3) Handle tool calls if present
+        if tool_calls and available_functions:
+            tool_result = self._handle_tool_call(tool_calls, available_functions)
+            if tool_result is not None:
+                return tool_result
+        elif tool_calls and return_tool_calls:
+            # Without functions to run, hand the tool calls back to the caller
+            self._handle_emit_call_events(tool_calls, LLMCallType.TOOL_CALL)
+            return tool_calls
 
-        # --- 4) Check for tool calls
-        tool_calls = getattr(response_message, "tool_calls", [])
+        # --- 4) Otherwise emit completion event and return the text response
+        self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
+        self._cache_response(cache_key, text_response)
+        return text_response
 
-        # --- 5) If no tool calls or no available functions, return the text response directly
-        if not tool_calls or not available_functions:
-            self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
-            return text_response
+    async def _ahandle_non_streaming_response(
+        self,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[str] = None,
+        return_tool_calls: bool = False,
+    ) -> Union[str, List[ChatCompletionMessageToolCall]]:
+        """Async counterpart of `_handle_non_streaming_response` using `litellm.acompletion`.
+
+        Args:
+            params: Parameters for the completion call
+            callbacks: Optional list of callback functions
+            available_functions: Dict of available functions
+            cache_key: Response cache key the text response is stored under, if any
+            return_tool_calls: Return the requested tool calls when there are
+                no functions to run them with
+
+        Returns:
+            The response text, or the requested tool calls
+        """
+        try:
+            response = await litellm.acompletion(**params)
+        except ContextWindowExceededError as e:
+            raise LLMContextLengthExceededException(str(e))
+
+        text_response, tool_calls = self._process_non_streaming_response(
+            response, params, callbacks
+        )
 
-        # --- 6) Handle tool calls if present
-        tool_result = self._handle_tool_call(tool_calls, available_functions)
-        if tool_result is not None:
-            return tool_result
+        if tool_calls and available_functions:
+            tool_result = await self._ahandle_tool_call(tool_calls, available_functions)
+            if tool_result is not None:
+                return tool_result
+        elif tool_calls and return_tool_calls:
+            self._handle_emit_call_events(tool_calls, LLMCallType.TOOL_CALL)
+            return tool_calls
 
-        # --- 7) If tool call handling didn't return a result, emit completion event and return text response
         self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
+        self._cache_response(cache_key, text_response)
         return text_response
 
+    def _parse_tool_call(
+        self,
+        tool_calls: List[Any],
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Tuple[str, str]]:
+        """Return the function name and raw arguments of the first callable tool call."""
+        if not tool_calls or not available_functions:
+            return None
+
+        tool_call = tool_calls[0]
+        function_name = tool_call.function.name
+        if function_name not in available_functions:
+            return None
+        return function_name, tool_call.function.arguments
+
+    def _emit_tool_call_started(
+        self, function_name: str, function_args: Dict[str, Any]
+    ) -> datetime:
+        assert hasattr(crewai_event_bus, "emit")
+        started_at = datetime.now()
+        crewai_event_bus.emit(
+            self,
+            event=ToolUsageStartedEvent(
+                tool_name=function_name,
+                tool_args=function_args,
+            ),
+        )
+        return started_at
+
+    def _emit_tool_call_finished(
+        self,
+        result: Any,
+        function_name: str,
+        function_args: Dict[str, Any],
+        started_at: datetime,
+    ) -> None:
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=ToolUsageFinishedEvent(
+                output=result,
+                tool_name=function_name,
+                tool_args=function_args,
+                started_at=started_at,
+                finished_at=datetime.now(),
+            ),
+        )
+        self._handle_emit_call_events(result, LLMCallType.TOOL_CALL)
+
+    def _emit_tool_call_error(
+        self, function_name: str, function_args: Dict[str, Any], error: Exception
+    ) -> None:
+        logging.error(f"Error executing function '{function_name}': {error}")
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=f"Tool execution error: {str(error)}"),
+        )
+        crewai_event_bus.emit(
+            self,
+            event=ToolUsageErrorEvent(
+                tool_name=function_name,
+                tool_args=function_args,
+                error=f"Tool execution error: {str(error)}",
+            ),
+        )
+
     def _handle_tool_call(
         self,
         tool_calls: List[Any],
@@ -822,67 +1164,121 @@ class LLM(BaseLLM):
             Optional[str]: The result of the tool call, or None if no tool call was made
         """
         # --- 1) Validate tool calls and available functions
-        if not tool_calls or not available_functions:
+        parsed_tool_call = self._parse_tool_call(tool_calls, available_functions)
+        if parsed_tool_call is None or available_functions is None:
             return None
 
-        # --- 2) Extract function name from first tool call
-        tool_call = tool_calls[0]
-        function_name = tool_call.function.name
+        function_name, raw_arguments = parsed_tool_call
         function_args = {}  # Initialize to empty dict to avoid unbound variable
+        try:
+            # --- 2) Parse function arguments and execute function
+            function_args = json.loads(raw_arguments)
+            fn = available_functions[function_name]
+            started_at = self._emit_tool_call_started(function_name, function_args)
+            result = fn(**function_args)
+
+            # --- 3) Emit success events
+            self._emit_tool_call_finished(
+                result, function_name, function_args, started_at
+            )
+            return result
+        except Exception as e:
+            # --- 4) Handle execution errors
+            self._emit_tool_call_error(function_name, function_args, e)
+        return None
 
-        # --- 3) Check if function is available
-        if function_name in available_functions:
-            try:
-                # --- 3.1) Parse function arguments
-                function_args = json.loads(tool_call.function.arguments)
-                fn = available_functions[function_name]
+    async def _ahandle_tool_call(
+        self,
+        tool_calls: List[Any],
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Async counterpart of `_handle_tool_call`.
 
-                # --- 3.2) Execute function
-                assert hasattr(crewai_event_bus, "emit")
-                started_at = datetime.now()
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageStartedEvent(
-                        tool_name=function_name,
-                        tool_args=function_args,
-                    ),
-                )
-                result = fn(**function_args)
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageFinishedEvent(
-                        output=result,
-                        tool_name=function_name,
-                        tool_args=function_args,
-                        started_at=started_at,
-                        finished_at=datetime.now(),
-                    ),
-                )
+        Coroutine functions are awaited directly; plain callables run in a worker
+        thread so a blocking tool does not stall the event loop.
 
-                # --- 3.3) Emit success event
-                self._handle_emit_call_events(result, LLMCallType.TOOL_CALL)
-                return result
-            except Exception as e:
-                # --- 3.4) Handle execution errors
-                fn = available_functions.get(
-                    function_name, lambda: None
-                )  # Ensure fn is always a callable
-                logging.error(f"Error executing function '{function_name}': {e}")
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=f"Tool execution error: {str(e)}"),
-                )
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageErrorEvent(
-                        tool_name=function_name,
-                        tool_args=function_args,
-                        error=f"Tool execution error: {str(e)}"
-                    ),
-                )
+        Args:
+            tool_calls: List of tool calls from the LLM
+            available_functions: Dict of available functions
+
+        Returns:
+            Optional[str]: The result of the tool call, or None if no tool call was made
+        """
+        parsed_tool_call = self._parse_tool_call(tool_calls, available_functions)
+        if parsed_tool_call is None or available_functions is None:
+            return None
+
+        function_name, raw_arguments = parsed_tool_call
+        function_args = {}
+        try:
+            function_args = json.loads(raw_arguments)
+            fn = available_functions[function_name]
+            started_at = self._emit_tool_call_started(function_name, function_args)
+            if inspect.iscoroutinefunction(fn):
+                result = await fn(**function_args)
+            else:
+                result = await asyncio.to_thread(fn, **function_args)
+
+            self._emit_tool_call_finished(
+                result, function_name, function_args, started_at
+            )
+            return result
+        except Exception as e:
+            self._emit_tool_call_error(function_name, function_args, e)
         return None
 
+    def _prepare_call_messages(
+        self, messages: Union[str, List[Dict[str, str]]]
+    ) -> List[Dict[str, str]]:
+        """Validate the call parameters and normalize the input messages.
+
+        Args:
+            messages: Input messages, either a string or a list of message dicts
+
+        Returns:
+            List[Dict[str, str]]: Messages in the list-of-dicts format
+        """
+        # --- 1) Validate parameters before proceeding with the call
+        self._validate_call_params()
+
+        # --- 2) Convert string messages to proper format if needed
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        # --- 3) Handle O1 model special case (system messages not supported)
+        if "o1" in self.model.lower():
+            for message in messages:
+                if message.get("role") == "system":
+                    message["role"] = "assistant"
+
+        return messages
+
+    def _emit_call_started(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallStartedEvent(
+                messages=messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+            ),
+        )
+
+    def _emit_call_failed(self, error: Exception) -> None:
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=str(error)),
+        )
+        logging.error(f"LiteLLM call failed: {str(error)}")
+
     def call(
         self,
         messages: Union[str, List[Dict[str, str]]],
@@ -913,48 +1309,71 @@ class LLM(BaseLLM):
             ValueError: If response format is not supported
             LLMContextLengthExceededException: If input exceeds model's context limit
         """
-        # --- 1) Emit call started event
-        assert hasattr(crewai_event_bus, "emit")
-        crewai_event_bus.emit(
-            self,
-            event=LLMCallStartedEvent(
-                messages=messages,
-                tools=tools,
-                callbacks=callbacks,
-                available_functions=available_functions,
-            ),
-        )
+        return self._call(messages, tools, callbacks, available_functions)
 
-        # --- 2) Validate parameters before proceeding with the call
-        self._validate_call_params()
+    def call_with_tools(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: List[dict],
+        callbacks: Optional[List[Any]] = None,
+    ) -> Union[str, List[ChatCompletionMessageToolCall]]:
+        """Call the LLM with tool schemas, returning the tool calls it requests.
 
-        # --- 3) Convert string messages to proper format if needed
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
+        Streaming calls run no tools and return the text response.
 
-        # --- 4) Handle O1 model special case (system messages not supported)
-        if "o1" in self.model.lower():
-            for message in messages:
-                if message.get("role") == "system":
-                    message["role"] = "assistant"
+        Args:
+            messages: Input messages for the LLM, as accepted by `call`.
+            tools: Tool schemas the LLM may call.
+            callbacks: Optional list of callback functions to be executed
+                      during and after the LLM call.
+
+        Returns:
+            Either a text response from the LLM (str) or the tool calls it
+            requested, unexecuted.
+        """
+        return self._call(messages, tools, callbacks, return_tool_calls=True)
+
+    def _call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        return_tool_calls: bool = False,
+    ) -> Any:
+        # --- 1) Emit call started event
+        self._emit_call_started(messages, tools, callbacks, available_functions)
 
-        # --- 5) Set up callbacks if provided
+        # --- 2) Validate parameters and normalize messages
+        messages = self._prepare_call_messages(messages)
+
+        # --- 3) Set up callbacks if provided
         with suppress_warnings():
             if callbacks and len(callbacks) > 0:
                 self.set_callbacks(callbacks)
 
             try:
-                # --- 6) Prepare parameters for the completion call
+                # --- 4) Prepare parameters for the completion call
                 params = self._prepare_completion_params(messages, tools)
 
-                # --- 7) Make the completion call and handle response
+                # --- 5) Serve repeated requests from the response cache
+                cache_key = self._get_response_cache_key(params, available_functions)
+                cached_response = self._read_cached_response(cache_key)
+                if cached_response is not None:
+                    return cached_response
+
+                # --- 6) Make the completion call and handle response
                 if self.stream:
                     return self._handle_streaming_response(
-                        params, callbacks, available_functions
+                        params, callbacks, available_functions, cache_key
                     )
                 else:
                     return self._handle_non_streaming_response(
-                        params, callbacks, available_functions
+                        params,
+                        callbacks,
+                        available_functions,
+                        cache_key,
+                        return_tool_calls,
                     )
 
             except LLMContextLengthExceededException:
@@ -963,12 +1382,92 @@ class LLM(BaseLLM):
                 # whether to summarize the content or abort based on the respect_context_window flag
                 raise
             except Exception as e:
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=str(e)),
-                )
-                logging.error(f"LiteLLM call failed: {str(e)}")
+                self._emit_call_failed(e)
+                raise
+
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        """Async high-level LLM call method built on `litellm.acompletion`.
+
+        Behaves like `call` (streaming, tool calls, events and callbacks) but
+        awaits the provider instead of blocking a thread, so many calls can be
+        in flight on a single event loop.
+
+        Args:
+            messages: Input messages for the LLM.
+                     Can be a string or list of message dictionaries.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions to be executed
+                      during and after the LLM call.
+            available_functions: Optional dict mapping function names to callables
+                               (sync or async) that can be invoked by the LLM.
+
+        Returns:
+            Union[str, Any]: Either a text response from the LLM (str) or
+                           the result of a tool function call (Any).
+
+        Raises:
+            TypeError: If messages format is invalid
+            ValueError: If response format is not supported
+            LLMContextLengthExceededException: If input exceeds model's context limit
+        """
+        return await self._acall(messages, tools, callbacks, available_functions)
+
+    async def acall_with_tools(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: List[dict],
+        callbacks: Optional[List[Any]] = None,
+    ) -> Union[str, List[ChatCompletionMessageToolCall]]:
+        """Async counterpart of `call_with_tools` built on `litellm.acompletion`."""
+        return await self._acall(messages, tools, callbacks, return_tool_calls=True)
+
+    async def _acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        return_tool_calls: bool = False,
+    ) -> Any:
+        self._emit_call_started(messages, tools, callbacks, available_functions)
+
+        messages = self._prepare_call_messages(messages)
+
+        with suppress_warnings():
+            if callbacks and len(callbacks) > 0:
+                self.set_callbacks(callbacks)
+
+            try:
+                params = self._prepare_completion_params(messages, tools)
+
+                cache_key = self._get_response_cache_key(params, available_functions)
+                cached_response = self._read_cached_response(cache_key)
+                if cached_response is not None:
+                    return cached_response
+
+                if self.stream:
+                    return await self._ahandle_streaming_response(
+                        params, callbacks, available_functions, cache_key
+                    )
+                else:
+                    return await self._ahandle_non_streaming_response(
+                        params,
+                        callbacks,
+                        available_functions,
+                        cache_key,
+                        return_tool_calls,
+                    )
+
+            except LLMContextLengthExceededException:
+                raise
+            except Exception as e:
+                self._emit_call_failed(e)
                 raise
 
     def _handle_emit_call_events(self, response: Any, call_type: LLMCallType):
@@ -984,6 +1483,64 @@ class LLM(BaseLLM):
             event=LLMCallCompletedEvent(response=response, call_type=call_type),
         )
 
+    def _get_response_cache_key(
+        self,
+        params: Dict[str, Any],
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Hash the parts of a request that determine the model's response.
+
+        Credentials, endpoints, timeouts and the streaming flag are left out so
+        streaming and non-streaming calls share entries. Calls that may execute
+        tools are never cached.
+
+        Args:
+            params: Parameters for the completion call
+            available_functions: Dict of available functions
+
+        Returns:
+            Optional[str]: The cache key, or None if the call should not be cached
+        """
+        if self.response_cache is None or available_functions:
+            return None
+
+        key_params = {
+            k: v for k, v in params.items() if k not in RESPONSE_CACHE_IGNORED_PARAMS
+        }
+        response_format = key_params.get("response_format")
+        if inspect.isclass(response_format) and issubclass(response_format, BaseModel):
+            schema_model: Type[BaseModel] = response_format
+            key_params["response_format"] = schema_model.model_json_schema()
+
+        payload = json.dumps(key_params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _read_cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """Return a cached response and emit its events, or None on a miss."""
+        if cache_key is None or self.response_cache is None:
+            return None
+
+        response = self.response_cache.read(tool=self.model, input=cache_key)
+        if response is None:
+            return None
+
+        if self.stream:
+            self._emit_stream_chunk(response)
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallCompletedEvent(
+                response=response, call_type=LLMCallType.LLM_CALL, from_cache=True
+            ),
+        )
+        return response
+
+    def _cache_response(self, cache_key: Optional[str], response: Any) -> None:
+        if cache_key is None or self.response_cache is None:
+            return
+        if isinstance(response, str) and response.strip():
+            self.response_cache.add(tool=self.model, input=cache_key, output=response)
+
     def _format_messages_for_provider(
         self, messages: List[Dict[str, str]]
     ) -> List[Dict[str, str]]:
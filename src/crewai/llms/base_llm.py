@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -73,6 +74,77 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        """Asynchronously call the LLM with the given messages.
+
+        The default implementation runs `call` in a worker thread so that every
+        LLM can be awaited. Implementations backed by an async client should
+        override this method to avoid holding a thread for each call.
+
+        Args:
+            messages: Input messages for the LLM, as accepted by `call`.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions to be executed
+                      during and after the LLM call.
+            available_functions: Optional dict mapping function names to callables
+                               that can be invoked by the LLM.
+
+        Returns:
+            Either a text response from the LLM (str) or
+            the result of a tool function call (Any).
+        """
+        return await asyncio.to_thread(
+            self.call,
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+        )
+
+    def call_with_tools(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: List[dict],
+        callbacks: Optional[List[Any]] = None,
+    ) -> Union[str, List[Any]]:
+        """Call the LLM with tool schemas, returning the tool calls it requests.
+
+        Tool calls are returned unexecuted so the caller can run them. Each has
+        an `id` and a `function` with the `name` and JSON `arguments`. The
+        default implementation returns whatever `call` returns for the tools.
+
+        Args:
+            messages: Input messages for the LLM, as accepted by `call`.
+            tools: Tool schemas the LLM may call.
+            callbacks: Optional list of callback functions to be executed
+                      during and after the LLM call.
+
+        Returns:
+            Either a text response from the LLM (str) or the list of tool
+            calls it requested.
+        """
+        return self.call(messages, tools=tools, callbacks=callbacks)
+
+    async def acall_with_tools(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: List[dict],
+        callbacks: Optional[List[Any]] = None,
+    ) -> Union[str, List[Any]]:
+        """Asynchronously call the LLM with tool schemas, as in `call_with_tools`.
+
+        The default implementation runs `call_with_tools` in a worker thread.
+        """
+        return await asyncio.to_thread(
+            self.call_with_tools, messages, tools, callbacks=callbacks
+        )
+
     def supports_stop_words(self) -> bool:
         """Check if the LLM supports stop words.
 
@@ -81,6 +153,14 @@ class BaseLLM(ABC):
         """
         return True  # Default implementation assumes support for stop words
 
+    def supports_function_calling(self) -> bool:
+        """Check if the LLM supports function calling.
+
+        Returns:
+            bool: True if the LLM supports function calling, False otherwise.
+        """
+        return False
+
     def get_context_window_size(self) -> int:
         """Get the context window size for the LLM.
 
@@ -1,4 +1,8 @@
-from typing import Any, Dict, Optional
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
 
 from crewai.memory import (
     EntityMemory,
@@ -7,9 +11,20 @@ from crewai.memory import (
     ShortTermMemory,
     UserMemory,
 )
+from crewai.memory.storage.rag_storage import RAGStorage
+
+DEFAULT_RETRIEVAL_TIMEOUT = 30.0
 
 
 class ContextualMemory:
+    """Builds the memory context of a task from every configured memory.
+
+    The stores are queried concurrently and each gets `retrieval_timeout`
+    seconds (from `memory_config`, default 30) before its context is left
+    out. RAG-backed stores sharing an embedder reuse one query embedding,
+    which counts against their timeout.
+    """
+
     def __init__(
         self,
         memory_config: Optional[Dict[str, Any]],
@@ -21,8 +36,12 @@ class ContextualMemory:
     ):
         if memory_config is not None:
             self.memory_provider = memory_config.get("provider")
+            self.retrieval_timeout = memory_config.get(
+                "retrieval_timeout", DEFAULT_RETRIEVAL_TIMEOUT
+            )
         else:
             self.memory_provider = None
+            self.retrieval_timeout = DEFAULT_RETRIEVAL_TIMEOUT
         self.stm = stm
         self.ltm = ltm
         self.em = em
@@ -39,16 +58,79 @@ class ContextualMemory:
         if query == "":
             return ""
 
-        context = []
-        context.append(self._fetch_ltm_context(task.description))
-        context.append(self._fetch_stm_context(query))
-        context.append(self._fetch_entity_context(query))
-        context.append(self._fetch_external_context(query))
+        fetchers: List[Callable[[], Optional[str]]] = [
+            lambda: self._fetch_ltm_context(task.description),
+            lambda: self._fetch_stm_context(query, embeddings.result().get("stm")),
+            lambda: self._fetch_entity_context(query, embeddings.result().get("em")),
+            lambda: self._fetch_external_context(query),
+        ]
         if self.memory_provider == "mem0":
-            context.append(self._fetch_user_context(query))
+            fetchers.append(lambda: self._fetch_user_context(query))
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(fetchers) + 1, thread_name_prefix="crewai-memory-fetch"
+        )
+        try:
+            # Embedding runs next to the stores that don't need it
+            embeddings = executor.submit(self._embed_query, query)
+            context = self._run_fetchers(executor, fetchers)
+        finally:
+            # Don't wait for stores that timed out
+            executor.shutdown(wait=False)
         return "\n".join(filter(None, context))
 
-    def _fetch_stm_context(self, query) -> str:
+    def _embed_query(self, query: str) -> Dict[str, List[float]]:
+        """Embed the query once per distinct embedder of the RAG-backed stores.
+
+        Returns the embedding to use for each store, by attribute name. Stores
+        left out embed the query themselves.
+        """
+        embeddings: Dict[str, List[float]] = {}
+        by_embedder: Dict[str, List[float]] = {}
+        for name in ("stm", "em"):
+            memory = getattr(self, name)
+            storage = getattr(memory, "storage", None)
+            if not isinstance(storage, RAGStorage):
+                continue
+            key = storage.embedder_key
+            if key not in by_embedder:
+                try:
+                    by_embedder[key] = storage.embed_query(query)
+                except Exception as e:
+                    logging.warning(f"Failed to embed memory query: {e}")
+                    continue
+            embeddings[name] = by_embedder[key]
+        return embeddings
+
+    def _run_fetchers(
+        self,
+        executor: ThreadPoolExecutor,
+        fetchers: List[Callable[[], Optional[str]]],
+    ) -> List[Optional[str]]:
+        """Run the fetchers concurrently, keeping their order in the results."""
+        futures = [executor.submit(fetcher) for fetcher in fetchers]
+        deadline = (
+            time.monotonic() + self.retrieval_timeout
+            if self.retrieval_timeout is not None
+            else None
+        )
+        results: List[Optional[str]] = []
+        for future in futures:
+            timeout = (
+                max(deadline - time.monotonic(), 0) if deadline is not None else None
+            )
+            try:
+                results.append(future.result(timeout=timeout))
+            except FutureTimeoutError:
+                logging.warning(
+                    f"Memory retrieval timed out after {self.retrieval_timeout}s, skipping a memory store"
+                )
+                results.append(None)
+        return results
+
+    def _fetch_stm_context(
+        self, query, query_embedding: Optional[List[float]] = None
+    ) -> str:
         """
         Fetches recent relevant insights from STM related to the task's description and expected_output,
         formatted as bullet points.
@@ -57,7 +139,7 @@ class ContextualMemory:
         if self.stm is None:
             return ""
 
-        stm_results = self.stm.search(query)
+        stm_results = self.stm.search(query, query_embedding=query_embedding)
         formatted_results = "\n".join(
             [
                 f"- {result['memory'] if self.memory_provider == 'mem0' else result['context']}"
@@ -89,7 +171,9 @@ class ContextualMemory:
 
         return f"Historical Data:\n{formatted_results}" if ltm_results else ""
 
-    def _fetch_entity_context(self, query) -> str:
+    def _fetch_entity_context(
+        self, query, query_embedding: Optional[List[float]] = None
+    ) -> str:
         """
         Fetches relevant entity information from Entity Memory related to the task's description and expected_output,
         formatted as bullet points.
@@ -97,7 +181,7 @@ class ContextualMemory:
         if self.em is None:
             return ""
 
-        em_results = self.em.search(query)
+        em_results = self.em.search(query, query_embedding=query_embedding)
         formatted_results = "\n".join(
             [
                 f"- {result['memory'] if self.memory_provider == 'mem0' else result['context']}"
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import PrivateAttr
 
@@ -48,16 +48,24 @@ class EntityMemory(Memory):
 
     def save(self, item: EntityMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
         """Saves an entity item into the SQLite storage."""
+        super().save(self._format_item(item), item.metadata)
+
+    def save_many(self, items: List[EntityMemoryItem]) -> None:
+        """Saves entity items with a single storage call so they are embedded in one batch."""
+        self._save_many(
+            [self._format_item(item) for item in items],
+            [item.metadata for item in items],
+        )
+
+    def _format_item(self, item: EntityMemoryItem) -> str:
         if self._memory_provider == "mem0":
-            data = f"""
+            return f"""
             Remember details about the following entity:
             Name: {item.name}
             Type: {item.type}
             Entity Description: {item.description}
             """
-        else:
-            data = f"{item.name}({item.type}): {item.description}"
-        super().save(data, item.metadata)
+        return f"{item.name}({item.type}): {item.description}"
 
     def reset(self) -> None:
         try:
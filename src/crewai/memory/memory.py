@@ -28,12 +28,31 @@ class Memory(BaseModel):
 
         self.storage.save(value, metadata)
 
+    def _save_many(self, values: List[Any], metadatas: List[Dict[str, Any]]) -> None:
+        """Save several values with one storage call when the storage supports it."""
+        if not values:
+            return
+        save_many = getattr(self.storage, "save_many", None)
+        if save_many is None:
+            for value, metadata in zip(values, metadatas):
+                self.storage.save(value, metadata)
+        else:
+            save_many(values, metadatas)
+
     def search(
         self,
         query: str,
         limit: int = 3,
         score_threshold: float = 0.35,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Any]:
+        if query_embedding is not None:
+            return self.storage.search(
+                query=query,
+                limit=limit,
+                score_threshold=score_threshold,
+                query_embedding=query_embedding,
+            )
         return self.storage.search(
             query=query, limit=limit, score_threshold=score_threshold
         )
@@ -0,0 +1,91 @@
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# A job persists memories and may return (memory, item) pairs whose memory
+# supports `save_many`; the pipeline saves those in batches.
+MemoryWriteJob = Callable[[], Optional[Iterable[Tuple[Any, Any]]]]
+
+_STOP = object()
+
+
+class MemoryWritePipeline:
+    """Write-behind queue that persists task memories on a background worker.
+
+    Jobs are queued in order on a bounded queue, so producers block instead of
+    piling up work when the worker falls behind. The worker drains up to
+    `batch_size` jobs at a time and saves the items they return with one
+    `save_many` call per memory, embedding them in a single round trip.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 100,
+        batch_size: int = 16,
+        name: str = "crewai-memory",
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.name = name
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, job: MemoryWriteJob) -> None:
+        """Queue a job, blocking while the queue is full."""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._worker.start()
+            self._queue.put(job)
+
+    def flush(self) -> None:
+        """Block until every job submitted so far has been processed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Process the pending jobs and stop the worker.
+
+        The pipeline can still be used afterwards; the next `submit` starts a
+        new worker.
+        """
+        with self._lock:
+            worker = self._worker
+            if worker is None:
+                return
+            self._queue.put(_STOP)
+            worker.join()
+            self._worker = None
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            jobs = [self._queue.get()]
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                batches: Dict[int, Tuple[Any, List[Any]]] = {}
+                for job in jobs:
+                    if job is _STOP:
+                        stop = True
+                        continue
+                    try:
+                        for memory, item in job() or []:
+                            batches.setdefault(id(memory), (memory, []))[1].append(item)
+                    except Exception as e:
+                        print(f"Failed to process memory write: {e}")
+
+                for memory, items in batches.values():
+                    try:
+                        memory.save_many(items)
+                    except Exception as e:
+                        print(f"Failed to save memory batch: {e}")
+            finally:
+                for _ in jobs:
+                    self._queue.task_done()
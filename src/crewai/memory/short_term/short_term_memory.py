@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import PrivateAttr
 
@@ -53,20 +53,38 @@ class ShortTermMemory(Memory):
         agent: Optional[str] = None,
     ) -> None:
         item = ShortTermMemoryItem(data=value, metadata=metadata, agent=agent)
-        if self._memory_provider == "mem0":
-            item.data = f"Remember the following insights from Agent run: {item.data}"
+        super().save(
+            value=self._format_data(item), metadata=item.metadata, agent=item.agent
+        )
+
+    def save_many(self, items: List[ShortTermMemoryItem]) -> None:
+        """Saves short-term items with a single storage call so they are embedded in one batch."""
+        metadatas = []
+        for item in items:
+            metadata = dict(item.metadata)
+            if item.agent:
+                metadata["agent"] = item.agent
+            metadatas.append(metadata)
+        self._save_many([self._format_data(item) for item in items], metadatas)
 
-        super().save(value=item.data, metadata=item.metadata, agent=item.agent)
+    def _format_data(self, item: ShortTermMemoryItem) -> Any:
+        if self._memory_provider == "mem0":
+            return f"Remember the following insights from Agent run: {item.data}"
+        return item.data
 
     def search(
         self,
         query: str,
         limit: int = 3,
         score_threshold: float = 0.35,
+        query_embedding: Optional[List[float]] = None,
     ):
-        return self.storage.search(
-            query=query, limit=limit, score_threshold=score_threshold
-        )  # type: ignore # BUG? The reference is to the parent class, but the parent class does not have this parameters
+        return super().search(
+            query=query,
+            limit=limit,
+            score_threshold=score_threshold,
+            query_embedding=query_embedding,
+        )
 
     def reset(self) -> None:
         try:
@@ -39,6 +39,11 @@ class BaseRAGStorage(ABC):
         """Save a value with metadata to the storage."""
         pass
 
+    def save_many(self, values: List[Any], metadatas: List[Dict[str, Any]]) -> None:
+        """Save several values at once. Override to embed them in one batch."""
+        for value, metadata in zip(values, metadatas):
+            self.save(value, metadata)
+
     @abstractmethod
     def search(
         self,
@@ -7,6 +7,10 @@ class Storage:
     def save(self, value: Any, metadata: Dict[str, Any]) -> None:
         pass
 
+    def save_many(self, values: List[Any], metadatas: List[Dict[str, Any]]) -> None:
+        for value, metadata in zip(values, metadatas):
+            self.save(value, metadata)
+
     def search(
         self, query: str, limit: int, score_threshold: float
     ) -> Dict[str, Any] | List[Any]:
@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _PendingItem(Generic[T]):
+    __slots__ = ("item", "done", "error")
+
+    def __init__(self, item: T) -> None:
+        self.item = item
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+
+class MicroBatcher(Generic[T]):
+    """Coalesces concurrent submissions into batches handled by a single call.
+
+    The first caller on an idle batcher becomes the leader: it waits up to
+    `max_latency` seconds for more items (or until `max_batch_size` are
+    queued) and passes the batch to `flush`. Callers arriving while a batch is
+    being flushed are queued for the next one, so concurrent saves are grouped
+    even with `max_latency=0`, without delaying a lone caller.
+
+    `submit` returns once its item has been flushed and re-raises any error
+    raised while flushing its batch.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], None],
+        max_batch_size: int = 64,
+        max_latency: float = 0.0,
+    ) -> None:
+        self._flush = flush
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._condition = threading.Condition()
+        self._pending: List[_PendingItem[T]] = []
+        self._flushing = False
+
+    def submit(self, item: T) -> None:
+        """Queue an item and block until the batch containing it is flushed."""
+        entry = _PendingItem(item)
+        with self._condition:
+            self._pending.append(entry)
+            self._condition.notify_all()
+            while not entry.done:
+                if self._flushing:
+                    self._condition.wait()
+                else:
+                    self._flush_next_batch()
+
+        if entry.error is not None:
+            raise entry.error
+
+    def _flush_next_batch(self) -> None:
+        """Flush one batch as the leader. Must be called holding the condition."""
+        self._flushing = True
+        deadline = time.monotonic() + self.max_latency
+        while len(self._pending) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._condition.wait(remaining)
+
+        batch = self._pending[: self.max_batch_size]
+        del self._pending[: self.max_batch_size]
+
+        error: Optional[BaseException] = None
+        self._condition.release()
+        try:
+            self._flush([entry.item for entry in batch])
+        except Exception as e:
+            error = e
+        finally:
+            self._condition.acquire()
+            for entry in batch:
+                entry.done = True
+                entry.error = error
+            self._flushing = False
+            self._condition.notify_all()
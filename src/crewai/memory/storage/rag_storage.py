@@ -1,15 +1,19 @@
 import contextlib
 import io
+import json
 import logging
 import os
 import shutil
 import uuid
-from typing import Any, Dict, List, Optional
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 
 from chromadb.api import ClientAPI
 
 from crewai.memory.storage.base_rag_storage import BaseRAGStorage
+from crewai.memory.storage.micro_batcher import MicroBatcher
 from crewai.utilities import EmbeddingConfigurator
+from crewai.utilities.chromadb import chroma_registry
 from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
 from crewai.utilities.paths import db_storage_path
 
@@ -35,12 +39,25 @@ class RAGStorage(BaseRAGStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    Concurrent `save` calls are coalesced into a single `collection.add`, so
+    they share one embedding request. `batch_size` caps the number of
+    documents per add and `batch_latency` is how long the first save waits
+    for others to join its batch.
     """
 
     app: ClientAPI | None = None
+    _client_finalizer: Optional[weakref.finalize] = None
 
     def __init__(
-        self, type, allow_reset=True, embedder_config=None, crew=None, path=None
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        batch_size: int = 64,
+        batch_latency: float = 0.0,
     ):
         super().__init__(type, allow_reset, embedder_config, crew)
         agents = crew.agents if crew else []
@@ -53,32 +70,43 @@ class RAGStorage(BaseRAGStorage):
 
         self.allow_reset = allow_reset
         self.path = path
+        self._batcher: MicroBatcher[Tuple[Any, Dict[str, Any]]] = MicroBatcher(
+            self._add_batch, max_batch_size=batch_size, max_latency=batch_latency
+        )
         self._initialize_app()
 
     def _set_embedder_config(self):
+        self.embedder_key = json.dumps(
+            self.embedder_config, sort_keys=True, default=str
+        )
         configurator = EmbeddingConfigurator()
         self.embedder_config = configurator.configure_embedder(self.embedder_config)
 
-    def _initialize_app(self):
-        import chromadb
-        from chromadb.config import Settings
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a search query with this storage's embedding function.
+
+        Storages with the same `embedder_key` produce the same embedding, so
+        it can be computed once and passed to `search` on each of them.
+        """
+        # Embedding functions only have `embed_query` from chromadb 1.0 on
+        embed = getattr(self.embedder_config, "embed_query", self.embedder_config)
+        return list(embed([query])[0])  # type: ignore[misc]
 
+    def _initialize_app(self):
         self._set_embedder_config()
-        chroma_client = chromadb.PersistentClient(
-            path=self.path if self.path else self.storage_file_name,
-            settings=Settings(allow_reset=self.allow_reset),
+        self._release_client()
+        path = self.path if self.path else self.storage_file_name
+        self.app = chroma_registry.acquire(path, allow_reset=self.allow_reset)
+        self._client_finalizer = weakref.finalize(self, chroma_registry.release, path)
+        self.collection = chroma_registry.get_collection(
+            path, self.type, self.embedder_config, self.embedder_key
         )
 
-        self.app = chroma_client
-
-        try:
-            self.collection = self.app.get_collection(
-                name=self.type, embedding_function=self.embedder_config
-            )
-        except Exception:
-            self.collection = self.app.create_collection(
-                name=self.type, embedding_function=self.embedder_config
-            )
+    def _release_client(self) -> None:
+        """Release the pooled client, if one was acquired."""
+        if self._client_finalizer:
+            self._client_finalizer()
+            self._client_finalizer = None
 
     def _sanitize_role(self, role: str) -> str:
         """
@@ -104,23 +132,53 @@ class RAGStorage(BaseRAGStorage):
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
         try:
-            self._generate_embedding(value, metadata)
+            self._batcher.submit((value, metadata))
+        except Exception as e:
+            logging.error(f"Error during {self.type} save: {str(e)}")
+
+    def save_many(self, values: List[Any], metadatas: List[Dict[str, Any]]) -> None:
+        if not values:
+            return
+        if not hasattr(self, "app") or not hasattr(self, "collection"):
+            self._initialize_app()
+        try:
+            self._add_documents(list(values), list(metadatas))
         except Exception as e:
             logging.error(f"Error during {self.type} save: {str(e)}")
 
+    def _add_batch(self, batch: List[Tuple[Any, Dict[str, Any]]]) -> None:
+        self._add_documents(
+            [value for value, _ in batch], [metadata for _, metadata in batch]
+        )
+
+    def _add_documents(
+        self, values: List[Any], metadatas: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        self.collection.add(
+            documents=values,
+            metadatas=[metadata or {} for metadata in metadatas],
+            ids=[str(uuid.uuid4()) for _ in values],
+        )
+
     def search(
         self,
         query: str,
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Any]:
         if not hasattr(self, "app"):
             self._initialize_app()
 
         try:
             with suppress_logging():
-                response = self.collection.query(query_texts=query, n_results=limit)
+                if query_embedding is not None:
+                    response = self.collection.query(
+                        query_embeddings=[query_embedding], n_results=limit
+                    )
+                else:
+                    response = self.collection.query(query_texts=query, n_results=limit)
 
             results = []
             for i in range(len(response["ids"][0])):
@@ -142,17 +200,17 @@ class RAGStorage(BaseRAGStorage):
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
 
-        self.collection.add(
-            documents=[text],
-            metadatas=[metadata or {}],
-            ids=[str(uuid.uuid4())],
-        )
+        self._add_documents([text], [metadata])
 
     def reset(self) -> None:
         try:
             if self.app:
                 self.app.reset()
+                chroma_registry.invalidate(
+                    self.path if self.path else self.storage_file_name
+                )
                 shutil.rmtree(f"{db_storage_path()}/{self.type}")
+                self._release_client()
                 self.app = None
                 self.collection = None
         except Exception as e:
@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from crewai.memory.memory import Memory
 
@@ -43,6 +43,7 @@ class UserMemory(Memory):
         query: str,
         limit: int = 3,
         score_threshold: float = 0.35,
+        query_embedding: Optional[List[float]] = None,
     ):
         results = self.storage.search(
             query=query,
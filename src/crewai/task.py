@@ -1,10 +1,11 @@
+import asyncio
 import datetime
 import inspect
 import json
 import logging
 import threading
 import uuid
-from concurrent.futures import Future
+from concurrent.futures import Executor, Future
 from copy import copy
 from hashlib import md5
 from pathlib import Path
@@ -369,8 +370,17 @@ class Task(BaseModel):
         agent: BaseAgent | None = None,
         context: Optional[str] = None,
         tools: Optional[List[BaseTool]] = None,
+        executor: Optional[Executor] = None,
     ) -> Future[TaskOutput]:
-        """Execute the task asynchronously."""
+        """Execute the task asynchronously.
+
+        When an executor is given the task is queued on it, otherwise it runs
+        on a dedicated daemon thread. Either way, errors raised by the task
+        are delivered through the returned future.
+        """
+        if executor is not None:
+            return executor.submit(self._execute_core, agent, context, tools)
+
         future: Future[TaskOutput] = Future()
         threading.Thread(
             daemon=True,
@@ -387,8 +397,12 @@ class Task(BaseModel):
         future: Future[TaskOutput],
     ) -> None:
         """Execute the task asynchronously with context handling."""
-        result = self._execute_core(agent, context, tools)
-        future.set_result(result)
+        try:
+            result = self._execute_core(agent, context, tools)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
 
     def _execute_core(
         self,
@@ -398,101 +412,195 @@ class Task(BaseModel):
     ) -> TaskOutput:
         """Run the core execution logic of the task."""
         try:
-            agent = agent or self.agent
-            self.agent = agent
-            if not agent:
-                raise Exception(
-                    f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
-                )
-
-            self.start_time = datetime.datetime.now()
-
-            self.prompt_context = context
-            tools = tools or self.tools or []
-
-            self.processed_by_agents.add(agent.role)
-            crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+            agent, tools = self._start_execution(agent, context, tools)
             result = agent.execute_task(
                 task=self,
                 context=context,
                 tools=tools,
             )
 
-            pydantic_output, json_output = self._export_output(result)
-            task_output = TaskOutput(
-                name=self.name,
-                description=self.description,
-                expected_output=self.expected_output,
-                raw=result,
-                pydantic=pydantic_output,
-                json_dict=json_output,
-                agent=agent.role,
-                output_format=self._get_output_format(),
-            )
+            task_output = self._build_task_output(result, agent)
+            agent_output = task_output
 
             if self._guardrail:
                 guardrail_result = self._process_guardrail(task_output)
                 if not guardrail_result.success:
-                    if self.retry_count >= self.max_retries:
-                        raise Exception(
-                            f"Task failed guardrail validation after {self.max_retries} retries. "
-                            f"Last error: {guardrail_result.error}"
-                        )
-
-                    self.retry_count += 1
-                    context = self.i18n.errors("validation_error").format(
-                        guardrail_result_error=guardrail_result.error,
-                        task_output=task_output.raw,
-                    )
-                    printer = Printer()
-                    printer.print(
-                        content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
-                        color="yellow",
+                    context = self._prepare_guardrail_retry(
+                        guardrail_result, task_output
                     )
                     return self._execute_core(agent, context, tools)
 
-                if guardrail_result.result is None:
-                    raise Exception(
-                        "Task guardrail returned None as result. This is not allowed."
-                    )
-
-                if isinstance(guardrail_result.result, str):
-                    task_output.raw = guardrail_result.result
-                    pydantic_output, json_output = self._export_output(
-                        guardrail_result.result
-                    )
-                    task_output.pydantic = pydantic_output
-                    task_output.json_dict = json_output
-                elif isinstance(guardrail_result.result, TaskOutput):
-                    task_output = guardrail_result.result
+                task_output = self._apply_guardrail_result(
+                    guardrail_result, task_output
+                )
 
-            self.output = task_output
+            return self._complete_execution(task_output, agent_output, result)
+        except Exception as e:
             self.end_time = datetime.datetime.now()
+            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
+            raise e  # Re-raise the exception after emitting the event
 
-            if self.callback:
-                self.callback(self.output)
+    async def aexecute(
+        self,
+        agent: Optional[BaseAgent] = None,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> TaskOutput:
+        """Execute the task as a coroutine on the running event loop."""
+        return await self._aexecute_core(agent, context, tools)
+
+    async def _aexecute_core(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> TaskOutput:
+        """Async counterpart of `_execute_core`.
 
-            crew = self.agent.crew  # type: ignore[union-attr]
-            if crew and crew.task_callback and crew.task_callback != self.callback:
-                crew.task_callback(self.output)
+        The agent is awaited through `aexecute_task`. Output conversion,
+        guardrails and callbacks may block, so they run in a worker thread.
+        """
+        try:
+            agent, tools = self._start_execution(agent, context, tools)
+            result = await agent.aexecute_task(
+                task=self,
+                context=context,
+                tools=tools,
+            )
+
+            task_output = await asyncio.to_thread(
+                self._build_task_output, result, agent
+            )
+            agent_output = task_output
 
-            if self.output_file:
-                content = (
-                    json_output
-                    if json_output
-                    else (
-                        pydantic_output.model_dump_json() if pydantic_output else result
+            if self._guardrail:
+                guardrail_result = await asyncio.to_thread(
+                    self._process_guardrail, task_output
+                )
+                if not guardrail_result.success:
+                    context = self._prepare_guardrail_retry(
+                        guardrail_result, task_output
                     )
+                    return await self._aexecute_core(agent, context, tools)
+
+                task_output = await asyncio.to_thread(
+                    self._apply_guardrail_result, guardrail_result, task_output
                 )
-                self._save_file(content)
-            crewai_event_bus.emit(
-                self, TaskCompletedEvent(output=task_output, task=self)
+
+            return await asyncio.to_thread(
+                self._complete_execution, task_output, agent_output, result
             )
-            return task_output
         except Exception as e:
             self.end_time = datetime.datetime.now()
             crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
-            raise e  # Re-raise the exception after emitting the event
+            raise e
+
+    def _start_execution(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> Tuple[BaseAgent, List[Any]]:
+        """Resolve the agent and tools and emit the task started event."""
+        agent = agent or self.agent
+        self.agent = agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+            )
+
+        self.start_time = datetime.datetime.now()
+
+        self.prompt_context = context
+        tools = tools or self.tools or []
+
+        self.processed_by_agents.add(agent.role)
+        crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+        return agent, tools
+
+    def _build_task_output(self, result: str, agent: BaseAgent) -> TaskOutput:
+        pydantic_output, json_output = self._export_output(result)
+        return TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
+
+    def _prepare_guardrail_retry(
+        self, guardrail_result: GuardrailResult, task_output: TaskOutput
+    ) -> str:
+        """Count a guardrail retry and return the context for the next attempt."""
+        if self.retry_count >= self.max_retries:
+            raise Exception(
+                f"Task failed guardrail validation after {self.max_retries} retries. "
+                f"Last error: {guardrail_result.error}"
+            )
+
+        self.retry_count += 1
+        context = self.i18n.errors("validation_error").format(
+            guardrail_result_error=guardrail_result.error,
+            task_output=task_output.raw,
+        )
+        printer = Printer()
+        printer.print(
+            content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
+            color="yellow",
+        )
+        return context
+
+    def _apply_guardrail_result(
+        self, guardrail_result: GuardrailResult, task_output: TaskOutput
+    ) -> TaskOutput:
+        if guardrail_result.result is None:
+            raise Exception(
+                "Task guardrail returned None as result. This is not allowed."
+            )
+
+        if isinstance(guardrail_result.result, str):
+            task_output.raw = guardrail_result.result
+            pydantic_output, json_output = self._export_output(guardrail_result.result)
+            task_output.pydantic = pydantic_output
+            task_output.json_dict = json_output
+        elif isinstance(guardrail_result.result, TaskOutput):
+            task_output = guardrail_result.result
+        return task_output
+
+    def _complete_execution(
+        self, task_output: TaskOutput, agent_output: TaskOutput, result: str
+    ) -> TaskOutput:
+        """Store the output, run callbacks, save the output file and emit completion.
+
+        The output file is written from the agent's output, which a string
+        guardrail updates in place, and the agent's raw result.
+        """
+        self.output = task_output
+        self.end_time = datetime.datetime.now()
+
+        if self.callback:
+            self.callback(self.output)
+
+        crew = self.agent.crew  # type: ignore[union-attr]
+        if crew and crew.task_callback and crew.task_callback != self.callback:
+            crew.task_callback(self.output)
+
+        if self.output_file:
+            content = (
+                agent_output.json_dict
+                if agent_output.json_dict
+                else (
+                    agent_output.pydantic.model_dump_json()
+                    if agent_output.pydantic
+                    else result
+                )
+            )
+            self._save_file(content)
+        crewai_event_bus.emit(self, TaskCompletedEvent(output=task_output, task=self))
+        return task_output
 
     def _process_guardrail(self, task_output: TaskOutput) -> GuardrailResult:
         assert self._guardrail is not None
@@ -681,6 +789,38 @@ Follow these guidelines:
 
         return copied_task
 
+    def _copy_for_run(self, agent: Optional["BaseAgent"]) -> "Task":
+        """Create a copy-on-write clone of the task for a separate run.
+
+        Configuration, tools and guardrails are shared with the original, while
+        the output and execution counters start fresh. `context` still points
+        at the original tasks and is remapped by the caller.
+
+        Args:
+            agent: The agent the cloned task is assigned to.
+
+        Returns:
+            A shallow copy of the task with the same class type as the original.
+        """
+        copied_task = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agent": agent,
+                "tools": list(self.tools) if self.tools is not None else None,
+                "output": None,
+                "prompt_context": None,
+                "processed_by_agents": set(),
+                "retry_count": 0,
+                "used_tools": 0,
+                "tools_errors": 0,
+                "delegations": 0,
+                "start_time": None,
+                "end_time": None,
+            }
+        )
+        copied_task._thread = None
+        return copied_task
+
     def _export_output(
         self, result: str
     ) -> Tuple[Optional[BaseModel], Optional[Dict[str, Any]]]:
@@ -1,11 +1,12 @@
 import ast
 import datetime
+import inspect
 import json
 import time
 from difflib import SequenceMatcher
 from json import JSONDecodeError
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import json5
 from json_repair import repair_json
@@ -107,65 +108,173 @@ class ToolUsage:
     def use(
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
+        tool, error = self._select_tool_for_use(calling)
+        if error is not None:
+            return error
+
+        if self._is_add_image_tool(tool):
+            try:
+                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
+                return result
+
+            except Exception as e:
+                return self._handle_use_error(e)
+
+        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    async def ause(
+        self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
+    ) -> str:
+        """Async counterpart of `use` that awaits the tool instead of blocking."""
+        tool, error = self._select_tool_for_use(calling)
+        if error is not None:
+            return error
+
+        if self._is_add_image_tool(tool):
+            try:
+                return await self._ause(
+                    tool_string=tool_string, tool=tool, calling=calling
+                )
+            except Exception as e:
+                return self._handle_use_error(e)
+
+        return (
+            f"{await self._ause(tool_string=tool_string, tool=tool, calling=calling)}"
+        )
+
+    def _select_tool_for_use(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Tuple[Any, Optional[str]]:
+        """Resolve the tool for a calling, returning an error message on failure."""
         if isinstance(calling, ToolUsageErrorException):
             error = calling.message
             if self.agent and self.agent.verbose:
                 self._printer.print(content=f"\n\n{error}\n", color="red")
             if self.task:
                 self.task.increment_tools_errors()
-            return error
+            return None, error
 
         try:
-            tool = self._select_tool(calling.tool_name)
+            return self._select_tool(calling.tool_name), None
         except Exception as e:
             error = getattr(e, "message", str(e))
             if self.task:
                 self.task.increment_tools_errors()
             if self.agent and self.agent.verbose:
                 self._printer.print(content=f"\n\n{error}\n", color="red")
-            return error
+            return None, error
 
-        if (
+    def _is_add_image_tool(self, tool: Any) -> bool:
+        return (
             isinstance(tool, CrewStructuredTool)
             and tool.name == self._i18n.tools("add_image")["name"]  # type: ignore
-        ):
-            try:
-                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
-                return result
+        )
+
+    def _handle_use_error(self, e: Exception) -> str:
+        error = getattr(e, "message", str(e))
+        if self.task:
+            self.task.increment_tools_errors()
+        if self.agent and self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
 
+    def _use(
+        self,
+        tool_string: str,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> str:
+        if self._check_tool_repeated_usage(calling=calling):  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
+            repeated_usage_result = self._handle_repeated_usage(tool)
+            if repeated_usage_result is not None:
+                return repeated_usage_result
+
+        started_at, result, available_tool = self._start_tool_usage(tool, calling)
+        from_cache = result is not None
+
+        usage_limit_result = self._handle_usage_limit(available_tool, tool)
+        if usage_limit_result is not None:
+            return usage_limit_result
+
+        if result is None:
+            try:
+                self._track_delegation(calling)
+                result = self._invoke_tool(tool, calling)
             except Exception as e:
-                error = getattr(e, "message", str(e))
-                if self.task:
-                    self.task.increment_tools_errors()
-                if self.agent and self.agent.verbose:
-                    self._printer.print(content=f"\n\n{error}\n", color="red")
-                return error
+                error = self._handle_tool_invocation_error(tool, calling, e)
+                if error is not None:
+                    return error  # type: ignore # No return value expected
+                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
 
-        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+            self._cache_tool_result(available_tool, calling, result)
 
-    def _use(
+        return self._finish_tool_usage(
+            tool, calling, available_tool, from_cache, started_at, result
+        )
+
+    async def _ause(
         self,
         tool_string: str,
         tool: CrewStructuredTool,
         calling: Union[ToolCalling, InstructorToolCalling],
     ) -> str:
+        """Async counterpart of `_use`, awaiting `CrewStructuredTool.ainvoke`."""
         if self._check_tool_repeated_usage(calling=calling):  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
+            repeated_usage_result = self._handle_repeated_usage(tool)
+            if repeated_usage_result is not None:
+                return repeated_usage_result
+
+        started_at, result, available_tool = self._start_tool_usage(tool, calling)
+        from_cache = result is not None
+
+        usage_limit_result = self._handle_usage_limit(available_tool, tool)
+        if usage_limit_result is not None:
+            return usage_limit_result
+
+        if result is None:
             try:
-                result = self._i18n.errors("task_repeated_usage").format(
-                    tool_names=self.tools_names
-                )
-                self._telemetry.tool_repeated_usage(
-                    llm=self.function_calling_llm,
-                    tool_name=tool.name,
-                    attempts=self._run_attempts,
-                )
-                result = self._format_result(result=result)  # type: ignore #  "_format_result" of "ToolUsage" does not return a value (it only ever returns None)
-                return result  # type: ignore # Fix the return type of this function
+                self._track_delegation(calling)
+                result = await self._ainvoke_tool(tool, calling)
+            except Exception as e:
+                error = self._handle_tool_invocation_error(tool, calling, e)
+                if error is not None:
+                    return error
+                return await self.ause(calling=calling, tool_string=tool_string)
 
-            except Exception:
-                if self.task:
-                    self.task.increment_tools_errors()
+            self._cache_tool_result(available_tool, calling, result)
 
+        return self._finish_tool_usage(
+            tool, calling, available_tool, from_cache, started_at, result
+        )
+
+    def _handle_repeated_usage(self, tool: CrewStructuredTool) -> Optional[str]:
+        try:
+            result = self._i18n.errors("task_repeated_usage").format(
+                tool_names=self.tools_names
+            )
+            self._telemetry.tool_repeated_usage(
+                llm=self.function_calling_llm,
+                tool_name=tool.name,
+                attempts=self._run_attempts,
+            )
+            result = self._format_result(result=result)  # type: ignore #  "_format_result" of "ToolUsage" does not return a value (it only ever returns None)
+            return result  # type: ignore # Fix the return type of this function
+
+        except Exception:
+            if self.task:
+                self.task.increment_tools_errors()
+        return None
+
+    def _start_tool_usage(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Tuple[float, Any, Any]:
+        """Emit the started event and look the call up in the tools cache.
+
+        Returns:
+            Tuple of (start timestamp, cached result or None, available tool)
+        """
         if self.agent:
             event_data = {
                 "agent_key": self.agent.key,
@@ -182,14 +291,12 @@ class ToolUsage:
             crewai_event_bus.emit(self,ToolUsageStartedEvent(**event_data))
             
         started_at = time.time()
-        from_cache = False
         result = None  # type: ignore
 
         if self.tools_handler and self.tools_handler.cache:
             result = self.tools_handler.cache.read(
                 tool=calling.tool_name, input=calling.arguments
             )  # type: ignore
-            from_cache = result is not None
 
         available_tool = next(
             (
@@ -199,7 +306,11 @@ class ToolUsage:
             ),
             None,
         )
+        return started_at, result, available_tool
 
+    def _handle_usage_limit(
+        self, available_tool: Any, tool: CrewStructuredTool
+    ) -> Optional[str]:
         usage_limit_error = self._check_usage_limit(available_tool, tool.name)
         if usage_limit_error:
             try:
@@ -210,77 +321,136 @@ class ToolUsage:
             except Exception:
                 if self.task:
                     self.task.increment_tools_errors()
+        return None
 
-        if result is None:
+    def _track_delegation(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> None:
+        if calling.tool_name in [
+            "Delegate work to coworker",
+            "Ask question to coworker",
+        ]:
+            coworker = calling.arguments.get("coworker") if calling.arguments else None
+            if self.task:
+                self.task.increment_delegations(coworker)
+
+    def _filter_tool_arguments(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> dict:
+        """Keep only the arguments declared in the tool's schema."""
+        acceptable_args = tool.args_schema.model_json_schema()["properties"].keys()  # type: ignore
+        arguments = calling.arguments or {}
+        return {k: v for k, v in arguments.items() if k in acceptable_args}
+
+    def _invoke_tool(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Any:
+        if calling.arguments:
             try:
-                if calling.tool_name in [
-                    "Delegate work to coworker",
-                    "Ask question to coworker",
-                ]:
-                    coworker = (
-                        calling.arguments.get("coworker") if calling.arguments else None
-                    )
-                    if self.task:
-                        self.task.increment_delegations(coworker)
-
-                if calling.arguments:
-                    try:
-                        acceptable_args = tool.args_schema.model_json_schema()[
-                            "properties"
-                        ].keys()  # type: ignore
-                        arguments = {
-                            k: v
-                            for k, v in calling.arguments.items()
-                            if k in acceptable_args
-                        }
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                    except Exception:
-                        arguments = calling.arguments
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                else:
-                    # Add fingerprint metadata even to empty arguments
-                    arguments = self._add_fingerprint_metadata({})
-                    result = tool.invoke(input=arguments)
-            except Exception as e:
-                self.on_tool_error(tool=tool, tool_calling=calling, e=e)
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    self._telemetry.tool_usage_error(llm=self.function_calling_llm)
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e, tool=tool.name, tool_inputs=tool.description
-                    )
-                    error = ToolUsageErrorException(
-                        f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
-                    ).message
-                    if self.task:
-                        self.task.increment_tools_errors()
-                    if self.agent and self.agent.verbose:
-                        self._printer.print(
-                            content=f"\n\n{error_message}\n", color="red"
-                        )
-                    return error  # type: ignore # No return value expected
+                arguments = self._filter_tool_arguments(tool, calling)
+                # Add fingerprint metadata if available
+                arguments = self._add_fingerprint_metadata(arguments)
+                return tool.invoke(input=arguments)
+            except Exception:
+                arguments = calling.arguments
+                # Add fingerprint metadata if available
+                arguments = self._add_fingerprint_metadata(arguments)
+                return tool.invoke(input=arguments)
+        # Add fingerprint metadata even to empty arguments
+        arguments = self._add_fingerprint_metadata({})
+        return tool.invoke(input=arguments)
+
+    async def _ainvoke_tool(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Any:
+        if calling.arguments:
+            try:
+                arguments = self._filter_tool_arguments(tool, calling)
+                arguments = self._add_fingerprint_metadata(arguments)
+                return await self._await_tool_result(tool, arguments)
+            except Exception:
+                arguments = self._add_fingerprint_metadata(calling.arguments)
+                return await self._await_tool_result(tool, arguments)
+        arguments = self._add_fingerprint_metadata({})
+        return await self._await_tool_result(tool, arguments)
+
+    async def _await_tool_result(
+        self, tool: CrewStructuredTool, arguments: dict
+    ) -> Any:
+        # Tools wrapping an async function through a sync `_run` hand back a
+        # coroutine from the worker thread, so await it here as well.
+        result = await tool.ainvoke(input=arguments)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
 
-                if self.task:
-                    self.task.increment_tools_errors()
-                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
+    def _handle_tool_invocation_error(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: Exception,
+    ) -> Optional[str]:
+        """Record a failed tool invocation.
 
-            if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(available_tool, "cache_function")
-                    and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                ):
-                    should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                        calling.arguments, result
-                    )
+        Returns:
+            The error message once the parsing attempts are exhausted, or None
+            when the caller should retry the tool.
+        """
+        self.on_tool_error(tool=tool, tool_calling=calling, e=e)
+        self._run_attempts += 1
+        if self._run_attempts > self._max_parsing_attempts:
+            self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+            error_message = self._i18n.errors("tool_usage_exception").format(
+                error=e, tool=tool.name, tool_inputs=tool.description
+            )
+            error = ToolUsageErrorException(
+                f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
+            ).message
+            if self.task:
+                self.task.increment_tools_errors()
+            if self.agent and self.agent.verbose:
+                self._printer.print(content=f"\n\n{error_message}\n", color="red")
+            return error
 
-                self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+        if self.task:
+            self.task.increment_tools_errors()
+        return None
+
+    def _cache_tool_result(
+        self,
+        available_tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+    ) -> None:
+        if self.tools_handler:
+            should_cache = True
+            if (
+                hasattr(available_tool, "cache_function")
+                and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+            ):
+                should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+                    calling.arguments, result
                 )
+
+            self.tools_handler.on_tool_use(
+                calling=calling, output=result, should_cache=should_cache
+            )
+
+    def _finish_tool_usage(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        available_tool: Any,
+        from_cache: bool,
+        started_at: float,
+        result: Any,
+    ) -> str:
         self._telemetry.tool_usage(
             llm=self.function_calling_llm,
             tool_name=tool.name,
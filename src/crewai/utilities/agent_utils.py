@@ -1,6 +1,17 @@
+import asyncio
 import json
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from crewai.agents.parser import (
     FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE,
@@ -56,6 +67,40 @@ def render_text_description_and_args(
     return "\n".join(tool_strings)
 
 
+def render_function_schemas(
+    tools: Sequence[CrewStructuredTool],
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """Describe tools as function schemas for the LLM's native tool calling.
+
+    Providers only accept letters, digits, underscores and dashes in function
+    names, so tool names are sanitized.
+
+    Returns:
+        The function schemas, and a map from their function names back to
+        tool names.
+    """
+    schemas = []
+    tool_names: Dict[str, str] = {}
+    for tool in tools:
+        base_name = re.sub(r"[^a-zA-Z0-9_-]", "_", tool.name)[:64]
+        function_name, suffix = base_name, 1
+        while function_name in tool_names:
+            suffix += 1
+            function_name = f"{base_name[:60]}_{suffix}"
+        tool_names[function_name] = tool.name
+        schemas.append(
+            {
+                "type": "function",
+                "function": {
+                    "name": function_name,
+                    "description": tool.description,
+                    "parameters": tool.args_schema.model_json_schema(),
+                },
+            }
+        )
+    return schemas, tool_names
+
+
 def has_reached_max_iterations(iterations: int, max_iterations: int) -> bool:
     """Check if the maximum number of iterations has been reached."""
     return iterations >= max_iterations
@@ -79,6 +124,42 @@ def handle_max_iterations_exceeded(
     Returns:
         The final formatted answer after exceeding max iterations.
     """
+    _request_forced_final_answer(formatted_answer, printer, i18n, messages)
+
+    # Perform one more LLM call to get the final answer
+    answer = llm.call(
+        messages,
+        callbacks=callbacks,
+    )
+
+    return _format_forced_final_answer(answer, printer)
+
+
+async def ahandle_max_iterations_exceeded(
+    formatted_answer: Union[AgentAction, AgentFinish, None],
+    printer: Printer,
+    i18n: I18N,
+    messages: List[Dict[str, str]],
+    llm: Union[LLM, BaseLLM],
+    callbacks: List[Any],
+) -> Union[AgentAction, AgentFinish]:
+    """Async counterpart of `handle_max_iterations_exceeded`."""
+    _request_forced_final_answer(formatted_answer, printer, i18n, messages)
+
+    answer = await llm.acall(
+        messages,
+        callbacks=callbacks,
+    )
+
+    return _format_forced_final_answer(answer, printer)
+
+
+def _request_forced_final_answer(
+    formatted_answer: Union[AgentAction, AgentFinish, None],
+    printer: Printer,
+    i18n: I18N,
+    messages: List[Dict[str, str]],
+) -> None:
     printer.print(
         content="Maximum iterations reached. Requesting final answer.",
         color="yellow",
@@ -93,12 +174,10 @@ def handle_max_iterations_exceeded(
 
     messages.append(format_message_for_llm(assistant_message, role="assistant"))
 
-    # Perform one more LLM call to get the final answer
-    answer = llm.call(
-        messages,
-        callbacks=callbacks,
-    )
 
+def _format_forced_final_answer(
+    answer: Any, printer: Printer
+) -> Union[AgentAction, AgentFinish]:
     if answer is None or answer == "":
         printer.print(
             content="Received None or empty response from LLM call.",
@@ -137,6 +216,17 @@ def enforce_rpm_limit(
         request_within_rpm_limit()
 
 
+async def aenforce_rpm_limit(
+    request_within_rpm_limit: Optional[Callable[[], bool]] = None,
+    arequest_within_rpm_limit: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> None:
+    """Enforce the RPM limit without blocking the event loop while waiting."""
+    if arequest_within_rpm_limit:
+        await arequest_within_rpm_limit()
+    elif request_within_rpm_limit:
+        await asyncio.to_thread(request_within_rpm_limit)
+
+
 def get_llm_response(
     llm: Union[LLM, BaseLLM],
     messages: List[Dict[str, str]],
@@ -155,6 +245,69 @@ def get_llm_response(
             color="red",
         )
         raise e
+    return _validate_llm_response(answer, printer)
+
+
+def get_llm_tool_calls(
+    llm: Union[LLM, BaseLLM],
+    messages: List[Dict[str, str]],
+    tools: List[Dict[str, Any]],
+    callbacks: List[Any],
+    printer: Printer,
+) -> Union[str, List[Any]]:
+    """Call the LLM with function schemas, returning its text answer or the tool calls it requested."""
+    try:
+        answer = llm.call_with_tools(messages, tools, callbacks=callbacks)
+    except Exception as e:
+        printer.print(
+            content=f"Error during LLM call: {e}",
+            color="red",
+        )
+        raise e
+    return _validate_llm_response(answer, printer)
+
+
+async def aget_llm_response(
+    llm: Union[LLM, BaseLLM],
+    messages: List[Dict[str, str]],
+    callbacks: List[Any],
+    printer: Printer,
+) -> str:
+    """Await the LLM and return the response, handling any invalid responses."""
+    try:
+        answer = await llm.acall(
+            messages,
+            callbacks=callbacks,
+        )
+    except Exception as e:
+        printer.print(
+            content=f"Error during LLM call: {e}",
+            color="red",
+        )
+        raise e
+    return _validate_llm_response(answer, printer)
+
+
+async def aget_llm_tool_calls(
+    llm: Union[LLM, BaseLLM],
+    messages: List[Dict[str, str]],
+    tools: List[Dict[str, Any]],
+    callbacks: List[Any],
+    printer: Printer,
+) -> Union[str, List[Any]]:
+    """Await the LLM with function schemas, as in `get_llm_tool_calls`."""
+    try:
+        answer = await llm.acall_with_tools(messages, tools, callbacks=callbacks)
+    except Exception as e:
+        printer.print(
+            content=f"Error during LLM call: {e}",
+            color="red",
+        )
+        raise e
+    return _validate_llm_response(answer, printer)
+
+
+def _validate_llm_response(answer: Any, printer: Printer) -> Any:
     if not answer:
         printer.print(
             content="Received None or empty response from LLM call.",
@@ -1,5 +1,6 @@
 import re
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 MIN_COLLECTION_LENGTH = 3
 MAX_COLLECTION_LENGTH = 63
@@ -60,3 +61,85 @@ def sanitize_collection_name(name: Optional[str]) -> str:
             sanitized = sanitized[:-1] + "z"
 
     return sanitized
+
+
+class ChromaClientRegistry:
+    """Process-wide pool of Chroma clients and collections.
+
+    Storages acquire a client for their persist directory and release it when
+    they are garbage collected, so every storage (and every crew copy) using
+    the same path shares one client and one handle per collection instead of
+    opening its own. A path is dropped from the pool once its last user
+    releases it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._clients: Dict[str, Any] = {}
+        self._ref_counts: Dict[str, int] = {}
+        self._collections: Dict[Tuple[str, str, str], Any] = {}
+
+    def acquire(self, path: str, allow_reset: bool = True) -> Any:
+        """Return the shared client for `path`, creating it on first use.
+
+        The settings of the first caller win; later callers share its client.
+        """
+        import chromadb
+        from chromadb.config import Settings
+
+        with self._lock:
+            client = self._clients.get(path)
+            if client is None:
+                client = chromadb.PersistentClient(
+                    path=path, settings=Settings(allow_reset=allow_reset)
+                )
+                self._clients[path] = client
+            self._ref_counts[path] = self._ref_counts.get(path, 0) + 1
+            return client
+
+    def get_collection(
+        self,
+        path: str,
+        name: str,
+        embedding_function: Any,
+        embedder_key: str,
+    ) -> Any:
+        """Return the shared collection `name` at an acquired `path`.
+
+        Collections are keyed on `embedder_key` as well, since a collection
+        handle embeds with the function it was opened with.
+        """
+        key = (path, name, embedder_key)
+        with self._lock:
+            collection = self._collections.get(key)
+            if collection is None:
+                client = self._clients[path]
+                collection = client.get_or_create_collection(
+                    name=name, embedding_function=embedding_function
+                )
+                self._collections[key] = collection
+            return collection
+
+    def invalidate(self, path: str) -> None:
+        """Forget the collections at `path`, e.g. after the client was reset."""
+        with self._lock:
+            for key in [key for key in self._collections if key[0] == path]:
+                del self._collections[key]
+
+    def release(self, path: str) -> None:
+        """Release one reference to `path`, dropping it when none are left."""
+        with self._lock:
+            count = self._ref_counts.get(path, 0) - 1
+            if count > 0:
+                self._ref_counts[path] = count
+                return
+            self._ref_counts.pop(path, None)
+            self._clients.pop(path, None)
+            self.invalidate(path)
+
+    def ref_count(self, path: str) -> int:
+        with self._lock:
+            return self._ref_counts.get(path, 0)
+
+
+chroma_registry = ChromaClientRegistry()
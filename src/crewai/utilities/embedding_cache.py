@@ -0,0 +1,136 @@
+import base64
+import hashlib
+import json
+from array import array
+from typing import Any, Dict, List, Optional
+
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.agents.cache.cache_handler import CacheHandler
+
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+DEFAULT_EMBEDDING_CACHE_BYTES = 64 * 1024 * 1024
+
+_embedding_cache: Optional[CacheHandler] = CacheHandler(
+    max_entries=DEFAULT_EMBEDDING_CACHE_SIZE, max_bytes=DEFAULT_EMBEDDING_CACHE_BYTES
+)
+
+
+def get_embedding_cache() -> Optional[CacheHandler]:
+    """Return the process-wide embedding cache, or None when it is disabled."""
+    return _embedding_cache
+
+
+def set_embedding_cache(cache: Optional[CacheHandler]) -> None:
+    """Replace the process-wide embedding cache.
+
+    Pass a `CacheHandler` with a `SQLiteCacheStorage` to keep embeddings
+    across runs, or None to disable caching. Embedding functions configured
+    afterwards use the new cache.
+    """
+    global _embedding_cache
+    _embedding_cache = cache
+
+
+def embedder_cache_key(embedder_config: Optional[Dict[str, Any]]) -> str:
+    """Build the cache namespace for an embedder configuration."""
+    rendered = json.dumps(embedder_config, sort_keys=True, default=str)
+    return hashlib.sha256(rendered.encode()).hexdigest()
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embedding function that reuses vectors from a shared `CacheHandler`.
+
+    Texts are looked up under the embedder's namespace, so every storage built
+    from the same embedder configuration shares entries, and only the misses
+    are sent to the wrapped function in a single call. Documents and queries
+    are cached separately because some providers embed them differently.
+    Vectors are cached as base64-encoded float32 arrays, which keeps entries
+    small in memory and on disk and lets the cache size them cheaply.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        namespace: str,
+        cache: CacheHandler,
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.namespace = namespace
+        self.cache = cache
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return self._embed(input, "document", self.embedding_function)
+
+    def embed_query(self, input: Documents) -> Embeddings:
+        # Embedding functions only have `embed_query` from chromadb 1.0 on
+        embed = getattr(self.embedding_function, "embed_query", self.embedding_function)
+        return self._embed(input, "query", embed)
+
+    def _embed(self, input: Documents, kind: str, embed: Any) -> Embeddings:
+        tool = f"{self.namespace}-{kind}"
+        keys = [hashlib.sha256(text.encode()).hexdigest() for text in input]
+        vectors: Dict[str, List[float]] = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, input):
+            if key in vectors or key in missing:
+                continue
+            cached = self.cache.read(tool, key)
+            if cached is None:
+                missing[key] = text
+            else:
+                vectors[key] = _decode(cached)
+
+        if missing:
+            embeddings = embed(list(missing.values()))
+            for key, embedding in zip(missing, embeddings):
+                encoded = _encode(embedding)
+                self.cache.add(tool, key, encoded)
+                vectors[key] = _decode(encoded)
+
+        return [vectors[key] for key in keys]  # type: ignore[misc]
+
+    def name(self) -> str:  # type: ignore[override]
+        return self.embedding_function.name()
+
+    def get_config(self) -> Dict[str, Any]:
+        return self.embedding_function.get_config()
+
+    def is_legacy(self) -> bool:
+        # Chroma registers non-legacy functions by class under `name()`, which
+        # would map the wrapped provider's name to this wrapper. Collections
+        # are always opened with an explicit embedding function, so nothing
+        # is lost by not persisting its config.
+        return True
+
+    def default_space(self) -> Any:
+        return self.embedding_function.default_space()
+
+    def supported_spaces(self) -> List[Any]:
+        return self.embedding_function.supported_spaces()
+
+
+def _encode(vector: Any) -> str:
+    return base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+
+
+def _decode(cached: Any) -> List[float]:
+    if not isinstance(cached, str):
+        # Entries cached as plain lists of floats
+        return [float(value) for value in cached]
+    vector = array("f")
+    vector.frombytes(base64.b64decode(cached))
+    return vector.tolist()
+
+
+def with_embedding_cache(
+    embedding_function: EmbeddingFunction,
+    embedder_config: Optional[Dict[str, Any]] = None,
+) -> EmbeddingFunction:
+    """Wrap an embedding function with the process-wide cache, if enabled."""
+    cache = get_embedding_cache()
+    if cache is None or isinstance(embedding_function, CachedEmbeddingFunction):
+        return embedding_function
+    return CachedEmbeddingFunction(
+        embedding_function, embedder_cache_key(embedder_config), cache
+    )
@@ -1,9 +1,23 @@
 import os
+import uuid
+import weakref
 from typing import Any, Dict, Optional, cast
 
 from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.api.types import validate_embedding_function
 
+# Tokens naming the cache namespace of each custom embedder instance. Unlike
+# `id()`, a token is never reused by a later instance.
+_instance_tokens: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def _instance_token(instance: Any) -> str:
+    try:
+        return _instance_tokens.setdefault(instance, uuid.uuid4().hex)
+    except TypeError:
+        # Not hashable or weakly referenceable, so it cannot be shared
+        return uuid.uuid4().hex
+
 
 class EmbeddingConfigurator:
     def __init__(self):
@@ -25,9 +39,15 @@ class EmbeddingConfigurator:
         self,
         embedder_config: Optional[Dict[str, Any]] = None,
     ) -> EmbeddingFunction:
-        """Configures and returns an embedding function based on the provided config."""
+        """Configures and returns an embedding function based on the provided config.
+
+        The function is wrapped with the process-wide embedding cache, so
+        storages configured with the same embedder share embedded texts.
+        """
+        from crewai.utilities.embedding_cache import with_embedding_cache
+
         if embedder_config is None:
-            return self._create_default_embedding_function()
+            return with_embedding_cache(self._create_default_embedding_function())
 
         provider = embedder_config.get("provider")
         config = embedder_config.get("config", {})
@@ -39,10 +59,15 @@ class EmbeddingConfigurator:
             )
 
         embedding_function = self.embedding_functions[provider]
-        return (
-            embedding_function(config)
-            if provider == "custom"
-            else embedding_function(config, model_name)
+        if provider == "custom":
+            # Custom embedders cannot be compared by config, so each instance
+            # gets its own cache namespace.
+            instance = embedding_function(config)
+            return with_embedding_cache(
+                instance, {"provider": provider, "instance": _instance_token(instance)}
+            )
+        return with_embedding_cache(
+            embedding_function(config, model_name), embedder_config
         )
 
     @staticmethod
@@ -1,6 +1,6 @@
 import threading
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Type, TypeVar, cast
+from typing import Any, Callable, Dict, List, Set, Tuple, Type, TypeVar, cast
 
 from blinker import Signal
 
@@ -14,6 +14,10 @@ class CrewAIEventsBus:
     """
     A singleton event bus that uses blinker signals for event handling.
     Allows both internal (Flow/Crew) and external event handling.
+
+    Handlers for a concrete event class are resolved once from its MRO and
+    kept in a dispatch table until a handler is registered or the handler
+    scope changes.
     """
 
     _instance = None
@@ -31,9 +35,14 @@ class CrewAIEventsBus:
         """Initialize the event bus internal state"""
         self._signal = Signal("crewai_event_bus")
         self._handlers: Dict[Type[BaseEvent], List[Callable]] = {}
+        self._dispatch_table: Dict[
+            Type[BaseEvent], List[Tuple[Type[BaseEvent], Callable]]
+        ] = {}
+        self._handlers_lock = threading.RLock()
+        self._payload_free_handlers: Set[Callable] = set()
 
     def on(
-        self, event_type: Type[EventT]
+        self, event_type: Type[EventT], reads_payload: bool = True
     ) -> Callable[[Callable[[Any, EventT], None]], Callable[[Any, EventT], None]]:
         """
         Decorator to register an event handler for a specific event type.
@@ -45,16 +54,18 @@ class CrewAIEventsBus:
             ):
                 print(f"👍 Agent '{event.agent}' completed task")
                 print(f"   Output: {event.output}")
+
+        Args:
+            event_type: The event class to handle
+            reads_payload: Pass False for handlers that only read an event's
+                names and ids, so emitters may skip building costly fields
+                such as flow state snapshots for them
         """
 
         def decorator(
             handler: Callable[[Any, EventT], None],
         ) -> Callable[[Any, EventT], None]:
-            if event_type not in self._handlers:
-                self._handlers[event_type] = []
-            self._handlers[event_type].append(
-                cast(Callable[[Any, EventT], None], handler)
-            )
+            self._add_handler(event_type, handler, reads_payload)
             return handler
 
         return decorator
@@ -67,27 +78,74 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        for event_type, handlers in self._handlers.items():
-            if isinstance(event, event_type):
-                for handler in handlers:
-                    try:
-                        handler(source, event)
-                    except Exception as e:
-                        print(
-                            f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
-                        )
-
-        self._signal.send(source, event=event)
+        for event_type, handler in self._resolve_handlers(type(event)):
+            try:
+                handler(source, event)
+            except Exception as e:
+                print(
+                    f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
+                )
+
+        if self._signal.receivers:
+            self._signal.send(source, event=event)
+
+    def has_listeners(
+        self, event_type: Type[BaseEvent], needs_payload: bool = False
+    ) -> bool:
+        """
+        Check whether emitting an event of this type would reach any handler.
+
+        Hot paths use this to skip building events nobody listens to.
+
+        Args:
+            event_type: The concrete event class that would be emitted
+            needs_payload: Only count handlers that read the event's payload,
+                leaving out those registered with `reads_payload=False`
+        """
+        handlers = self._resolve_handlers(event_type)
+        if needs_payload:
+            handlers = [
+                (handled_type, handler)
+                for handled_type, handler in handlers
+                if handler not in self._payload_free_handlers
+            ]
+        return bool(handlers or self._signal.receivers)
 
     def register_handler(
         self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
     ) -> None:
         """Register an event handler for a specific event type"""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(
-            cast(Callable[[Any, EventTypes], None], handler)
-        )
+        self._add_handler(event_type, handler)
+
+    def _add_handler(
+        self, event_type: Type[BaseEvent], handler: Callable, reads_payload: bool = True
+    ) -> None:
+        with self._handlers_lock:
+            if event_type not in self._handlers:
+                self._handlers[event_type] = []
+            self._handlers[event_type].append(cast(Callable[[Any, Any], None], handler))
+            if reads_payload:
+                self._payload_free_handlers.discard(handler)
+            else:
+                self._payload_free_handlers.add(handler)
+            self._dispatch_table = {}
+
+    def _resolve_handlers(
+        self, event_class: Type[BaseEvent]
+    ) -> List[Tuple[Type[BaseEvent], Callable]]:
+        """Return the handlers for an event class, in registration order of their event types."""
+        handlers = self._dispatch_table.get(event_class)
+        if handlers is None:
+            with self._handlers_lock:
+                mro = set(event_class.__mro__)
+                handlers = [
+                    (event_type, handler)
+                    for event_type, type_handlers in self._handlers.items()
+                    if event_type in mro
+                    for handler in type_handlers
+                ]
+                self._dispatch_table[event_class] = handlers
+        return handlers
 
     @contextmanager
     def scoped_handlers(self):
@@ -103,12 +161,16 @@ class CrewAIEventsBus:
                 # Do stuff...
             # Handlers are cleared after the context
         """
-        previous_handlers = self._handlers.copy()
-        self._handlers.clear()
+        with self._handlers_lock:
+            previous_handlers = self._handlers.copy()
+            self._handlers.clear()
+            self._dispatch_table = {}
         try:
             yield
         finally:
-            self._handlers = previous_handlers
+            with self._handlers_lock:
+                self._handlers = previous_handlers
+                self._dispatch_table = {}
 
 
 # Global instance
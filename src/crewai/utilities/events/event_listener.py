@@ -252,7 +252,7 @@ class EventListener(BaseEventListener):
                 self.formatter.current_flow_tree, event.flow_name, source.flow_id
             )
 
-        @crewai_event_bus.on(MethodExecutionStartedEvent)
+        @crewai_event_bus.on(MethodExecutionStartedEvent, reads_payload=False)
         def on_method_execution_started(source, event: MethodExecutionStartedEvent):
             self.formatter.update_method_status(
                 self.formatter.current_method_branch,
@@ -261,7 +261,7 @@ class EventListener(BaseEventListener):
                 "running",
             )
 
-        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        @crewai_event_bus.on(MethodExecutionFinishedEvent, reads_payload=False)
         def on_method_execution_finished(source, event: MethodExecutionFinishedEvent):
             self.formatter.update_method_status(
                 self.formatter.current_method_branch,
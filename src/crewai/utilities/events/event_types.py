@@ -55,6 +55,8 @@ from .knowledge_events import (
     KnowledgeQueryCompletedEvent,
     KnowledgeQueryFailedEvent,
     KnowledgeSearchQueryFailedEvent,
+    KnowledgeFileIngestionCompletedEvent,
+    KnowledgeFileIngestionFailedEvent,
 )
 
 EventTypes = Union[
@@ -96,4 +98,6 @@ EventTypes = Union[
     KnowledgeQueryCompletedEvent,
     KnowledgeQueryFailedEvent,
     KnowledgeSearchQueryFailedEvent,
+    KnowledgeFileIngestionCompletedEvent,
+    KnowledgeFileIngestionFailedEvent,
 ]
@@ -54,3 +54,21 @@ class KnowledgeSearchQueryFailedEvent(BaseEvent):
     type: str = "knowledge_search_query_failed"
     agent: BaseAgent
     error: str
+
+
+class KnowledgeFileIngestionCompletedEvent(BaseEvent):
+    """Event emitted when a file of a knowledge source has been ingested."""
+
+    file_path: str
+    chunk_count: int
+    files_completed: int
+    files_total: int
+    type: str = "knowledge_file_ingestion_completed"
+
+
+class KnowledgeFileIngestionFailedEvent(BaseEvent):
+    """Event emitted when a file of a knowledge source fails to be ingested."""
+
+    file_path: str
+    error: str
+    type: str = "knowledge_file_ingestion_failed"
@@ -34,6 +34,7 @@ class LLMCallCompletedEvent(BaseEvent):
     type: str = "llm_call_completed"
     response: Any
     call_type: LLMCallType
+    from_cache: bool = False
 
 
 class LLMCallFailedEvent(BaseEvent):
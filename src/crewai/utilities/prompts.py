@@ -10,6 +10,7 @@ class Prompts(BaseModel):
 
     i18n: I18N = Field(default=I18N())
     has_tools: bool = False
+    native_tool_calling: bool = False
     system_template: Optional[str] = None
     prompt_template: Optional[str] = None
     response_template: Optional[str] = None
@@ -19,12 +20,15 @@ class Prompts(BaseModel):
     def task_execution(self) -> dict[str, str]:
         """Generate a standard prompt for task execution."""
         slices = ["role_playing"]
-        if self.has_tools:
+        if self.native_tool_calling:
+            # Tools are described by their schemas, no text format is needed
+            slices.append("native_tools")
+        elif self.has_tools:
             slices.append("tools")
         else:
             slices.append("no_tools")
         system = self._build_prompt(slices)
-        slices.append("task")
+        slices.append(self._task_slice)
 
         if (
             not self.system_template
@@ -33,7 +37,7 @@ class Prompts(BaseModel):
         ):
             return {
                 "system": system,
-                "user": self._build_prompt(["task"]),
+                "user": self._build_prompt([self._task_slice]),
                 "prompt": self._build_prompt(slices),
             }
         else:
@@ -46,6 +50,10 @@ class Prompts(BaseModel):
                 )
             }
 
+    @property
+    def _task_slice(self) -> str:
+        return "native_task" if self.native_tool_calling else "task"
+
     def _build_prompt(
         self,
         components: list[str],
@@ -63,11 +71,11 @@ class Prompts(BaseModel):
             prompt_parts = [
                 self.i18n.slice(component)
                 for component in components
-                if component != "task"
+                if component != self._task_slice
             ]
             system = system_template.replace("{{ .System }}", "".join(prompt_parts))
             prompt = prompt_template.replace(
-                "{{ .Prompt }}", "".join(self.i18n.slice("task"))
+                "{{ .Prompt }}", "".join(self.i18n.slice(self._task_slice))
             )
             # Handle missing response_template
             if response_template:
@@ -1,6 +1,7 @@
+import asyncio
 import threading
 import time
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
@@ -9,69 +10,157 @@ from crewai.utilities.logger import Logger
 """Controls request rate limiting for API calls."""
 
 
+class TokenBucket:
+    """Thread-safe token bucket that refills continuously.
+
+    Callers reserve tokens up front and are told how long to wait before
+    using them, so waiting happens outside the lock and concurrent callers
+    are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock or time.monotonic
+        self._tokens = capacity
+        self._updated_at = self._clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take `amount` tokens and return the seconds to wait before using them."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            return self._deficit_delay()
+
+    def consume(self, amount: float) -> None:
+        """Take `amount` tokens after the fact, e.g. once token usage is known."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+
+    def time_until_available(self) -> float:
+        """Return the seconds until the bucket is out of debt."""
+        with self._lock:
+            self._refill()
+            return self._deficit_delay()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._tokens = min(
+            self.capacity, self._tokens + elapsed * self.refill_per_second
+        )
+        self._updated_at = now
+
+    def _deficit_delay(self) -> float:
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.refill_per_second
+
+
+class _RateLimits:
+    """Request and token buckets enforcing one set of per-minute limits."""
+
+    def __init__(self, max_rpm: Optional[int], max_tpm: Optional[int]) -> None:
+        self.requests = TokenBucket(max_rpm, max_rpm / 60.0) if max_rpm else None
+        self.tokens = TokenBucket(max_tpm, max_tpm / 60.0) if max_tpm else None
+
+
+_shared_limits: Dict[str, _RateLimits] = {}
+_shared_limits_lock = threading.Lock()
+
+
+def _get_shared_limits(
+    key: str, max_rpm: Optional[int], max_tpm: Optional[int]
+) -> _RateLimits:
+    """Return the limits registered under `key`, creating them on first use."""
+    with _shared_limits_lock:
+        if key not in _shared_limits:
+            _shared_limits[key] = _RateLimits(max_rpm, max_tpm)
+        return _shared_limits[key]
+
+
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """Manages requests per minute limiting.
+
+    Requests are limited with a token bucket that refills continuously, so a
+    caller waits only as long as it takes for one request to become available.
+    An optional `max_tpm` limits tokens per minute using the usage reported
+    after each LLM call. Controllers created with the same `limit_key` share a
+    single set of limits, e.g. across agents and crews using one provider key;
+    the limits of the first controller registered under a key apply.
+    """
 
     max_rpm: Optional[int] = Field(default=None)
+    max_tpm: Optional[int] = Field(default=None)
+    limit_key: Optional[str] = Field(default=None)
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: Optional[threading.Timer] = PrivateAttr(default=None)
-    _lock: Optional[threading.Lock] = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _limits: Optional[_RateLimits] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
-    def reset_counter(self):
-        if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
-        return self
+    def set_limits(self):
+        if self.max_rpm is None and self.max_tpm is None:
+            return self
 
-    def check_or_wait(self):
-        if self.max_rpm is None:
-            return True
-
-        def _check_and_increment():
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            elif self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
-            return True
-
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
+        if self.limit_key:
+            self._limits = _get_shared_limits(
+                self.limit_key, self.max_rpm, self.max_tpm
+            )
         else:
-            return _check_and_increment()
+            self._limits = _RateLimits(self.max_rpm, self.max_tpm)
+        return self
+
+    def check_or_wait(self) -> bool:
+        """Block until a request is allowed under the configured limits."""
+        delay = self._reserve()
+        if delay > 0:
+            self._wait_for_next_slot(delay)
+        return True
+
+    async def acheck_or_wait(self) -> bool:
+        """Wait on the event loop until a request is allowed."""
+        delay = self._reserve()
+        if delay > 0:
+            await self._await_next_slot(delay)
+        return True
+
+    def record_token_usage(self, tokens: int) -> None:
+        """Count tokens used by a completed request against the TPM limit."""
+        if self._limits and self._limits.tokens and tokens > 0:
+            self._limits.tokens.consume(tokens)
 
     def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self):
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
+        """Kept for backwards compatibility; the limiter needs no background timer."""
+
+    def _reserve(self) -> float:
+        """Reserve a request and return how many seconds to wait before sending it."""
+        if self._limits is None:
+            return 0.0
+
+        rpm_delay = self._limits.requests.reserve() if self._limits.requests else 0.0
+        tpm_delay = (
+            self._limits.tokens.time_until_available() if self._limits.tokens else 0.0
+        )
+        if rpm_delay > 0 and rpm_delay >= tpm_delay:
+            self.logger.log(
+                "info",
+                f"Max RPM reached, waiting {rpm_delay:.2f}s for the next request.",
+            )
+        elif tpm_delay > 0:
+            self.logger.log(
+                "info",
+                f"Max TPM reached, waiting {tpm_delay:.2f}s for tokens to refill.",
+            )
+        return max(rpm_delay, tpm_delay)
+
+    def _wait_for_next_slot(self, delay: float) -> None:
+        time.sleep(delay)
 
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
+    async def _await_next_slot(self, delay: float) -> None:
+        await asyncio.sleep(delay)
@@ -5,11 +5,17 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.types.utils import Usage
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.utilities.rpm_controller import RPMController
 
 
 class TokenCalcHandler(CustomLogger):
-    def __init__(self, token_cost_process: Optional[TokenProcess]):
+    def __init__(
+        self,
+        token_cost_process: Optional[TokenProcess],
+        rpm_controller: Optional[RPMController] = None,
+    ):
         self.token_cost_process = token_cost_process
+        self.rpm_controller = rpm_controller
 
     def log_success_event(
         self,
@@ -41,3 +47,16 @@ class TokenCalcHandler(CustomLogger):
                         self.token_cost_process.sum_cached_prompt_tokens(
                             usage.prompt_tokens_details.cached_tokens
                         )
+                if usage and self.rpm_controller:
+                    self.rpm_controller.record_token_usage(
+                        getattr(usage, "total_tokens", 0) or 0
+                    )
+
+    async def async_log_success_event(
+        self,
+        kwargs: Dict[str, Any],
+        response_obj: Dict[str, Any],
+        start_time: float,
+        end_time: float,
+    ) -> None:
+        self.log_success_event(kwargs, response_obj, start_time, end_time)
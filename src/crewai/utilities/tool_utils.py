@@ -1,8 +1,9 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from crewai.agents.parser import AgentAction
 from crewai.security import Fingerprint
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
 from crewai.tools.tool_types import ToolResult
 from crewai.tools.tool_usage import ToolUsage, ToolUsageErrorException
 from crewai.utilities.i18n import I18N
@@ -37,54 +38,137 @@ def execute_tool_and_check_finality(
         ToolResult containing the execution result and whether it should be treated as a final answer
     """
     try:
-        tool_name_to_tool_map = {tool.name: tool for tool in tools}
-
-        if agent_key and agent_role and agent:
-            fingerprint_context = fingerprint_context or {}
-            if agent:
-                if hasattr(agent, "set_fingerprint") and callable(
-                    agent.set_fingerprint
-                ):
-                    if isinstance(fingerprint_context, dict):
-                        try:
-                            fingerprint_obj = Fingerprint.from_dict(fingerprint_context)
-                            agent.set_fingerprint(fingerprint_obj)
-                        except Exception as e:
-                            raise ValueError(f"Failed to set fingerprint: {e}")
-
-        # Create tool usage instance
-        tool_usage = ToolUsage(
-            tools_handler=tools_handler,
+        tool_usage, tool_calling = _prepare_tool_usage(
+            agent_action=agent_action,
             tools=tools,
-            function_calling_llm=function_calling_llm,
+            agent_key=agent_key,
+            agent_role=agent_role,
+            tools_handler=tools_handler,
             task=task,
             agent=agent,
-            action=agent_action,
+            function_calling_llm=function_calling_llm,
+            fingerprint_context=fingerprint_context,
         )
 
-        # Parse tool calling
-        tool_calling = tool_usage.parse_tool_calling(agent_action.text)
-
         if isinstance(tool_calling, ToolUsageErrorException):
             return ToolResult(tool_calling.message, False)
 
-        # Check if tool name matches
-        if tool_calling.tool_name.casefold().strip() in [
-            name.casefold().strip() for name in tool_name_to_tool_map
-        ] or tool_calling.tool_name.casefold().replace("_", " ") in [
-            name.casefold().strip() for name in tool_name_to_tool_map
-        ]:
+        if _is_known_tool_name(tool_calling, tools):
             tool_result = tool_usage.use(tool_calling, agent_action.text)
-            tool = tool_name_to_tool_map.get(tool_calling.tool_name)
+            tool = {tool.name: tool for tool in tools}.get(tool_calling.tool_name)
             if tool:
                 return ToolResult(tool_result, tool.result_as_answer)
 
-        # Handle invalid tool name
-        tool_result = i18n.errors("wrong_tool_name").format(
-            tool=tool_calling.tool_name,
-            tools=", ".join([tool.name.casefold() for tool in tools]),
-        )
-        return ToolResult(tool_result, False)
+        return _wrong_tool_name_result(tool_calling, tools, i18n)
 
     except Exception as e:
         raise e
+
+
+async def aexecute_tool_and_check_finality(
+    agent_action: AgentAction,
+    tools: List[CrewStructuredTool],
+    i18n: I18N,
+    agent_key: Optional[str] = None,
+    agent_role: Optional[str] = None,
+    tools_handler: Optional[Any] = None,
+    task: Optional[Any] = None,
+    agent: Optional[Any] = None,
+    function_calling_llm: Optional[Any] = None,
+    fingerprint_context: Optional[Dict[str, str]] = None,
+) -> ToolResult:
+    """Async counterpart of `execute_tool_and_check_finality`.
+
+    The tool is awaited through `CrewStructuredTool.ainvoke`, so async tools run
+    natively on the event loop and sync tools run in a worker thread.
+
+    Returns:
+        ToolResult containing the execution result and whether it should be treated as a final answer
+    """
+    tool_usage, tool_calling = _prepare_tool_usage(
+        agent_action=agent_action,
+        tools=tools,
+        agent_key=agent_key,
+        agent_role=agent_role,
+        tools_handler=tools_handler,
+        task=task,
+        agent=agent,
+        function_calling_llm=function_calling_llm,
+        fingerprint_context=fingerprint_context,
+    )
+
+    if isinstance(tool_calling, ToolUsageErrorException):
+        return ToolResult(tool_calling.message, False)
+
+    if _is_known_tool_name(tool_calling, tools):
+        tool_result = await tool_usage.ause(tool_calling, agent_action.text)
+        tool = {tool.name: tool for tool in tools}.get(tool_calling.tool_name)
+        if tool:
+            return ToolResult(tool_result, tool.result_as_answer)
+
+    return _wrong_tool_name_result(tool_calling, tools, i18n)
+
+
+def _prepare_tool_usage(
+    agent_action: AgentAction,
+    tools: List[CrewStructuredTool],
+    agent_key: Optional[str] = None,
+    agent_role: Optional[str] = None,
+    tools_handler: Optional[Any] = None,
+    task: Optional[Any] = None,
+    agent: Optional[Any] = None,
+    function_calling_llm: Optional[Any] = None,
+    fingerprint_context: Optional[Dict[str, str]] = None,
+) -> Tuple[
+    ToolUsage, Union[ToolCalling, InstructorToolCalling, ToolUsageErrorException]
+]:
+    """Set the agent fingerprint, create the ToolUsage and parse the tool calling."""
+    if agent_key and agent_role and agent:
+        fingerprint_context = fingerprint_context or {}
+        if agent:
+            if hasattr(agent, "set_fingerprint") and callable(agent.set_fingerprint):
+                if isinstance(fingerprint_context, dict):
+                    try:
+                        fingerprint_obj = Fingerprint.from_dict(fingerprint_context)
+                        agent.set_fingerprint(fingerprint_obj)
+                    except Exception as e:
+                        raise ValueError(f"Failed to set fingerprint: {e}")
+
+    # Create tool usage instance
+    tool_usage = ToolUsage(
+        tools_handler=tools_handler,
+        tools=tools,
+        function_calling_llm=function_calling_llm,
+        task=task,
+        agent=agent,
+        action=agent_action,
+    )
+
+    # Parse tool calling
+    tool_calling = tool_usage.parse_tool_calling(agent_action.text)
+    return tool_usage, tool_calling
+
+
+def _is_known_tool_name(
+    tool_calling: Union[ToolCalling, InstructorToolCalling],
+    tools: List[CrewStructuredTool],
+) -> bool:
+    """Check if the parsed tool name matches one of the available tools."""
+    tool_names = [tool.name.casefold().strip() for tool in tools]
+    return (
+        tool_calling.tool_name.casefold().strip() in tool_names
+        or tool_calling.tool_name.casefold().replace("_", " ") in tool_names
+    )
+
+
+def _wrong_tool_name_result(
+    tool_calling: Union[ToolCalling, InstructorToolCalling],
+    tools: List[CrewStructuredTool],
+    i18n: I18N,
+) -> ToolResult:
+    # Handle invalid tool name
+    tool_result = i18n.errors("wrong_tool_name").format(
+        tool=tool_calling.tool_name,
+        tools=", ".join([tool.name.casefold() for tool in tools]),
+    )
+    return ToolResult(tool_result, False)
@@ -1,5 +1,6 @@
 """Test Agent creation and execution basic functionality."""
 
+import asyncio
 import os
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -14,6 +15,7 @@ from crewai.knowledge.knowledge_config import KnowledgeConfig
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
 from crewai.llm import LLM
+from crewai.llms.base_llm import BaseLLM
 from crewai.tools import tool
 from crewai.tools.tool_calling import InstructorToolCalling
 from crewai.tools.tool_usage import ToolUsage
@@ -286,8 +288,8 @@ def test_cache_hitting():
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
     assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
+        'multiplier-{"first_number": 2, "second_number": 6}': 12,
+        'multiplier-{"first_number": 3, "second_number": 3}': 9,
     }
 
     task = Task(
@@ -299,9 +301,9 @@ def test_cache_hitting():
     assert output == "36"
 
     assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
+        'multiplier-{"first_number": 2, "second_number": 6}': 12,
+        'multiplier-{"first_number": 3, "second_number": 3}': 9,
+        'multiplier-{"first_number": 12, "second_number": 3}': 36,
     }
     received_events = []
 
@@ -362,8 +364,8 @@ def test_disabling_cache_for_agent():
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
     assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
+        'multiplier-{"first_number": 2, "second_number": 6}': 12,
+        'multiplier-{"first_number": 3, "second_number": 3}': 9,
     }
 
     task = Task(
@@ -375,9 +377,9 @@ def test_disabling_cache_for_agent():
     assert output == "36"
 
     assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
+        'multiplier-{"first_number": 2, "second_number": 6}': 12,
+        'multiplier-{"first_number": 3, "second_number": 3}': 9,
+        'multiplier-{"first_number": 12, "second_number": 3}': 36,
     }
 
     with patch.object(CacheHandler, "read") as read:
@@ -615,7 +617,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         allow_delegation=False,
     )
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait_for_next_slot") as moveon:
         moveon.return_value = True
         task = Task(
             description="Use tool logic for `get_final_answer` but fon't give you final answer yet, instead keep using it unless you're told to give your final answer",
@@ -627,7 +629,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         )
         assert output == "42"
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting" in captured.out
         moveon.assert_called()
 
 
@@ -661,11 +663,11 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait_for_next_slot") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Max RPM reached, waiting" not in captured.out
         moveon.assert_not_called()
 
 
@@ -720,12 +722,12 @@ def test_agent_without_max_rpm_respects_crew_rpm(capsys):
     # Set crew's max_rpm to 1 to trigger RPM limit
     crew = Crew(agents=[agent1, agent2], tasks=tasks, max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait_for_next_slot") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
         assert "get_final_answer" in captured.out
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting" in captured.out
         moveon.assert_called_once()
 
 
@@ -2126,3 +2128,129 @@ def test_agent_from_repository_agent_not_found(mock_get_agent, mock_get_auth_tok
         match="Agent test_agent does not exist, make sure the name is correct or the agent is available on your organization",
     ):
         Agent(from_repository="test_agent")
+
+
+class ScriptedAsyncLLM(BaseLLM):
+    """LLM that replays a fixed list of responses and records async calls."""
+
+    def __init__(self, responses):
+        super().__init__(model="scripted-model")
+        self.responses = list(responses)
+        self.acall_count = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        raise AssertionError("sync call should not be used on the async path")
+
+    async def acall(
+        self, messages, tools=None, callbacks=None, available_functions=None
+    ):
+        self.acall_count += 1
+        return self.responses.pop(0)
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+
+@pytest.mark.asyncio
+async def test_agent_aexecute_task_uses_async_llm_and_tool():
+    calls = []
+
+    @tool
+    async def async_multiplier(first_number: int, second_number: int) -> str:
+        """Useful for when you need to multiply two numbers together."""
+        calls.append((first_number, second_number))
+        return str(first_number * second_number)
+
+    llm = ScriptedAsyncLLM(
+        [
+            'Thought: I should multiply\nAction: async_multiplier\nAction Input: {"first_number": 3, "second_number": 4}',
+            "Thought: I now know the final answer\nFinal Answer: 12",
+        ]
+    )
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=llm,
+        tools=[async_multiplier],
+        allow_delegation=False,
+    )
+    task = Task(
+        description="What is 3 times 4?",
+        expected_output="The result of the multiplication.",
+        agent=agent,
+    )
+
+    output = await agent.aexecute_task(task)
+
+    assert output == "12"
+    assert calls == [(3, 4)]
+    assert llm.acall_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_step_callback_is_awaited_for_every_step():
+    steps = []
+
+    async def step_callback(step):
+        await asyncio.sleep(0)
+        steps.append(type(step).__name__)
+
+    @tool
+    def multiplier(first_number: int, second_number: int) -> str:
+        """Useful for when you need to multiply two numbers together."""
+        return str(first_number * second_number)
+
+    llm = ScriptedAsyncLLM(
+        [
+            'Thought: I should multiply\nAction: multiplier\nAction Input: {"first_number": 3, "second_number": 4}',
+            "Thought: I now know the final answer\nFinal Answer: 12",
+        ]
+    )
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=llm,
+        tools=[multiplier],
+        allow_delegation=False,
+        step_callback=step_callback,
+    )
+    task = Task(
+        description="What is 3 times 4?",
+        expected_output="The result of the multiplication.",
+        agent=agent,
+    )
+
+    output = await agent.aexecute_task(task)
+
+    assert output == "12"
+    assert steps == ["ToolResult", "AgentAction", "AgentFinish"]
+
+
+@pytest.mark.asyncio
+async def test_executor_ainvoke_returns_final_answer():
+    llm = ScriptedAsyncLLM(["Thought: done\nFinal Answer: async result"])
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=llm,
+        allow_delegation=False,
+    )
+    task = Task(description="Say something", expected_output="Anything", agent=agent)
+    agent.create_agent_executor(task=task)
+
+    result = await agent.agent_executor.ainvoke(
+        {
+            "input": "Say something",
+            "tool_names": "",
+            "tools": "",
+            "ask_for_human_input": False,
+        }
+    )
+
+    assert result == {"output": "async result"}
@@ -0,0 +1,72 @@
+from copy import deepcopy
+from unittest.mock import patch
+
+from crewai.agents.cache import CacheHandler, SQLiteCacheStorage
+
+
+def test_reordered_json_input_hits_same_entry():
+    cache_handler = CacheHandler()
+    cache_handler.add(tool="search", input='{"query": "ai", "limit": 5}', output="r")
+
+    assert cache_handler.read(tool="search", input='{"limit": 5, "query": "ai"}') == "r"
+    assert cache_handler.read(tool="search", input={"limit": 5, "query": "ai"}) == "r"
+    assert cache_handler.read(tool="search", input="{'limit': 5, 'query': 'ai'}") == "r"
+    assert cache_handler.read(tool="other", input={"limit": 5, "query": "ai"}) is None
+    assert cache_handler.stats()["hits"] == 3
+    assert cache_handler.stats()["misses"] == 1
+
+
+def test_evicts_least_recently_used_entry():
+    cache_handler = CacheHandler(max_entries=2)
+    cache_handler.add(tool="t", input="a", output=1)
+    cache_handler.add(tool="t", input="b", output=2)
+    cache_handler.read(tool="t", input="a")
+    cache_handler.add(tool="t", input="c", output=3)
+
+    assert cache_handler.read(tool="t", input="a") == 1
+    assert cache_handler.read(tool="t", input="b") is None
+    assert cache_handler.read(tool="t", input="c") == 3
+
+
+def test_evicts_entries_over_byte_limit():
+    cache_handler = CacheHandler(max_bytes=100)
+    cache_handler.add(tool="t", input="a", output="x" * 60)
+    cache_handler.add(tool="t", input="b", output="y" * 60)
+
+    assert cache_handler.read(tool="t", input="a") is None
+    assert cache_handler.read(tool="t", input="b") == "y" * 60
+    assert cache_handler.stats()["bytes"] <= 100
+
+
+def test_expired_entries_are_not_returned():
+    cache_handler = CacheHandler(ttl=10)
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=1000.0):
+        cache_handler.add(tool="t", input="a", output="fresh")
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=1005.0):
+        assert cache_handler.read(tool="t", input="a") == "fresh"
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=1011.0):
+        assert cache_handler.read(tool="t", input="a") is None
+    assert cache_handler.stats()["entries"] == 0
+
+
+def test_sqlite_storage_is_shared_between_handlers(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    writer = CacheHandler(storage=SQLiteCacheStorage(db_path=db_path))
+    writer.add(tool="search", input={"query": "ai"}, output={"results": [1, 2]})
+
+    reader = CacheHandler(storage=SQLiteCacheStorage(db_path=db_path))
+    assert reader.read(tool="search", input='{"query": "ai"}') == {"results": [1, 2]}
+    assert reader.stats()["entries"] == 1
+
+
+def test_deepcopy_keeps_entries_and_shares_storage(tmp_path):
+    storage = SQLiteCacheStorage(db_path=str(tmp_path / "tool_cache.db"))
+    cache_handler = CacheHandler(max_entries=5, storage=storage)
+    cache_handler.add(tool="t", input="a", output=1)
+
+    copied = deepcopy(cache_handler)
+    copied.add(tool="t", input="b", output=2)
+
+    assert copied.read(tool="t", input="a") == 1
+    assert copied.storage is storage
+    assert "t-b" not in cache_handler._cache
@@ -0,0 +1,165 @@
+import asyncio
+from types import SimpleNamespace
+
+from crewai import Agent, Task
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import tool
+from crewai.utilities.agent_utils import render_function_schemas
+from crewai.utilities.prompts import Prompts
+
+
+def tool_call(call_id, name, arguments):
+    return SimpleNamespace(
+        id=call_id, function=SimpleNamespace(name=name, arguments=arguments)
+    )
+
+
+class ScriptedLLM(BaseLLM):
+    """LLM with native tool calling that replays a fixed list of responses."""
+
+    def __init__(self, responses):
+        super().__init__(model="scripted-model")
+        self.responses = list(responses)
+        self.calls = []
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        self.calls.append({"messages": list(messages), "tools": tools})
+        return self.responses.pop(0)
+
+    def supports_function_calling(self) -> bool:
+        return True
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+
+@tool("Multiply numbers")
+def multiply(a: int, b: int) -> int:
+    """Multiply two numbers."""
+    return a * b
+
+
+@tool("Lookup answer", result_as_answer=True)
+def lookup(question: str) -> str:
+    """Look up the answer to a question."""
+    return "forty-two"
+
+
+def make_agent(llm, tools):
+    return Agent(
+        role="Calculator",
+        goal="Compute results",
+        backstory="Good at maths",
+        llm=llm,
+        tools=tools,
+        native_tool_calling=True,
+    )
+
+
+def test_tool_calls_are_executed_and_answered():
+    llm = ScriptedLLM(
+        [
+            [tool_call("call_1", "Multiply_numbers", '{"a": 6, "b": 7}')],
+            "The result is 42.",
+        ]
+    )
+    agent = make_agent(llm, [multiply])
+    task = Task(description="What is 6 times 7?", expected_output="A number")
+
+    output = agent.execute_task(task)
+
+    assert output == "The result is 42."
+    assert [schema["function"]["name"] for schema in llm.calls[0]["tools"]] == [
+        "Multiply_numbers"
+    ]
+    messages = llm.calls[1]["messages"]
+    assert messages[-2]["tool_calls"][0]["id"] == "call_1"
+    assert messages[-1] == {
+        "role": "tool",
+        "tool_call_id": "call_1",
+        "name": "Multiply_numbers",
+        "content": "42",
+    }
+    assert "Action Input:" not in messages[0]["content"]
+
+
+def test_result_as_answer_tools_end_the_task():
+    llm = ScriptedLLM(
+        [[tool_call("call_1", "Lookup_answer", '{"question": "meaning of life"}')]]
+    )
+    agent = make_agent(llm, [lookup])
+    task = Task(description="What is the meaning of life?", expected_output="Answer")
+
+    assert agent.execute_task(task) == "forty-two"
+    assert len(llm.calls) == 1
+
+
+def test_async_tool_calls_are_executed_and_answered():
+    llm = ScriptedLLM(
+        [
+            [tool_call("call_1", "Multiply_numbers", '{"a": 3, "b": 5}')],
+            "The result is 15.",
+        ]
+    )
+    agent = make_agent(llm, [multiply])
+    task = Task(description="What is 3 times 5?", expected_output="A number")
+
+    output = asyncio.run(agent.aexecute_task(task))
+
+    assert output == "The result is 15."
+    assert llm.calls[1]["messages"][-1]["content"] == "15"
+
+
+def test_async_step_callbacks_are_awaited_once_per_tool_result():
+    steps = []
+
+    async def step_callback(step):
+        await asyncio.sleep(0)
+        steps.append(type(step).__name__)
+
+    llm = ScriptedLLM(
+        [
+            [tool_call("call_1", "Multiply_numbers", '{"a": 3, "b": 5}')],
+            "The result is 15.",
+        ]
+    )
+    agent = make_agent(llm, [multiply])
+    agent.step_callback = step_callback
+    task = Task(description="What is 3 times 5?", expected_output="A number")
+
+    asyncio.run(agent.aexecute_task(task))
+
+    assert steps == ["ToolResult", "AgentAction", "AgentFinish"]
+
+
+def test_streaming_llms_fall_back_to_react():
+    llm = ScriptedLLM([])
+    llm.stream = True
+    agent = make_agent(llm, [multiply])
+
+    agent.create_agent_executor(tools=[multiply])
+
+    assert not agent.agent_executor.native_tool_calling
+    assert "Action Input:" in agent.agent_executor.prompt["prompt"]
+
+
+def test_function_names_are_sanitized_and_unique():
+    tools = [t.to_structured_tool() for t in (multiply, multiply)]
+
+    schemas, tool_names = render_function_schemas(tools)
+
+    assert [s["function"]["name"] for s in schemas] == [
+        "Multiply_numbers",
+        "Multiply_numbers_2",
+    ]
+    assert tool_names["Multiply_numbers_2"] == "Multiply numbers"
+    assert schemas[0]["function"]["parameters"]["required"] == ["a", "b"]
+
+
+def test_native_prompts_leave_out_the_react_format():
+    prompt = Prompts(
+        has_tools=True, native_tool_calling=True, agent=make_agent(None, [])
+    ).task_execution()
+
+    assert "Action Input:" not in prompt["prompt"]
+    assert "Current Task: {input}" in prompt["prompt"]
@@ -1,10 +1,15 @@
 """Test Agent creation and execution basic functionality."""
 
+import asyncio
+import contextlib
 import hashlib
 import json
+import re
+import threading
+import time
 from concurrent.futures import Future
 from unittest import mock
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pydantic_core
 import pytest
@@ -17,6 +22,7 @@ from crewai.flow import Flow, start
 from crewai.knowledge.knowledge import Knowledge
 from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
 from crewai.llm import LLM
+from crewai.llms.base_llm import BaseLLM
 from crewai.memory.contextual.contextual_memory import ContextualMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
@@ -959,11 +965,11 @@ def test_api_calls_throttling(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait_for_next_slot") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting" in captured.out
         moveon.assert_called()
 
 
@@ -1268,6 +1274,286 @@ async def test_async_task_execution_call_count(researcher, writer):
         assert mock_execute_sync.call_count == 1
 
 
+def test_async_tasks_share_bounded_crew_executor():
+    import threading
+    import time
+
+    agent = Agent(
+        role="Researcher",
+        goal="Research things",
+        backstory="You research things.",
+        allow_delegation=False,
+    )
+    tasks = [
+        Task(
+            description=f"Research topic {i}",
+            expected_output="A summary",
+            agent=agent,
+            async_execution=True,
+        )
+        for i in range(4)
+    ]
+    tasks.append(
+        Task(
+            description="Summarize the research",
+            expected_output="A summary",
+            agent=agent,
+        )
+    )
+    crew = Crew(agents=[agent], tasks=tasks, max_async_workers=2)
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    thread_names = set()
+
+    def fake_execute_task(*args, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+            thread_names.add(threading.current_thread().name)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return "done"
+
+    with patch.object(Agent, "execute_task", side_effect=fake_execute_task):
+        result = crew.kickoff()
+
+    assert [output.raw for output in result.tasks_output] == ["done"] * 5
+    assert all(task.output.raw == "done" for task in tasks)
+    assert peak <= 2
+    async_threads = {name for name in thread_names if name.startswith("crewai-crew-")}
+    assert 1 <= len(async_threads) <= 2
+    assert crew._task_executor is None
+
+
+def _make_dag_crew(max_async_workers=None):
+    agent = Agent(
+        role="Researcher",
+        goal="Research things",
+        backstory="You research things.",
+        allow_delegation=False,
+    )
+    research_tasks = [
+        Task(
+            description=f"Research topic {i}",
+            expected_output="A summary",
+            agent=agent,
+        )
+        for i in range(3)
+    ]
+    summary_task = Task(
+        description="Summarize the research",
+        expected_output="A summary",
+        agent=agent,
+        context=research_tasks,
+    )
+    crew = Crew(
+        agents=[agent],
+        tasks=[*research_tasks, summary_task],
+        process=Process.dag,
+        max_async_workers=max_async_workers,
+    )
+    return crew, research_tasks, summary_task
+
+
+def _tracking_execute_task():
+    import threading
+    import time
+
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0, "order": [], "contexts": {}}
+
+    def fake_execute_task(task, context=None, tools=None):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+            state["order"].append(task.description)
+            state["contexts"][task.description] = context
+        return f"output of {task.description}"
+
+    return fake_execute_task, state
+
+
+def test_dag_process_runs_independent_tasks_in_parallel():
+    crew, research_tasks, summary_task = _make_dag_crew()
+    fake_execute_task, state = _tracking_execute_task()
+
+    with patch.object(Agent, "execute_task", side_effect=fake_execute_task):
+        result = crew.kickoff()
+
+    assert state["peak"] >= 2
+    assert state["order"][-1] == summary_task.description
+    for task in research_tasks:
+        assert (
+            f"output of {task.description}"
+            in state["contexts"][summary_task.description]
+        )
+    assert result.raw == f"output of {summary_task.description}"
+    assert [output.description for output in result.tasks_output] == [
+        task.description for task in crew.tasks
+    ]
+
+
+def test_dag_process_respects_max_async_workers():
+    crew, _, _ = _make_dag_crew(max_async_workers=1)
+    fake_execute_task, state = _tracking_execute_task()
+
+    with patch.object(Agent, "execute_task", side_effect=fake_execute_task):
+        crew.kickoff()
+
+    assert state["peak"] == 1
+    assert len(state["order"]) == 4
+
+
+def test_dag_process_allows_trailing_async_tasks():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    tasks = [
+        Task(
+            description=f"Research topic {i}",
+            expected_output="A summary",
+            agent=agent,
+            async_execution=True,
+        )
+        for i in range(2)
+    ]
+
+    Crew(agents=[agent], tasks=tasks, process=Process.dag)
+    with pytest.raises(pydantic_core._pydantic_core.ValidationError):
+        Crew(agents=[agent], tasks=tasks, process=Process.sequential)
+
+
+def test_dag_process_stops_on_task_failure():
+    crew, _, summary_task = _make_dag_crew()
+
+    def failing_execute_task(task, context=None, tools=None):
+        if task.description == "Research topic 1":
+            raise RuntimeError("research failed")
+        return "ok"
+
+    with patch.object(
+        Agent, "execute_task", side_effect=failing_execute_task
+    ) as execute:
+        with pytest.raises(RuntimeError, match="research failed"):
+            crew.kickoff()
+
+    assert summary_task.description not in [
+        call.kwargs["task"].description for call in execute.call_args_list
+    ]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_dag_process_restores_assigned_agents_on_task_failure(use_async):
+    crew, _, _ = _make_dag_crew()
+    agent = crew.agents[0]
+
+    def failing_execute_task(task, context=None, tools=None):
+        if task.description == "Research topic 1":
+            raise RuntimeError("research failed")
+        time.sleep(0.1)
+        return "ok"
+
+    async def afailing_execute_task(task, context=None, tools=None):
+        if task.description == "Research topic 1":
+            raise RuntimeError("research failed")
+        await asyncio.sleep(0.1)
+        return "ok"
+
+    with (
+        patch.object(Agent, "execute_task", side_effect=failing_execute_task),
+        patch.object(Agent, "aexecute_task", side_effect=afailing_execute_task),
+    ):
+        with pytest.raises(RuntimeError, match="research failed"):
+            if use_async:
+                asyncio.run(crew.kickoff_async())
+            else:
+                crew.kickoff()
+
+    assert all(task.agent is agent for task in crew.tasks)
+
+
+class _TopicEchoLLM(BaseLLM):
+    """Answers with every research topic found in the conversation."""
+
+    def __init__(self):
+        super().__init__(model="topic-echo")
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        time.sleep(0.01)
+        topics = re.findall(r"Research topic \d", str(messages))
+        return f"Thought: I know the topic\nFinal Answer: {'|'.join(topics)}"
+
+    async def acall(
+        self, messages, tools=None, callbacks=None, available_functions=None
+    ):
+        await asyncio.sleep(0.01)
+        topics = re.findall(r"Research topic \d", str(messages))
+        return f"Thought: I know the topic\nFinal Answer: {'|'.join(topics)}"
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_dag_tasks_sharing_an_agent_keep_separate_messages(use_async):
+    agent = Agent(
+        role="Researcher",
+        goal="Research things",
+        backstory="You research things.",
+        llm=_TopicEchoLLM(),
+    )
+    tasks = [
+        Task(description=f"Research topic {i}", expected_output="Notes", agent=agent)
+        for i in range(6)
+    ]
+    crew = Crew(agents=[agent], tasks=tasks, process=Process.dag)
+
+    create_agent_executor = Agent.create_agent_executor
+
+    def slow_create_agent_executor(self, tools=None, task=None):
+        create_agent_executor(self, tools=tools, task=task)
+        time.sleep(0.01)
+
+    with patch.object(Agent, "create_agent_executor", slow_create_agent_executor):
+        if use_async:
+            result = asyncio.run(crew.kickoff_async())
+        else:
+            result = crew.kickoff()
+
+    assert [output.raw for output in result.tasks_output] == [
+        f"Research topic {i}" for i in range(6)
+    ]
+    assert all(task.agent is agent for task in tasks)
+
+
+def test_async_task_exception_propagates_from_kickoff():
+    agent = Agent(
+        role="Researcher",
+        goal="Research things",
+        backstory="You research things.",
+        allow_delegation=False,
+    )
+    task = Task(
+        description="Research a topic",
+        expected_output="A summary",
+        agent=agent,
+        async_execution=True,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+
+    with patch.object(Agent, "execute_task", side_effect=RuntimeError("task failed")):
+        with pytest.raises(RuntimeError, match="task failed"):
+            crew.kickoff()
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_kickoff_for_each_single_input():
     """Tests if kickoff_for_each works with a single input."""
@@ -1425,12 +1711,69 @@ async def test_kickoff_async_basic_functionality_and_output():
     )
 
     expected_output = "This is a sample output from kickoff."
-    with patch.object(Crew, "kickoff", return_value=expected_output) as mock_kickoff:
+    with (
+        patch.object(
+            Agent, "aexecute_task", AsyncMock(return_value=expected_output)
+        ) as mock_aexecute_task,
+        patch.object(Agent, "execute_task") as mock_execute_task,
+        patch.object(Crew, "kickoff") as mock_kickoff,
+    ):
         result = await crew.kickoff_async(inputs)
 
-        assert isinstance(result, str), "Result should be a string"
-        assert result == expected_output, "Result should match expected output"
-        mock_kickoff.assert_called_once_with(inputs)
+        assert isinstance(result, CrewOutput), "Result should be a CrewOutput"
+        assert result.raw == expected_output, "Result should match expected output"
+        assert task.description == "Give me an analysis around dog."
+        mock_aexecute_task.assert_awaited_once()
+        mock_execute_task.assert_not_called()
+        mock_kickoff.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_kickoff_async_runs_async_tasks_on_the_event_loop():
+    agent = Agent(role="Researcher", goal="Research", backstory="Curious")
+    tasks = [
+        Task(
+            description=f"Research topic {i}",
+            expected_output="A summary",
+            agent=agent,
+            async_execution=True,
+        )
+        for i in range(3)
+    ]
+    tasks.append(
+        Task(
+            description="Write the report",
+            expected_output="A report",
+            agent=agent,
+            context=tasks[:],
+        )
+    )
+    crew = Crew(agents=[agent], tasks=tasks, max_async_workers=2)
+
+    threads = set()
+    in_flight = 0
+    peak = 0
+
+    async def aexecute_task(self, task, context=None, tools=None):
+        nonlocal in_flight, peak
+        threads.add(threading.get_ident())
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f"done: {task.description}"
+
+    with patch.object(Agent, "aexecute_task", aexecute_task):
+        result = await crew.kickoff_async()
+
+    assert threads == {threading.get_ident()}
+    assert peak == 2
+    assert [output.raw for output in result.tasks_output] == [
+        "done: Research topic 0",
+        "done: Research topic 1",
+        "done: Research topic 2",
+        "done: Write the report",
+    ]
 
 
 @pytest.mark.asyncio
@@ -1508,6 +1851,120 @@ async def test_async_kickoff_for_each_async_empty_input():
     assert results == [], "Result should be an empty list when input is empty"
 
 
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_yields_as_completed_with_bounded_concurrency():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research {topic}", expected_output="Notes", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+
+    delays = {"slow": 0.1, "fast": 0.0, "medium": 0.05}
+    running = 0
+    peak = 0
+    pulled = []
+
+    async def mock_kickoff_async(self, inputs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delays[inputs["topic"]])
+        running -= 1
+        return CrewOutput(raw=inputs["topic"], tasks_output=[])
+
+    def generated_inputs():
+        for topic in ["slow", "fast", "medium"]:
+            pulled.append(topic)
+            yield {"topic": topic}
+
+    with patch.object(Crew, "kickoff_async", mock_kickoff_async):
+        stream = crew.kickoff_for_each_stream(generated_inputs(), max_concurrency=2)
+        first = await stream.__anext__()
+        assert first.raw == "fast"
+        assert pulled == ["slow", "fast"]
+        rest = [output.raw async for output in stream]
+
+    assert rest == ["medium", "slow"]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_ordered():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research {topic}", expected_output="Notes", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+
+    async def mock_kickoff_async(self, inputs):
+        await asyncio.sleep(0.05 if inputs["topic"] == "a" else 0)
+        return CrewOutput(raw=inputs["topic"], tasks_output=[])
+
+    with patch.object(Crew, "kickoff_async", mock_kickoff_async):
+        results = [
+            output.raw
+            async for output in crew.kickoff_for_each_stream(
+                [{"topic": "a"}, {"topic": "b"}, {"topic": "c"}],
+                max_concurrency=2,
+                ordered=True,
+            )
+        ]
+
+    assert results == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_rejects_invalid_concurrency():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research", expected_output="Notes", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        async for _ in crew.kickoff_for_each_stream([{}], max_concurrency=0):
+            pass
+
+
+def _stream_crew_and_aexecute_task():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research {topic}", expected_output="Notes", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+    finished = []
+
+    async def aexecute_task(self, task, context=None, tools=None):
+        if "failing" in task.description:
+            raise RuntimeError("research failed")
+        if "slow" in task.description:
+            await asyncio.sleep(0.1)
+        finished.append(task.description)
+        return task.description
+
+    return crew, aexecute_task, finished
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_stream_cancels_runs_in_flight_when_closed():
+    crew, aexecute_task, finished = _stream_crew_and_aexecute_task()
+    inputs = [{"topic": "slow 1"}, {"topic": "fast"}, {"topic": "slow 2"}]
+
+    with patch.object(Agent, "aexecute_task", aexecute_task):
+        async with contextlib.aclosing(crew.kickoff_for_each_stream(inputs)) as stream:
+            async for output in stream:
+                assert output.raw == "Research fast"
+                break
+        await asyncio.sleep(0.3)
+
+    assert finished == ["Research fast"]
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_async_cancels_other_runs_when_one_fails():
+    crew, aexecute_task, finished = _stream_crew_and_aexecute_task()
+    inputs = [{"topic": "fast"}, {"topic": "failing"}, {"topic": "slow"}]
+
+    with patch.object(Agent, "aexecute_task", aexecute_task):
+        with pytest.raises(RuntimeError, match="research failed"):
+            await crew.kickoff_for_each_async(inputs)
+        await asyncio.sleep(0.3)
+
+    assert "Research slow" not in finished
+
+
 def test_set_agents_step_callback():
     from unittest.mock import patch
 
@@ -4283,6 +4740,144 @@ def test_crew_kickoff_for_each_works_with_manager_agent_copy():
     assert crew_copy.manager_agent.goal == crew.manager_agent.goal
 
 
+def test_crew_lightweight_copy_shares_config_and_forks_run_state():
+    agent = Agent(role="Researcher on {topic}", goal="Research", backstory="Researcher")
+    first = Task(description="Research {topic}", expected_output="Notes", agent=agent)
+    second = Task(
+        description="Summarize", expected_output="Summary", agent=agent, context=[first]
+    )
+    crew = Crew(agents=[agent], tasks=[first, second], memory=True)
+
+    crew_copy = crew.copy(lightweight=True)
+
+    assert crew_copy.id != crew.id
+    assert crew_copy.agents[0] is not agent
+    assert crew_copy.agents[0].llm is agent.llm
+    assert crew_copy.agents[0]._token_process is not agent._token_process
+    assert crew_copy.tasks[0] is not first
+    assert crew_copy.tasks[0].agent is crew_copy.agents[0]
+    assert crew_copy.tasks[1].context == [crew_copy.tasks[0]]
+    assert crew_copy._short_term_memory is crew._short_term_memory
+    assert crew_copy._cache_handler is not crew._cache_handler
+
+    with patch.object(
+        Agent,
+        "execute_task",
+        side_effect=lambda task, context=None, tools=None: task.description,
+    ):
+        crew_copy.kickoff(inputs={"topic": "AI"})
+
+    assert crew_copy.tasks[0].output.raw == "Research AI"
+    assert crew_copy.agents[0].role == "Researcher on AI"
+    assert first.description == "Research {topic}"
+    assert first.output is None
+    assert agent.role == "Researcher on {topic}"
+
+
+def test_kickoff_for_each_uses_lightweight_copies():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research {topic}", expected_output="Notes", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+
+    with (
+        patch.object(Crew, "copy", wraps=crew.copy) as copy_spy,
+        patch.object(
+            Agent,
+            "execute_task",
+            side_effect=lambda task, context=None, tools=None: task.description,
+        ),
+    ):
+        results = crew.kickoff_for_each(inputs=[{"topic": "dogs"}, {"topic": "cats"}])
+
+    assert [result.raw for result in results] == ["Research dogs", "Research cats"]
+    assert all(call.kwargs == {"lightweight": True} for call in copy_spy.call_args_list)
+    assert task.output is None
+
+
+def _batch_crew(max_async_workers):
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    tasks = [
+        Task(
+            description=f"Research {{topic}} part {i}",
+            expected_output="Notes",
+            agent=agent,
+            async_execution=True,
+        )
+        for i in range(3)
+    ]
+    tasks.append(
+        Task(
+            description="Summarize {topic}",
+            expected_output="Summary",
+            agent=agent,
+            context=tasks[:],
+        )
+    )
+    return Crew(agents=[agent], tasks=tasks, max_async_workers=max_async_workers)
+
+
+def test_kickoff_for_each_shares_one_worker_pool():
+    crew = _batch_crew(max_async_workers=2)
+    lock = threading.Lock()
+    threads = set()
+    in_flight = 0
+    peak = 0
+
+    def execute_task(self, task, context=None, tools=None):
+        nonlocal in_flight, peak
+        with lock:
+            threads.add(threading.current_thread().name)
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return task.description
+
+    with patch.object(Agent, "execute_task", execute_task):
+        results = crew.kickoff_for_each(
+            inputs=[{"topic": "dogs"}, {"topic": "cats"}, {"topic": "birds"}]
+        )
+
+    assert [result.raw for result in results] == [
+        "Summarize dogs",
+        "Summarize cats",
+        "Summarize birds",
+    ]
+    assert peak <= 2
+    worker_threads = threads - {threading.current_thread().name}
+    assert len(worker_threads) <= 2
+    assert crew._task_executor is None
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_async_bounds_async_tasks_across_the_batch():
+    crew = _batch_crew(max_async_workers=2)
+    in_flight = 0
+    peak = 0
+
+    async def aexecute_task(self, task, context=None, tools=None):
+        nonlocal in_flight, peak
+        if task.async_execution:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+        return task.description
+
+    with patch.object(Agent, "aexecute_task", aexecute_task):
+        results = await crew.kickoff_for_each_async(
+            inputs=[{"topic": "dogs"}, {"topic": "cats"}, {"topic": "birds"}]
+        )
+
+    assert [result.raw for result in results] == [
+        "Summarize dogs",
+        "Summarize cats",
+        "Summarize birds",
+    ]
+    assert peak == 2
+
+
 def test_crew_copy_with_memory():
     """Test that copying a crew with memory enabled does not raise validation errors and copies memory correctly."""
     agent = Agent(role="Test Agent", goal="Test Goal", backstory="Test Backstory")
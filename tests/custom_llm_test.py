@@ -357,3 +357,14 @@ def test_timeout_handling_llm():
     with pytest.raises(TimeoutError, match="LLM request failed after 2 attempts"):
         llm.call("Test message")
     assert len(llm.calls) == 2  # Initial call + failed retry attempt
+
+
+@pytest.mark.asyncio
+async def test_custom_llm_default_acall_delegates_to_call():
+    """BaseLLM.acall falls back to running call() in a worker thread."""
+    llm = CustomLLM(response="Async response")
+
+    response = await llm.acall("Test message")
+
+    assert response == "Async response"
+    assert llm.call_count == 1
@@ -1,12 +1,25 @@
 """Test Flow creation and execution basic functionality."""
 
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import List
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
 
-from crewai.flow.flow import Flow, and_, listen, or_, router, start
+from crewai.flow.flow import (
+    Flow,
+    TriggerIndex,
+    and_,
+    listen,
+    or_,
+    router,
+    snapshot_state,
+    start,
+)
 from crewai.utilities.events import (
     FlowFinishedEvent,
     FlowStartedEvent,
@@ -755,3 +768,155 @@ def test_multiple_routers_from_same_trigger():
     assert execution_order.index("anemia_analysis") > execution_order.index(
         "anemia_router"
     )
+
+
+def test_sync_listeners_run_in_parallel():
+    """Test that blocking listeners triggered together overlap."""
+    both_running = threading.Barrier(2, timeout=5)
+
+    class FanOutFlow(Flow):
+        @start()
+        def begin(self):
+            return "go"
+
+        @listen(begin)
+        def branch_a(self):
+            both_running.wait()
+            return "a"
+
+        @listen(begin)
+        def branch_b(self):
+            both_running.wait()
+            return "b"
+
+    flow = FanOutFlow()
+    flow.kickoff()
+
+    assert sorted(flow.method_outputs[1:]) == ["a", "b"]
+
+
+def test_max_concurrency_limits_running_methods():
+    """Test that max_concurrency caps how many flow methods run at once."""
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.05)
+        with lock:
+            running -= 1
+
+    class LimitedFlow(Flow):
+        max_concurrency = 2
+        method_executor = ThreadPoolExecutor(max_workers=4)
+
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        def branch_a(self):
+            work()
+
+        @listen(begin)
+        def branch_b(self):
+            work()
+
+        @listen(begin)
+        def branch_c(self):
+            work()
+
+        @listen(begin)
+        def branch_d(self):
+            work()
+
+    LimitedFlow().kickoff()
+
+    assert peak == 2
+
+
+def test_snapshot_state_is_independent_of_later_changes():
+    """Test that state snapshots copy containers but share immutable values."""
+
+    class DocumentState(BaseModel):
+        documents: List[str] = []
+        metadata: dict = {}
+
+    document = "x" * 1000
+    state = DocumentState(documents=[document], metadata={"tags": ["a"]})
+    state.metadata["self"] = state.metadata
+
+    snapshot = snapshot_state(state)
+    state.documents.append("new")
+    state.metadata["tags"].append("b")
+
+    assert snapshot.documents == [document]
+    assert snapshot.documents[0] is document
+    assert snapshot.metadata["tags"] == ["a"]
+    assert snapshot.metadata["self"] is snapshot.metadata
+
+
+def test_state_snapshots_are_skipped_without_listeners():
+    """Test that method events and their snapshots are skipped when unobserved."""
+
+    class QuietFlow(Flow):
+        @start()
+        def begin(self):
+            self.state["counter"] = 1
+
+    with crewai_event_bus.scoped_handlers():
+        with patch("crewai.flow.flow.snapshot_state") as mock_snapshot:
+            QuietFlow().kickoff()
+
+    mock_snapshot.assert_not_called()
+
+
+def test_state_snapshots_are_skipped_for_handlers_not_reading_state():
+    """Test that method events reach status handlers without a state snapshot."""
+    received = []
+
+    class QuietFlow(Flow):
+        @start()
+        def begin(self):
+            self.state["counter"] = 1
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionStartedEvent, reads_payload=False)
+        @crewai_event_bus.on(MethodExecutionFinishedEvent, reads_payload=False)
+        def handle_status(source, event):
+            received.append(event.type)
+
+        with patch("crewai.flow.flow.snapshot_state") as mock_snapshot:
+            QuietFlow().kickoff()
+
+    mock_snapshot.assert_not_called()
+    assert received == ["method_execution_started", "method_execution_finished"]
+
+
+def test_trigger_index_resolves_listeners_by_trigger():
+    """Test that the trigger index fires OR listeners at once and AND listeners last."""
+    index = TriggerIndex(
+        {
+            "either": ("OR", ["a", "b"]),
+            "both": ("AND", ["a", "b"]),
+            "route": ("OR", ["a"]),
+        },
+        routers={"route"},
+    )
+    pending = {}
+
+    assert index.triggered("a", router_only=True, pending_and=pending) == ["route"]
+    assert index.triggered("a", router_only=False, pending_and=pending) == ["either"]
+    assert index.triggered("c", router_only=False, pending_and=pending) == []
+    assert index.triggered("b", router_only=False, pending_and=pending) == [
+        "either",
+        "both",
+    ]
+    # AND listeners wait on all of their methods again once fired
+    assert pending == {}
+    assert index.triggered("b", router_only=False, pending_and=pending) == ["either"]
@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.knowledge.chunkers import (
+    RecursiveChunker,
+    SentenceChunker,
+    TokenChunker,
+    token_length,
+)
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+TEXT = (
+    "CrewAI agents work together. Each agent has a role.\n\n"
+    "Tasks are assigned to agents. Crews run the tasks in order."
+)
+
+
+class WordEncoding:
+    """Stand-in for a tiktoken encoding where every word is a token."""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+def test_recursive_chunker_splits_on_the_coarsest_separator_that_fits():
+    chunker = RecursiveChunker(chunk_size=60, chunk_overlap=0)
+
+    assert chunker.chunk(TEXT) == [
+        "CrewAI agents work together. Each agent has a role.",
+        "Tasks are assigned to agents. Crews run the tasks in order.",
+    ]
+
+
+def test_recursive_chunker_overlaps_and_never_splits_words():
+    chunker = RecursiveChunker(chunk_size=20, chunk_overlap=8)
+
+    chunks = chunker.chunk("alpha beta gamma delta epsilon zeta eta theta")
+
+    assert chunks == [
+        "alpha beta gamma",
+        "gamma delta epsilon",
+        "epsilon zeta eta",
+        "eta theta",
+    ]
+
+
+def test_sentence_chunker_packs_whole_sentences():
+    chunker = SentenceChunker(chunk_size=70, chunk_overlap=0)
+
+    assert chunker.chunk(TEXT) == [
+        "CrewAI agents work together. Each agent has a role.",
+        "Tasks are assigned to agents. Crews run the tasks in order.",
+    ]
+
+
+def test_token_chunker_sizes_chunks_in_tokens():
+    with patch("crewai.knowledge.chunkers._get_encoding", return_value=WordEncoding()):
+        chunker = TokenChunker(chunk_size=4, chunk_overlap=1)
+        chunks = chunker.chunk("one two three four five six seven")
+
+    assert chunks == ["one two three four", "four five six seven", "seven"]
+
+
+def test_length_functions_are_identified_by_name_and_encoding():
+    with patch("crewai.knowledge.chunkers._get_encoding", return_value=WordEncoding()):
+        cl100k = RecursiveChunker(length_function=token_length())
+        o200k = RecursiveChunker(length_function=token_length("o200k_base"))
+
+    function_ids = {
+        RecursiveChunker().length_function_id(),
+        cl100k.length_function_id(),
+        o200k.length_function_id(),
+    }
+
+    assert len(function_ids) == 3
+    assert cl100k.length_function_id().endswith(":cl100k_base")
+
+
+def test_streamed_chunks_match_chunking_the_whole_text():
+    chunker = RecursiveChunker(chunk_size=20, chunk_overlap=0)
+    text = " ".join(f"word{i}" for i in range(200))
+    pieces = [text[i : i + 37] for i in range(0, len(text), 37)]
+
+    assert list(chunker.chunk_stream(pieces)) == chunker.chunk(text)
+
+
+def test_overlap_must_be_smaller_than_chunk_size():
+    with pytest.raises(ValueError, match="chunk_overlap must be smaller"):
+        RecursiveChunker(chunk_size=10, chunk_overlap=10)
+
+
+def test_sources_use_their_chunker():
+    storage = MagicMock(spec=KnowledgeStorage)
+    source = StringKnowledgeSource(
+        content=TEXT,
+        storage=storage,
+        chunker=SentenceChunker(chunk_size=70, chunk_overlap=0),
+    )
+
+    source.add()
+
+    storage.save.assert_called_once_with(
+        [
+            "CrewAI agents work together. Each agent has a role.",
+            "Tasks are assigned to agents. Crews run the tasks in order.",
+        ]
+    )
@@ -0,0 +1,99 @@
+import uuid
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.utilities.embedding_cache import get_embedding_cache, set_embedding_cache
+
+DOCUMENTS = [
+    "Error ERR-4012 means the payment gateway timed out.",
+    "Payments are retried three times before failing.",
+    "Refunds are processed within five business days.",
+]
+
+
+class TopicEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embeds every text by whether it mentions payments, ignoring error codes."""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [[1.0 if "payment" in text.lower() else 0.0, 1.0] for text in input]
+
+
+@pytest.fixture
+def knowledge():
+    previous = get_embedding_cache()
+    set_embedding_cache(None)
+    knowledge = Knowledge(
+        collection_name=f"hybrid_{uuid.uuid4().hex}",
+        sources=[StringKnowledgeSource(content=document) for document in DOCUMENTS],
+        embedder={
+            "provider": "custom",
+            "config": {"embedder": TopicEmbeddingFunction()},
+        },
+    )
+    knowledge.add_sources()
+    yield knowledge
+    set_embedding_cache(previous)
+
+
+def test_hybrid_search_ranks_exact_keyword_matches_first(knowledge):
+    vector_results = knowledge.query(["ERR-4012"], results_limit=1, score_threshold=0)
+    results = knowledge.query(
+        ["ERR-4012"], results_limit=1, score_threshold=0, search_mode="hybrid"
+    )
+
+    assert [r["context"] for r in vector_results] == [DOCUMENTS[2]]
+    assert [r["context"] for r in results] == [DOCUMENTS[0]]
+    assert results[0]["score"] > 1 / 61
+
+
+def test_deleted_documents_leave_the_keyword_index(knowledge):
+    storage = knowledge.storage
+    storage.delete([storage.document_id(DOCUMENTS[2])])
+
+    results = knowledge.query(
+        ["refunds"], results_limit=3, score_threshold=0, search_mode="hybrid"
+    )
+
+    assert DOCUMENTS[2] not in [r["context"] for r in results]
+
+
+def test_existing_collections_are_indexed_on_first_hybrid_search(knowledge):
+    storage = knowledge.storage
+    storage.lexical_index.replace(storage.collection.name, [], [])
+    storage._lexical_index_synced = False
+
+    results = knowledge.query(
+        ["refunds"], results_limit=1, score_threshold=0, search_mode="hybrid"
+    )
+
+    assert [r["context"] for r in results] == [DOCUMENTS[2]]
+
+
+class OldSignatureStorage(BaseKnowledgeStorage):
+    """A custom storage written before `search` took the hybrid search options."""
+
+    def initialize_knowledge_storage(self):
+        pass
+
+    def search(self, query, limit=3, filter=None, score_threshold=0.35):
+        return [{"context": DOCUMENTS[0], "score": 1.0}][:limit]
+
+    def save(self, documents, metadata):
+        pass
+
+    def reset(self):
+        pass
+
+
+def test_vector_queries_support_storages_with_the_old_search_signature():
+    knowledge = Knowledge(
+        collection_name="old_signature", sources=[], storage=OldSignatureStorage()
+    )
+
+    results = knowledge.query(["ERR-4012"], results_limit=1)
+
+    assert [r["context"] for r in results] == [DOCUMENTS[0]]
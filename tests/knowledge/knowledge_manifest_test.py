@@ -0,0 +1,94 @@
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.utilities.embedding_cache import get_embedding_cache, set_embedding_cache
+
+
+class CountingEmbeddingFunction(EmbeddingFunction[Documents]):
+    def __init__(self) -> None:
+        self.embedded = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        return [[float(len(text)), 1.0] for text in input]
+
+
+@pytest.fixture
+def embedder():
+    previous = get_embedding_cache()
+    set_embedding_cache(None)
+    yield CountingEmbeddingFunction()
+    set_embedding_cache(previous)
+
+
+def _ingest(embedder, sources):
+    knowledge = Knowledge(
+        collection_name="manifest",
+        sources=sources,
+        embedder={"provider": "custom", "config": {"embedder": embedder}},
+    )
+    knowledge.add_sources()
+    return knowledge
+
+
+def _stored_documents(knowledge):
+    return sorted(knowledge.storage.collection.get()["documents"])
+
+
+def test_unchanged_sources_are_skipped(embedder):
+    _ingest(embedder, [StringKnowledgeSource(content="Brandon likes blue.")])
+    source = StringKnowledgeSource(content="Brandon likes blue.")
+
+    knowledge = _ingest(embedder, [source])
+
+    assert source.chunks == []
+    assert embedder.embedded == ["Brandon likes blue."]
+    assert _stored_documents(knowledge) == ["Brandon likes blue."]
+
+
+def test_changed_sources_only_evict_chunks_they_no_longer_produce(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("first factold")
+    _ingest(
+        embedder,
+        [TextFileKnowledgeSource(file_paths=[path], chunk_size=10, chunk_overlap=0)],
+    )
+
+    path.write_text("first factnew")
+    knowledge = _ingest(
+        embedder,
+        [TextFileKnowledgeSource(file_paths=[path], chunk_size=10, chunk_overlap=0)],
+    )
+
+    assert _stored_documents(knowledge) == ["first fact", "new"]
+    assert embedder.embedded == ["first fact", "old", "new"]
+
+
+def test_knowledge_sharing_a_collection_keeps_each_others_chunks(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("The sky is blue.")
+    _ingest(embedder, [TextFileKnowledgeSource(file_paths=[path])])
+
+    knowledge = _ingest(embedder, [StringKnowledgeSource(content="Grass is green.")])
+
+    assert _stored_documents(knowledge) == ["Grass is green.", "The sky is blue."]
+    unchanged = TextFileKnowledgeSource(file_paths=[path])
+    _ingest(embedder, [unchanged])
+    assert unchanged.chunks == []
+
+
+def test_file_sources_are_fingerprinted_by_content(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("The sky is blue.")
+    _ingest(embedder, [TextFileKnowledgeSource(file_paths=[path])])
+
+    unchanged = TextFileKnowledgeSource(file_paths=[path])
+    _ingest(embedder, [unchanged])
+    path.write_text("The sky is grey.")
+    knowledge = _ingest(embedder, [TextFileKnowledgeSource(file_paths=[path])])
+
+    assert unchanged.chunks == []
+    assert _stored_documents(knowledge) == ["The sky is grey."]
@@ -2,10 +2,11 @@
 
 from pathlib import Path
 from typing import List, Union
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 from crewai.knowledge.source.crew_docling_source import CrewDoclingSource
 from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
 from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
@@ -13,6 +14,12 @@ from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
 from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
 from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
 from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.utils.knowledge_utils import chunk_stream
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.knowledge_events import (
+    KnowledgeFileIngestionCompletedEvent,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -603,3 +610,86 @@ def test_file_path_validation():
         match="file_path/file_paths must be a Path, str, or a list of these types",
     ):
         PDFKnowledgeSource()
+
+
+def test_chunk_stream_matches_slicing_the_whole_text():
+    text = "The quick brown fox jumps over the lazy dog."
+    pieces = [text[:7], text[7:8], text[8:30], text[30:]]
+
+    assert list(chunk_stream(pieces, 10, 3)) == [
+        text[i : i + 10] for i in range(0, len(text), 7)
+    ]
+
+
+def test_streamed_csv_source_saves_rows_in_batches(tmpdir):
+    csv_path = Path(tmpdir.join("data.csv"))
+    csv_path.write_text("Name,City\nBrandon,New York\nAlice,Los Angeles\n")
+    storage = MagicMock(spec=KnowledgeStorage)
+
+    source = CSVKnowledgeSource(
+        file_paths=[csv_path],
+        storage=storage,
+        stream=True,
+        chunk_size=20,
+        chunk_overlap=0,
+        batch_size=1,
+    )
+    source.add()
+
+    saved = [call.args[0] for call in storage.save.call_args_list]
+    assert saved == [["Name City\nBrandon Ne"], ["w York\nAlice Los Ang"], ["eles\n"]]
+    assert source.content == {}
+    assert source.chunks == []
+    assert len(source.saved_chunk_ids) == 3
+
+
+def test_stream_requires_a_source_that_reads_files_incrementally(tmpdir):
+    json_path = Path(tmpdir.join("data.json"))
+    json_path.write_text("{}")
+
+    with pytest.raises(ValueError, match="does not support stream=True"):
+        JSONKnowledgeSource(file_paths=[json_path], stream=True)
+
+
+def test_files_are_parsed_in_a_process_pool_with_progress_events(tmpdir):
+    paths = []
+    for name in ["a", "b", "c"]:
+        path = Path(tmpdir.join(f"{name}.csv"))
+        path.write_text(f"{name},{name}\n")
+        paths.append(path)
+    storage = MagicMock(spec=KnowledgeStorage)
+    events = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(KnowledgeFileIngestionCompletedEvent)
+        def on_file_ingested(source, event):
+            events.append(event)
+
+        source = CSVKnowledgeSource(file_paths=paths, storage=storage, max_workers=2)
+        source.add()
+
+    saved = sorted(
+        chunk for call in storage.save.call_args_list for chunk in call.args[0]
+    )
+    assert saved == ["a a\n", "b b\n", "c c\n"]
+    assert sorted(event.file_path for event in events) == sorted(map(str, paths))
+    assert sorted(event.files_completed for event in events) == [1, 2, 3]
+    assert all(event.files_total == 3 for event in events)
+
+
+def test_sources_without_iter_file_add_their_loaded_content(tmpdir):
+    class NamedFileKnowledgeSource(BaseFileKnowledgeSource):
+        """Keys its content by file name rather than by path."""
+
+        def load_content(self):
+            return {path.name: path.read_text() for path in self.safe_file_paths}
+
+    path = Path(tmpdir.join("notes.txt"))
+    path.write_text("Brandon likes blue.")
+    storage = MagicMock(spec=KnowledgeStorage)
+
+    source = NamedFileKnowledgeSource(file_paths=[path], storage=storage)
+    source.add()
+
+    storage.save.assert_called_once_with(["Brandon likes blue."])
@@ -6,6 +6,7 @@ import pytest
 from pydantic import BaseModel
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.agents.cache import CacheHandler
 from crewai.llm import CONTEXT_WINDOW_USAGE_RATIO, LLM
 from crewai.utilities.events import (
     LLMCallCompletedEvent,
@@ -664,3 +665,223 @@ def test_handle_streaming_tool_calls_no_tools(mock_emit):
         expected_completed_llm_call=1,
         expected_final_chunk_result=response,
     )
+
+
+def _make_model_response(content=None, tool_calls=None):
+    from litellm.types.utils import ModelResponse
+
+    message = {"role": "assistant", "content": content}
+    if tool_calls:
+        message["tool_calls"] = tool_calls
+    return ModelResponse(
+        choices=[{"index": 0, "message": message, "finish_reason": "stop"}],
+        usage={"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
+    )
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_non_streaming(mock_emit):
+    llm = LLM(model="gpt-4o-mini")
+    calc_handler = TokenCalcHandler(token_cost_process=TokenProcess())
+
+    async def fake_acompletion(**params):
+        assert params["messages"] == [{"role": "user", "content": "Hello"}]
+        return _make_model_response(content="Hi there")
+
+    with (
+        patch("litellm.acompletion", side_effect=fake_acompletion) as acompletion,
+        patch("litellm.completion") as completion,
+    ):
+        result = await llm.acall("Hello", callbacks=[calc_handler])
+
+    assert result == "Hi there"
+    acompletion.assert_called_once()
+    completion.assert_not_called()
+    assert calc_handler.token_cost_process.get_summary().successful_requests == 1
+    assert_event_count(mock_emit=mock_emit, expected_completed_llm_call=1)
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_streaming(mock_emit):
+    from litellm.types.utils import ModelResponseStream
+
+    llm = LLM(model="gpt-4o-mini", stream=True)
+
+    async def stream():
+        for text in ["Hello", ", ", "world"]:
+            yield ModelResponseStream(
+                choices=[{"index": 0, "delta": {"role": "assistant", "content": text}}]
+            )
+
+    async def fake_acompletion(**params):
+        assert params["stream"] is True
+        return stream()
+
+    with patch("litellm.acompletion", side_effect=fake_acompletion):
+        result = await llm.acall("Hello")
+
+    assert result == "Hello, world"
+    assert_event_count(
+        mock_emit=mock_emit,
+        expected_stream_chunk=3,
+        expected_completed_llm_call=1,
+        expected_final_chunk_result="Hello, world",
+    )
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_awaits_async_tool(get_weather_tool_schema, mock_emit):
+    llm = LLM(model="gpt-4o-mini")
+    tool_calls = [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_weather", "arguments": '{"location": "Paris"}'},
+        }
+    ]
+
+    async def get_weather(location):
+        return f"The weather in {location} is sunny"
+
+    async def fake_acompletion(**params):
+        return _make_model_response(tool_calls=tool_calls)
+
+    with patch("litellm.acompletion", side_effect=fake_acompletion):
+        result = await llm.acall(
+            "What is the weather in Paris?",
+            tools=[get_weather_tool_schema],
+            available_functions={"get_weather": get_weather},
+        )
+
+    assert result == "The weather in Paris is sunny"
+    assert_event_count(
+        mock_emit=mock_emit,
+        expected_completed_tool_call=1,
+        expected_tool_usage_started=1,
+        expected_tool_usage_finished=1,
+    )
+
+
+def test_llm_response_cache_skips_repeated_requests(mock_emit):
+    llm = LLM(model="gpt-4o-mini", temperature=0, response_cache=CacheHandler())
+
+    with patch(
+        "litellm.completion", return_value=_make_model_response(content="Hi there")
+    ) as completion:
+        first = llm.call("Hello")
+        second = llm.call("Hello")
+        llm.call("Hello again")
+
+    assert first == second == "Hi there"
+    assert completion.call_count == 2
+    cached_events = [
+        _call[1]["event"]
+        for _call in mock_emit.call_args_list
+        if isinstance(_call[1]["event"], LLMCallCompletedEvent)
+        and _call[1]["event"].from_cache
+    ]
+    assert [event.response for event in cached_events] == ["Hi there"]
+
+
+def test_llm_response_cache_key_depends_on_sampling_params():
+    response_cache = CacheHandler()
+    llm = LLM(model="gpt-4o-mini", temperature=0, response_cache=response_cache)
+    other_llm = LLM(
+        model="gpt-4o-mini",
+        temperature=0.7,
+        api_key="other-key",
+        response_cache=response_cache,
+    )
+
+    params = llm._prepare_completion_params("Hello")
+    assert llm._get_response_cache_key(params) != other_llm._get_response_cache_key(
+        other_llm._prepare_completion_params("Hello")
+    )
+    assert llm._get_response_cache_key(params, {"fn": lambda: None}) is None
+    assert LLM(model="gpt-4o-mini")._get_response_cache_key(params) is None
+
+
+@pytest.mark.asyncio
+async def test_llm_response_cache_is_shared_by_streaming_calls(mock_emit):
+    from litellm.types.utils import ModelResponseStream
+
+    response_cache = CacheHandler()
+
+    async def stream():
+        for text in ["Hello", ", ", "world"]:
+            yield ModelResponseStream(
+                choices=[{"index": 0, "delta": {"role": "assistant", "content": text}}]
+            )
+
+    async def fake_acompletion(**params):
+        return stream()
+
+    with patch("litellm.acompletion", side_effect=fake_acompletion) as acompletion:
+        streamed = await LLM(
+            model="gpt-4o-mini", stream=True, response_cache=response_cache
+        ).acall("Hello")
+        cached = LLM(model="gpt-4o-mini", response_cache=response_cache).call("Hello")
+        cached_stream = await LLM(
+            model="gpt-4o-mini", stream=True, response_cache=response_cache
+        ).acall("Hello")
+
+    assert streamed == cached == cached_stream == "Hello, world"
+    acompletion.assert_called_once()
+    assert_event_count(
+        mock_emit=mock_emit,
+        expected_stream_chunk=4,
+        expected_completed_llm_call=3,
+        expected_final_chunk_result="Hello, worldHello, world",
+    )
+
+
+def test_llm_call_with_tools_returns_the_requested_tool_calls(
+    get_weather_tool_schema, mock_emit
+):
+    llm = LLM(model="gpt-4o-mini")
+    tool_calls = [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_weather", "arguments": '{"location": "Paris"}'},
+        }
+    ]
+
+    response = _make_model_response(content="Let me check.", tool_calls=tool_calls)
+
+    with patch("litellm.completion", return_value=response):
+        result = llm.call_with_tools(
+            "What is the weather in Paris?", [get_weather_tool_schema]
+        )
+        text = llm.call(
+            "What is the weather in Paris?", tools=[get_weather_tool_schema]
+        )
+
+    assert [call.id for call in result] == ["call_1"]
+    assert result[0].function.name == "get_weather"
+    assert result[0].function.arguments == '{"location": "Paris"}'
+    assert text == "Let me check."
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_with_tools_returns_the_requested_tool_calls(
+    get_weather_tool_schema, mock_emit
+):
+    llm = LLM(model="gpt-4o-mini")
+    tool_calls = [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_weather", "arguments": '{"location": "Paris"}'},
+        }
+    ]
+
+    with patch(
+        "litellm.acompletion",
+        return_value=_make_model_response(tool_calls=tool_calls),
+    ):
+        result = await llm.acall_with_tools(
+            "What is the weather in Paris?", [get_weather_tool_schema]
+        )
+
+    assert [call.id for call in result] == ["call_1"]
@@ -0,0 +1,86 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+from crewai.memory.entity.entity_memory import EntityMemory
+from crewai.memory.short_term.short_term_memory import ShortTermMemory
+from crewai.memory.storage.rag_storage import RAGStorage
+
+
+@pytest.fixture
+def task():
+    return MagicMock(description="Research AI agents")
+
+
+@pytest.fixture
+def rag_memories(tmp_path):
+    stm = ShortTermMemory(
+        storage=RAGStorage(type="short_term", path=str(tmp_path / "stm"))
+    )
+    em = EntityMemory(storage=RAGStorage(type="entities", path=str(tmp_path / "em")))
+    return stm, em
+
+
+def test_query_is_embedded_once_for_stores_sharing_an_embedder(task, rag_memories):
+    stm, em = rag_memories
+    contextual_memory = ContextualMemory(None, stm, None, em, None, None)
+
+    with (
+        patch.object(RAGStorage, "embed_query", return_value=[0.1, 0.2]) as embed,
+        patch.object(
+            RAGStorage, "search", return_value=[{"context": "a fact"}]
+        ) as search,
+    ):
+        result = contextual_memory.build_context_for_task(task, "")
+
+    embed.assert_called_once_with("Research AI agents")
+    assert search.call_count == 2
+    for call in search.call_args_list:
+        assert call.kwargs["query_embedding"] == [0.1, 0.2]
+    assert result == "Recent Insights:\n- a fact\nEntities:\n- a fact"
+
+
+def test_stores_are_queried_concurrently_with_a_timeout(task):
+    release = threading.Event()
+    ltm = MagicMock()
+    ltm.search.side_effect = lambda *args, **kwargs: release.wait(5) and []
+    stm = MagicMock()
+    stm.search.return_value = [{"context": "recent"}]
+    contextual_memory = ContextualMemory(
+        {"retrieval_timeout": 0.2}, stm, ltm, None, None, None
+    )
+
+    start = time.monotonic()
+    result = contextual_memory.build_context_for_task(task, "")
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert result == "Recent Insights:\n- recent"
+    assert elapsed < 2
+
+
+def test_query_embedding_counts_against_the_timeout(task, rag_memories):
+    stm, em = rag_memories
+    release = threading.Event()
+    ltm = MagicMock()
+    ltm.search.return_value = [
+        {"metadata": {"suggestions": ["cite sources"]}},
+    ]
+    contextual_memory = ContextualMemory(
+        {"retrieval_timeout": 0.2}, stm, ltm, em, None, None
+    )
+
+    with patch.object(
+        RAGStorage, "embed_query", side_effect=lambda query: release.wait(5) and []
+    ):
+        start = time.monotonic()
+        result = contextual_memory.build_context_for_task(task, "")
+        elapsed = time.monotonic() - start
+        release.set()
+
+    assert "cite sources" in result
+    assert "Recent Insights" not in result
+    assert elapsed < 2
@@ -0,0 +1,101 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from crewai.agent import Agent
+from crewai.agents.agent_builder.base_agent_executor_mixin import (
+    CrewAgentExecutorMixin,
+)
+from crewai.crew import Crew
+from crewai.crews.crew_output import CrewOutput
+from crewai.memory.memory_write_pipeline import MemoryWritePipeline
+from crewai.task import Task
+
+
+def test_pipeline_batches_items_per_memory():
+    pipeline = MemoryWritePipeline()
+    release = threading.Event()
+    entity_memory = MagicMock()
+    other_memory = MagicMock()
+
+    pipeline.submit(release.wait)
+    pipeline.submit(lambda: [(entity_memory, "a"), (other_memory, "x")])
+    pipeline.submit(lambda: [(entity_memory, "b")])
+    release.set()
+    pipeline.flush()
+
+    entity_memory.save_many.assert_called_once_with(["a", "b"])
+    other_memory.save_many.assert_called_once_with(["x"])
+    pipeline.close()
+
+
+def test_pipeline_survives_failing_jobs_and_restarts_after_close():
+    pipeline = MemoryWritePipeline()
+    done = []
+
+    def failing_job():
+        raise ValueError("boom")
+
+    pipeline.submit(failing_job)
+    pipeline.submit(lambda: done.append(1))
+    pipeline.close()
+    assert done == [1]
+    assert pipeline._worker is None
+
+    pipeline.submit(lambda: done.append(2))
+    pipeline.close()
+    assert done == [1, 2]
+
+
+def test_create_memories_queues_writes_on_the_crew_pipeline():
+    pipeline = MemoryWritePipeline()
+    crew = MagicMock(memory_write_behind=True)
+    crew._get_memory_pipeline.return_value = pipeline
+    release = threading.Event()
+    pipeline.submit(release.wait)
+
+    executor = CrewAgentExecutorMixin()
+    executor.crew = crew
+    executor.agent = MagicMock(role="Researcher")
+    executor.task = MagicMock(description="Research AI")
+    output = MagicMock(text="answer")
+
+    with (
+        patch.object(CrewAgentExecutorMixin, "_create_external_memory") as external,
+        patch.object(
+            CrewAgentExecutorMixin, "_save_long_term_memory", return_value=["entity"]
+        ),
+    ):
+        executor._create_memories(output)
+        executor._create_memories(output)
+        crew._short_term_memory.save_many.assert_not_called()
+
+        release.set()
+        pipeline.close()
+
+    assert external.call_count == 2
+    crew._entity_memory.save_many.assert_called_once_with(["entity", "entity"])
+    short_term_items = crew._short_term_memory.save_many.call_args[0][0]
+    assert [item.data for item in short_term_items] == ["answer", "answer"]
+    assert short_term_items[0].agent == "Researcher"
+    assert short_term_items[0].metadata == {"observation": "Research AI"}
+
+
+def test_kickoff_flushes_memory_pipeline():
+    agent = Agent(role="Researcher", goal="Research", backstory="Curious")
+    task = Task(description="Research", expected_output="Notes", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], memory_write_behind=True)
+    pipelines = []
+
+    def run_tasks(tasks, start_index, was_replayed):
+        pipelines.append(crew._get_memory_pipeline())
+        return CrewOutput(raw="done", tasks_output=[])
+
+    with (
+        patch.object(Crew, "_run_tasks", side_effect=run_tasks),
+        patch.object(MemoryWritePipeline, "close") as close,
+    ):
+        crew.kickoff()
+
+    assert isinstance(pipelines[0], MemoryWritePipeline)
+    close.assert_called_once()
+    assert crew._get_memory_pipeline() is None
@@ -0,0 +1,82 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.memory.storage.micro_batcher import MicroBatcher
+from crewai.memory.storage.rag_storage import RAGStorage
+
+
+def _run_concurrently(target, args_list):
+    threads = [threading.Thread(target=target, args=args) for args in args_list]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+def test_saves_arriving_during_a_flush_share_the_next_batch():
+    batches = []
+    first_flush_started = threading.Event()
+    release_first_flush = threading.Event()
+
+    def flush(batch):
+        batches.append(batch)
+        if len(batches) == 1:
+            first_flush_started.set()
+            release_first_flush.wait(timeout=5)
+
+    batcher = MicroBatcher(flush)
+    leader = threading.Thread(target=batcher.submit, args=("first",))
+    leader.start()
+    first_flush_started.wait(timeout=5)
+
+    followers = [
+        threading.Thread(target=batcher.submit, args=(item,)) for item in "abc"
+    ]
+    for follower in followers:
+        follower.start()
+    while len(batcher._pending) < 3:
+        time.sleep(0.001)
+    release_first_flush.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    assert batches[0] == ["first"]
+    assert sorted(batches[1]) == ["a", "b", "c"]
+    assert len(batches) == 2
+
+
+def test_batches_respect_max_size_and_latency():
+    batches = []
+    batcher = MicroBatcher(batches.append, max_batch_size=2, max_latency=1.0)
+
+    _run_concurrently(batcher.submit, [(i,) for i in range(4)])
+
+    assert sorted(item for batch in batches for item in batch) == [0, 1, 2, 3]
+    assert all(len(batch) <= 2 for batch in batches)
+
+
+def test_flush_errors_are_raised_to_every_caller_in_the_batch():
+    def flush(batch):
+        raise ValueError("embedding failed")
+
+    batcher = MicroBatcher(flush)
+    with pytest.raises(ValueError, match="embedding failed"):
+        batcher.submit("item")
+
+
+def test_rag_storage_coalesces_concurrent_saves(tmp_path):
+    storage = RAGStorage(type="short_term", path=str(tmp_path), batch_latency=0.5)
+    storage.collection = MagicMock()
+
+    _run_concurrently(storage.save, [(f"memory {i}", {"index": i}) for i in range(5)])
+
+    documents = [
+        document
+        for call in storage.collection.add.call_args_list
+        for document in call.kwargs["documents"]
+    ]
+    assert sorted(documents) == [f"memory {i}" for i in range(5)]
+    assert storage.collection.add.call_count < 5
@@ -61,3 +61,18 @@ def test_save_and_search(short_term_memory):
         find = short_term_memory.search("test value", score_threshold=0.01)[0]
         assert find["context"] == memory.data, "Data value mismatch."
         assert find["metadata"]["agent"] == "test_agent", "Agent value mismatch."
+
+
+def test_save_many_embeds_items_in_one_batch(short_term_memory):
+    items = [
+        ShortTermMemoryItem(data="first", agent="Researcher", metadata={"task": "a"}),
+        ShortTermMemoryItem(data="second", metadata={"task": "b"}),
+    ]
+
+    with patch.object(short_term_memory.storage, "save_many") as save_many:
+        short_term_memory.save_many(items)
+
+    save_many.assert_called_once_with(
+        ["first", "second"],
+        [{"task": "a", "agent": "Researcher"}, {"task": "b"}],
+    )
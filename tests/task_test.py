@@ -6,7 +6,7 @@ import os
 import time
 from functools import partial
 from typing import Tuple, Union
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
@@ -92,6 +92,50 @@ def test_task_prompt_includes_expected_output():
         execute.assert_called_once_with(task=task, context=None, tools=[])
 
 
+def test_execute_async_delivers_exceptions_to_future():
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for an article.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", side_effect=ValueError("boom")):
+        execution = task.execute_async(agent=researcher)
+        with pytest.raises(ValueError, match="boom"):
+            execution.result(timeout=10)
+
+
+def test_execute_async_submits_to_given_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for an article.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-pool") as pool:
+        with patch.object(Agent, "execute_task", return_value="ok"):
+            execution = task.execute_async(agent=researcher, executor=pool)
+            assert execution.result(timeout=10).raw == "ok"
+
+
 def test_task_callback():
     researcher = Agent(
         role="Researcher",
@@ -1493,3 +1537,23 @@ def test_task_interpolation_with_hyphens():
     assert "say hello world" in task.prompt()
 
     assert result.raw == "Hello, World!"
+
+
+@pytest.mark.asyncio
+async def test_task_aexecute_awaits_agent_and_applies_guardrail():
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(
+        description="Give a long answer",
+        expected_output="A long answer",
+        agent=agent,
+        guardrail=lambda output: (len(output.raw) > 10, output.raw),
+    )
+
+    aexecute_task = AsyncMock(side_effect=["too short", "a long enough answer"])
+    with patch.object(Agent, "aexecute_task", aexecute_task):
+        output = await task.aexecute()
+
+    assert output.raw == "a long enough answer"
+    assert task.output == output
+    assert task.retry_count == 1
+    assert aexecute_task.await_count == 2
@@ -1,13 +1,15 @@
 """Test flow state persistence functionality."""
 
+import json
 import os
+import sqlite3
 from typing import Dict
 
 import pytest
 from pydantic import BaseModel
 
 from crewai.flow.flow import Flow, FlowState, listen, start
-from crewai.flow.persistence import persist
+from crewai.flow.persistence import BatchedSQLiteFlowPersistence, persist
 from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
 
 
@@ -208,3 +210,77 @@ def test_persist_decorator_verbose_logging(tmp_path, caplog):
     flow = VerboseFlow(persistence=persistence)
     flow.kickoff()
     assert "Saving flow state" in caplog.text
+
+
+def test_batched_persistence_coalesces_saves(tmp_path):
+    """Test that saves queued within one batch are written as one checkpoint."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = BatchedSQLiteFlowPersistence(db_path, flush_interval=10)
+
+    for counter in range(5):
+        persistence.save_state("flow-1", "step", {"id": "flow-1", "counter": counter})
+
+    # Queued states are visible before they are written
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "counter": 4}
+    persistence.flush()
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT state_json FROM flow_checkpoints").fetchall()
+    assert [json.loads(row[0])["counter"] for row in rows] == [4]
+    assert BatchedSQLiteFlowPersistence(db_path).load_state("flow-1")["counter"] == 4
+    persistence.close()
+
+
+def test_batched_persistence_diffs_and_retention(tmp_path):
+    """Test that diffs rebuild the latest state and retention keeps their base."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = BatchedSQLiteFlowPersistence(
+        db_path,
+        flush_interval=0,
+        store_diffs=True,
+        full_snapshot_interval=3,
+        max_checkpoints_per_flow=2,
+    )
+
+    state = {"id": "flow-1", "documents": ["a" * 100], "counter": 0}
+    for counter in range(1, 6):
+        state["counter"] = counter
+        if counter == 4:
+            del state["documents"]
+        persistence.save_state("flow-1", "step", state)
+        persistence.flush()
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT is_diff FROM flow_checkpoints ORDER BY id"
+        ).fetchall()
+    # Checkpoints 4 (full snapshot) and 5 (diff) are kept
+    assert [row[0] for row in rows] == [0, 1]
+    persistence.close()
+
+    reloaded = BatchedSQLiteFlowPersistence(db_path)
+    assert reloaded.load_state("flow-1") == {"id": "flow-1", "counter": 5}
+    reloaded.close()
+
+
+def test_batched_persistence_with_persist_decorator(tmp_path):
+    """Test that @persist works with the batched backend."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = BatchedSQLiteFlowPersistence(db_path)
+
+    @persist(persistence)
+    class BatchedFlow(Flow[TestState]):
+        @start()
+        def init_step(self):
+            self.state.counter = 1
+
+        @listen(init_step)
+        def next_step(self):
+            self.state.counter += 1
+
+    flow = BatchedFlow(persistence=persistence)
+    flow.kickoff()
+    persistence.flush()
+
+    assert persistence.load_state(flow.state.id)["counter"] == 2
+    persistence.close()
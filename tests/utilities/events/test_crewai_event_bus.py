@@ -45,3 +45,66 @@ def test_event_bus_error_handling(capfd):
     out, err = capfd.readouterr()
     assert "Simulated handler failure" in out
     assert "Handler 'broken_handler' failed" in out
+
+
+class ChildTestEvent(TestEvent):
+    pass
+
+
+def test_dispatch_table_is_invalidated_when_handlers_register():
+    calls = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(BaseEvent)
+        def base_handler(source, event):
+            calls.append("base")
+
+        crewai_event_bus.emit("source_object", ChildTestEvent(type="child_event"))
+        assert calls == ["base"]
+
+        @crewai_event_bus.on(TestEvent)
+        def parent_handler(source, event):
+            calls.append("parent")
+
+        @crewai_event_bus.on(ChildTestEvent)
+        def child_handler(source, event):
+            calls.append("child")
+
+        crewai_event_bus.emit("source_object", ChildTestEvent(type="child_event"))
+        assert calls == ["base", "base", "parent", "child"]
+
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+        assert calls == ["base", "base", "parent", "child", "base", "parent"]
+
+    crewai_event_bus.emit("source_object", ChildTestEvent(type="child_event"))
+    assert len(calls) == 6
+
+
+def test_has_listeners():
+    with crewai_event_bus.scoped_handlers():
+        assert not crewai_event_bus.has_listeners(ChildTestEvent)
+
+        @crewai_event_bus.on(TestEvent)
+        def handler(source, event):
+            pass
+
+        assert crewai_event_bus.has_listeners(ChildTestEvent)
+        assert not crewai_event_bus.has_listeners(BaseEvent)
+
+
+def test_has_listeners_needing_the_payload():
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent, reads_payload=False)
+        def status_handler(source, event):
+            pass
+
+        assert crewai_event_bus.has_listeners(TestEvent)
+        assert not crewai_event_bus.has_listeners(TestEvent, needs_payload=True)
+
+        @crewai_event_bus.on(TestEvent)
+        def payload_handler(source, event):
+            pass
+
+        assert crewai_event_bus.has_listeners(TestEvent, needs_payload=True)
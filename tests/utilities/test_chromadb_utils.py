@@ -1,11 +1,15 @@
+import gc
 import unittest
 from typing import Any, Dict, List, Union
 
 import pytest
 
+from crewai.memory.storage.rag_storage import RAGStorage
 from crewai.utilities.chromadb import (
     MAX_COLLECTION_LENGTH,
     MIN_COLLECTION_LENGTH,
+    ChromaClientRegistry,
+    chroma_registry,
     is_ipv4_pattern,
     sanitize_collection_name,
 )
@@ -79,3 +83,35 @@ class TestChromadbUtils(unittest.TestCase):
             self.assertLessEqual(len(sanitized), MAX_COLLECTION_LENGTH)
             self.assertTrue(sanitized[0].isalnum())
             self.assertTrue(sanitized[-1].isalnum())
+
+
+def test_registry_shares_clients_and_collections_until_released(tmp_path):
+    registry = ChromaClientRegistry()
+    path = str(tmp_path)
+
+    first = registry.acquire(path)
+    second = registry.acquire(path, allow_reset=False)
+    collection = registry.get_collection(path, "notes", None, "default")
+
+    assert first is second
+    assert registry.get_collection(path, "notes", None, "default") is collection
+    assert registry.get_collection(path, "notes", None, "other") is not collection
+
+    registry.release(path)
+    assert registry.ref_count(path) == 1
+    registry.release(path)
+    assert registry.ref_count(path) == 0
+    assert registry.acquire(path) is not first
+
+
+def test_rag_storages_on_the_same_path_share_a_pooled_client(tmp_path):
+    path = str(tmp_path)
+    storages = [RAGStorage(type="short_term", path=path) for _ in range(3)]
+
+    assert len({id(storage.app) for storage in storages}) == 1
+    assert len({id(storage.collection) for storage in storages}) == 1
+    assert chroma_registry.ref_count(path) == 3
+
+    del storages
+    gc.collect()
+    assert chroma_registry.ref_count(path) == 0
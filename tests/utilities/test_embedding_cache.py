@@ -0,0 +1,122 @@
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.agents.cache import CacheHandler, SQLiteCacheStorage
+from crewai.utilities.embedding_cache import (
+    CachedEmbeddingFunction,
+    get_embedding_cache,
+    set_embedding_cache,
+)
+from crewai.utilities.embedding_configurator import EmbeddingConfigurator
+
+
+class CountingEmbeddingFunction(EmbeddingFunction[Documents]):
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [[float(len(text)), 1.0] for text in input]
+
+
+@pytest.fixture
+def cache():
+    previous = get_embedding_cache()
+    cache = CacheHandler(max_entries=100)
+    set_embedding_cache(cache)
+    yield cache
+    set_embedding_cache(previous)
+
+
+def test_only_unseen_texts_are_embedded(cache):
+    inner = CountingEmbeddingFunction()
+    embedder = CachedEmbeddingFunction(inner, "test", cache)
+
+    first = embedder(["alpha", "beta", "alpha"])
+    second = embedder(["beta", "gamma"])
+
+    assert inner.calls == [["alpha", "beta"], ["gamma"]]
+    assert [list(vector) for vector in first] == [[5, 1], [4, 1], [5, 1]]
+    assert [list(vector) for vector in second] == [[4, 1], [5, 1]]
+
+
+def test_storages_with_the_same_embedder_config_share_entries(cache):
+    inner = CountingEmbeddingFunction()
+    config = {"provider": "custom", "config": {"embedder": inner}}
+    configurator = EmbeddingConfigurator()
+    knowledge_embedder = configurator.configure_embedder(config)
+    memory_embedder = configurator.configure_embedder(config)
+
+    knowledge_embedder.embed_query(["what is crewai?"])
+    memory_embedder.embed_query(["what is crewai?"])
+
+    assert isinstance(memory_embedder, CachedEmbeddingFunction)
+    assert inner.calls == [["what is crewai?"]]
+
+
+def test_disk_tier_keeps_embeddings_across_runs(cache, tmp_path):
+    db_path = str(tmp_path / "embeddings.db")
+    inner = CountingEmbeddingFunction()
+    first_run = CachedEmbeddingFunction(
+        inner, "test", CacheHandler(storage=SQLiteCacheStorage(db_path=db_path))
+    )
+    second_run = CachedEmbeddingFunction(
+        inner, "test", CacheHandler(storage=SQLiteCacheStorage(db_path=db_path))
+    )
+
+    first_run(["persisted"])
+    second_run(["persisted"])
+
+    assert inner.calls == [["persisted"]]
+
+
+def test_disabling_the_cache_returns_the_raw_embedding_function():
+    previous = get_embedding_cache()
+    set_embedding_cache(None)
+    try:
+        inner = CountingEmbeddingFunction()
+        embedder = EmbeddingConfigurator().configure_embedder(
+            {"provider": "custom", "config": {"embedder": inner}}
+        )
+    finally:
+        set_embedding_cache(previous)
+
+    assert embedder is inner
+
+
+def test_query_embeddings_fall_back_to_calling_the_function(cache):
+    class LegacyEmbeddingFunction:
+        """An embedding function from before chromadb added `embed_query`."""
+
+        def __call__(self, input):
+            return [[float(len(text)), 1.0] for text in input]
+
+    embedder = CachedEmbeddingFunction(LegacyEmbeddingFunction(), "test", cache)
+
+    assert embedder.embed_query(["what is crewai?"]) == [[15.0, 1.0]]
+
+
+def test_vectors_are_cached_compactly(cache):
+    vector = [i / 7 for i in range(1536)]
+
+    class WideEmbeddingFunction(EmbeddingFunction[Documents]):
+        def __call__(self, input: Documents) -> Embeddings:
+            return [vector for _ in input]
+
+    embedder = CachedEmbeddingFunction(WideEmbeddingFunction(), "test", cache)
+
+    assert embedder(["wide"])[0] == pytest.approx(vector, rel=1e-6)
+    assert embedder(["wide"])[0] == pytest.approx(vector, rel=1e-6)
+    assert cache.stats()["bytes"] < 1536 * 6
+
+
+def test_custom_embedders_get_distinct_cache_namespaces(cache):
+    configurator = EmbeddingConfigurator()
+    first = configurator.configure_embedder(
+        {"provider": "custom", "config": {"embedder": CountingEmbeddingFunction()}}
+    )
+    second = configurator.configure_embedder(
+        {"provider": "custom", "config": {"embedder": CountingEmbeddingFunction()}}
+    )
+
+    assert first.namespace != second.namespace
@@ -0,0 +1,152 @@
+import asyncio
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from crewai.utilities.logger import Logger
+from crewai.utilities.rpm_controller import RPMController, TokenBucket
+from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_continuously():
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=2, refill_per_second=1.0, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now = 1.5
+    assert bucket.time_until_available() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_does_not_exceed_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=1, refill_per_second=1.0, clock=clock)
+
+    clock.now = 100
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_check_or_wait_waits_only_for_next_slot():
+    controller = RPMController(max_rpm=2)
+
+    with patch.object(RPMController, "_wait_for_next_slot") as wait:
+        controller.check_or_wait()
+        controller.check_or_wait()
+        wait.assert_not_called()
+
+        controller.check_or_wait()
+
+    wait.assert_called_once()
+    (delay,) = wait.call_args.args
+    assert 29 < delay <= 30
+
+
+def test_check_or_wait_logs_the_computed_delay():
+    controller = RPMController(max_rpm=2)
+
+    with (
+        patch.object(RPMController, "_wait_for_next_slot"),
+        patch.object(Logger, "log") as log,
+    ):
+        for _ in range(3):
+            controller.check_or_wait()
+
+    (level, message), _ = log.call_args
+    match = re.fullmatch(
+        r"Max RPM reached, waiting (.+)s for the next request\.", message
+    )
+    assert level == "info"
+    assert match and 29 < float(match.group(1)) <= 30
+
+
+def test_check_or_wait_without_limits_never_waits():
+    controller = RPMController()
+
+    with patch.object(RPMController, "_wait_for_next_slot") as wait:
+        for _ in range(100):
+            assert controller.check_or_wait() is True
+
+    wait.assert_not_called()
+
+
+def test_acheck_or_wait_does_not_block_event_loop():
+    controller = RPMController(max_rpm=1)
+
+    async def run():
+        with (
+            patch.object(
+                RPMController, "_await_next_slot", new_callable=AsyncMock
+            ) as wait,
+            patch.object(RPMController, "_wait_for_next_slot") as sync_wait,
+        ):
+            await controller.acheck_or_wait()
+            await controller.acheck_or_wait()
+        return wait, sync_wait
+
+    wait, sync_wait = asyncio.run(run())
+    wait.assert_awaited_once()
+    sync_wait.assert_not_called()
+
+
+def test_tpm_limit_waits_after_usage_is_recorded():
+    controller = RPMController(max_tpm=600)
+
+    with patch.object(RPMController, "_wait_for_next_slot") as wait:
+        controller.check_or_wait()
+        controller.record_token_usage(900)
+        controller.check_or_wait()
+
+    wait.assert_called_once()
+    (delay,) = wait.call_args.args
+    assert 29 < delay <= 30
+
+
+def test_controllers_with_same_limit_key_share_limits():
+    first = RPMController(max_rpm=1, limit_key="test-shared-key")
+    second = RPMController(max_rpm=1, limit_key="test-shared-key")
+    other = RPMController(max_rpm=1, limit_key="test-other-key")
+
+    with patch.object(RPMController, "_wait_for_next_slot") as wait:
+        first.check_or_wait()
+        other.check_or_wait()
+        wait.assert_not_called()
+        second.check_or_wait()
+
+    wait.assert_called_once()
+
+
+def test_token_calc_handler_records_usage_on_controller():
+    controller = RPMController(max_tpm=1000)
+    handler = TokenCalcHandler(token_cost_process=None, rpm_controller=controller)
+
+    class Usage:
+        prompt_tokens = 10
+        completion_tokens = 5
+        total_tokens = 15
+        prompt_tokens_details = None
+
+    with patch.object(RPMController, "record_token_usage") as record:
+        handler.log_success_event({}, {"usage": Usage()}, 0, 0)
+
+    record.assert_not_called()  # no token process, nothing is tracked
+
+    from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+
+    handler = TokenCalcHandler(TokenProcess(), rpm_controller=controller)
+    with patch.object(RPMController, "record_token_usage") as record:
+        asyncio.run(handler.async_log_success_event({}, {"usage": Usage()}, 0, 0))
+
+    record.assert_called_once_with(15)